@@ -0,0 +1,82 @@
+"""
+Helpers shared by the benchmarks: headless initialization, fixed input
+and game states prepared for measuring.
+"""
+import os
+
+import pygame
+
+from config.Constants import Constants
+
+# Health given to the player so that no amount of damage ends the game
+INVULNERABLE_HEALTH = 10 ** 9
+
+
+def init_headless():
+    """
+    Initializes pygame with the SDL dummy video and audio drivers.
+
+    :return: The display surface.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    return pygame.display.set_mode((Constants.WIDTH, Constants.HEIGHT))
+
+
+def hold_input(keys=(), buttons=(False, False, False),
+               mouse_position=(Constants.WIDTH, Constants.HEIGHT / 2)):
+    """
+    Makes the game see the same input on every frame.
+
+    :param keys: Pressed keys, among InputManager.RECORDED_KEYS.
+    :param buttons: Pressed state of the left, middle and right buttons.
+    :param mouse_position: Mouse position.
+    """
+    from src.utils.InputManager import InputManager
+    key_mask = 0
+    for bit, key in enumerate(InputManager.RECORDED_KEYS):
+        if key in keys:
+            key_mask |= 1 << bit
+    button_mask = 0
+    for bit, pressed in enumerate(buttons):
+        if pressed:
+            button_mask |= 1 << bit
+    InputManager().feed(key_mask, button_mask, mouse_position)
+
+
+def release_input():
+    """
+    Gives the input back to pygame.
+    """
+    from src.utils.InputManager import InputManager
+    InputManager().stop_playback()
+
+
+def make_play(player_name="Cyborg", seed=0, terrain=None, quality="high",
+              spawning=True):
+    """
+    Creates a Play state whose player cannot die, so that it can be
+    updated for as long as needed.
+
+    :param player_name: Character to be played.
+    :param seed: Seed of the run.
+    :param terrain: Terrain layout (list of strings) or None for the one
+        picked by the seed.
+    :param quality: Quality tier to be pinned.
+    :param spawning: Whether new enemies keep spawning.
+    :return: The Play state.
+    """
+    from src.Game import Game
+    from src.entities.Terrain import Terrain
+    from src.states.Play import Play
+
+    game = Game(quality=quality, seed=seed)
+    state = Play(game, player_name).to_dict()
+    state["player"]["health"] = INVULNERABLE_HEALTH
+    if not spawning:
+        # The spawn timer never reaches the spawn interval
+        state["spawn_timer"] = float("-inf")
+    if terrain is not None:
+        state["terrain"] = Terrain(terrain).to_dict()
+    return Play.from_dict(state, game, player_name)
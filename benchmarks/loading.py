@@ -0,0 +1,233 @@
+"""
+Asset loading benchmark, run headless.
+
+Times loading every image of the AssetManifest, all of its sprites and
+every sound effect from their sources and from the baked assets and
+texture atlas (see tools.bake_assets), and the startup of the game up to its first Play state in fresh processes,
+with and without the baked assets.
+
+Results are written as JSON.
+
+Usage:
+    python -m benchmarks.loading [--baked DIRECTORY] [--runs N]
+        [--output FILE]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import pygame
+
+from benchmarks.common import init_headless
+from benchmarks.micro import environment
+from config.AssetManifest import AssetManifest
+from config.Constants import Constants
+
+# Run in a fresh process, so that imports and every cache start cold
+STARTUP = """
+import time
+start = time.perf_counter()
+import json, sys
+from benchmarks.common import init_headless
+init_headless()
+initialized = time.perf_counter()
+from src.utils.AssetLoader import AssetLoader
+AssetLoader().open(sys.argv[1] or None)
+from src.Game import Game
+from src.states.Play import Play
+imported = time.perf_counter()
+game = Game()
+menu = time.perf_counter()
+Play(game, sys.argv[2])
+play = time.perf_counter()
+print(json.dumps({"init_ms": (initialized - start) * 1000,
+                  "import_ms": (imported - initialized) * 1000,
+                  "menu_ms": (menu - imported) * 1000,
+                  "play_ms": (play - menu) * 1000,
+                  "total_ms": (play - start) * 1000}))
+"""
+
+
+def time_loads(load, rounds):
+    """
+    Times a loading callable.
+
+    :param load: Callable to be timed.
+    :param rounds: Number of calls.
+    :return: Median duration of a call in milliseconds.
+    """
+    durations = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        load()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def measure_images(directory, rounds):
+    """
+    Times loading each image of the manifest from its source and baked.
+
+    :param directory: Directory of the baked assets.
+    :param rounds: Number of loads per image.
+    :return: Dictionary mapping image keys to their load times.
+    """
+    from src.utils.AssetLoader import AssetLoader
+    loader = AssetLoader()
+    images = {}
+    for path, size, alpha in AssetManifest.IMAGES:
+        loader.open(None)
+        source = time_loads(lambda: loader.load_image(path, size, alpha),
+                            rounds)
+        loader.open(directory)
+        baked = time_loads(lambda: loader.load_image(path, size, alpha),
+                           rounds)
+        images[AssetLoader.image_key(path, size)] = {"source_ms": source,
+                                                     "baked_ms": baked}
+    return images
+
+
+def measure_sprites(directory, rounds):
+    """
+    Times loading every frame of the sprites of the manifest, each on its
+    own and cut out of the atlas.
+
+    :param directory: Directory of the atlas.
+    :param rounds: Number of loads of the sprites.
+    :return: Dictionary with the load times of all sprites.
+    """
+    from src.utils.TextureAtlas import TextureAtlas
+    atlas = TextureAtlas()
+
+    def load(origin):
+        atlas.open(origin)
+        for path, size, count, flipped in AssetManifest.SPRITES:
+            for variant in (False, True) if flipped else (False,):
+                atlas.frames(path, size, count, variant)
+
+    sprites = {"all sprites": {
+        "source_ms": time_loads(lambda: load(None), rounds),
+        "baked_ms": time_loads(lambda: load(directory), rounds),
+    }}
+    atlas.open(directory)
+    return sprites
+
+
+def measure_sounds(directory, rounds):
+    """
+    Times decoding each sound effect from its source and baked.
+
+    :param directory: Directory of the baked assets.
+    :param rounds: Number of loads per sound.
+    :return: Dictionary mapping sound files to their load times.
+    """
+    from src.utils.AssetLoader import AssetLoader
+    from src.utils.AudioManager import AudioManager
+    loader = AssetLoader()
+    loader.open(directory)
+    sounds = {}
+    for path in AudioManager().sound_files.values():
+        baked = loader.sound_path(path)
+        sounds[path] = {
+            "source_ms": time_loads(lambda: pygame.mixer.Sound(path),
+                                    rounds),
+            "baked_ms": time_loads(lambda: pygame.mixer.Sound(baked),
+                                   rounds),
+        }
+    return sounds
+
+
+def measure_startup(directories, player_name, runs):
+    """
+    Times the startup of the game in fresh processes. The processes of
+    each origin are interleaved so that drifts of the machine affect them
+    alike.
+
+    :param directories: Dictionary mapping origin names to directories of
+        baked assets; an empty one makes every asset load from its source.
+    :param player_name: Character of the first Play state.
+    :param runs: Number of processes of each origin.
+    :return: Dictionary mapping origin names to the median durations of
+        each startup phase.
+    """
+    results = {origin: [] for origin in directories}
+    for _ in range(runs):
+        for origin, directory in directories.items():
+            output = subprocess.run(
+                [sys.executable, "-c", STARTUP, directory, player_name],
+                capture_output=True, text=True, check=True).stdout
+            results[origin].append(
+                json.loads(output.strip().splitlines()[-1]))
+    return {origin: {phase: statistics.median(run[phase] for run in done)
+                     for phase in done[0]}
+            for origin, done in results.items()}
+
+
+def print_table(title, results):
+    """
+    Prints source and baked load times side by side.
+
+    :param title: Title of the first column.
+    :param results: Dictionary mapping names to their load times.
+    """
+    print(f"\n{title:<62} {'source':>9} {'baked':>9}")
+    for name, result in results.items():
+        print(f"{name[-62:]:<62} {result['source_ms']:>7.2f}ms "
+              f"{result['baked_ms']:>7.2f}ms")
+    source = sum(result["source_ms"] for result in results.values())
+    baked = sum(result["baked_ms"] for result in results.values())
+    print(f"{'total':<62} {source:>7.2f}ms {baked:>7.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.
+                                     RawDescriptionHelpFormatter)
+    parser.add_argument("--baked", default=Constants.BAKED_ASSETS_DIRECTORY,
+                        help="directory of the baked assets")
+    parser.add_argument("--rounds", type=int, default=5,
+                        help="loads of each asset")
+    parser.add_argument("--runs", type=int, default=5,
+                        help="startup processes of each kind")
+    parser.add_argument("--player", default="Cyborg",
+                        help="character of the first Play state")
+    parser.add_argument("--output", default=None,
+                        help="JSON file the results are written to")
+    args = parser.parse_args()
+
+    if not os.path.exists(os.path.join(args.baked,
+                                       Constants.BAKED_INDEX_FILE)):
+        sys.exit(f"No baked assets in {args.baked}; run "
+                 f"python -m tools.bake_assets first")
+
+    init_headless()
+    images = measure_images(args.baked, args.rounds)
+    print_table("image", images)
+    sprites = measure_sprites(args.baked, args.rounds)
+    print_table("sprite", sprites)
+    sounds = measure_sounds(args.baked, args.rounds)
+    print_table("sound", sounds)
+
+    startup = measure_startup({"source": "", "baked": args.baked},
+                              args.player, args.runs)
+    print(f"\n{'startup':<12} " + " ".join(
+        f"{phase[:-3]:>9}" for phase in startup["source"]))
+    for origin, phases in startup.items():
+        print(f"{origin:<12} " + " ".join(
+            f"{duration:>7.1f}ms" for duration in phases.values()))
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"environment": environment(), "images": images,
+                       "sprites": sprites, "sounds": sounds,
+                       "startup": startup}, file, indent=4)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""
+Memory benchmark of the projectiles and effects, run headless.
+
+Spawns many entities of each kind into an empty world and reports the
+bytes allocated per live entity, as traced by tracemalloc. Stress
+scenarios can also be run to report their peak traced memory. The
+decoded PCM bytes of each sound bank are reported as well.
+
+Results are written as JSON. Passing a saved result file to --compare
+flags the kinds whose bytes per entity grew beyond the threshold and
+exits with status 1 if there is any.
+
+Usage:
+    python -m benchmarks.memory [--count N] [--scenarios NAME ...]
+        [--output FILE] [--compare BASELINE] [--threshold FRACTION]
+"""
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+import pygame
+
+from benchmarks.common import init_headless, make_play, release_input
+from benchmarks.micro import environment
+from config.Constants import Constants
+
+KINDS = {}
+
+
+def kind(name):
+    """
+    Registers an entity kind. The decorated function receives the index
+    of the entity and the image shared by every entity, like the images
+    loaded once by the generators and abilities, and spawns one entity.
+
+    :param name: Name of the kind.
+    """
+
+    def register(spawn):
+        KINDS[name] = spawn
+        return spawn
+
+    return register
+
+
+def position(index):
+    """
+    Spreads the entities over the screen.
+
+    :param index: Index of the entity.
+    :return: Position of the entity.
+    """
+    return pygame.Vector2(index % Constants.WIDTH,
+                          index // Constants.WIDTH % Constants.HEIGHT)
+
+
+@kind("normal_projectile")
+def spawn_normal_projectile(index, image):
+    from src.ecs.Components import Components
+    from src.entities.projectiles.NormalProjectile import NormalProjectile
+    NormalProjectile.spawn(Components.ENEMY_PROJECTILE, position(index),
+                           pygame.Vector2(0, 100), image, 1)
+
+
+@kind("bomb")
+def spawn_bomb(index, image):
+    from src.ecs.Components import Components
+    from src.entities.projectiles.BombProjectile import BombProjectile
+    BombProjectile.spawn(Components.ENEMY_PROJECTILE, position(index),
+                         pygame.Vector2(0, 100), image, 1,
+                         Constants.TANK_BOMB_EXPLOSION_RADIUS)
+
+
+@kind("laser_segment")
+def spawn_laser_segment(index, image):
+    from src.ecs.Components import Components
+    from src.entities.projectiles.AbilityProjectile import ProjectileAbility
+    ProjectileAbility.spawn(Components.ABILITY, position(index), 0.5,
+                            pygame.Vector2(), image, 1,
+                            Constants.LASER_LIFETIME,
+                            components={Components.HIT_EFFECT: None})
+
+
+@kind("missile")
+def spawn_missile(index, image):
+    from src.ecs.Components import Components
+    from src.entities.projectiles.AbilityProjectile import ProjectileAbility
+    ProjectileAbility.spawn(Components.ABILITY, position(index), 0.5,
+                            pygame.Vector2(100, 0), image, 1,
+                            Constants.MISSILE_LIFETIME,
+                            components={Components.EXPLOSIVE: (30, 1)})
+
+
+@kind("explosion")
+def spawn_explosion(index, image):
+    from src.ecs.Components import Components
+    from src.entities.projectiles.AbilityProjectile import ProjectileAbility
+    from src.utils.ExplosionAtlas import ExplosionAtlas
+    frames = ExplosionAtlas().get_frames(30, Constants.COLOR_EXPLOSION)
+    ProjectileAbility.spawn(Components.ABILITY, position(index), 0,
+                            pygame.Vector2(), frames[0], 1,
+                            Constants.HIT_LIFETIME, animation=frames,
+                            components={Components.AREA_DAMAGE: 30})
+
+
+def measure_kind(spawn, count, image):
+    """
+    Measures the memory taken by live entities of one kind.
+
+    :param spawn: Function spawning one entity.
+    :param count: Number of entities.
+    :param image: Image shared by the entities.
+    :return: Dictionary with the total and per entity traced bytes.
+    """
+    from src.ecs.World import World
+    world = World()
+    world.clear()
+    # Caches filled by the first spawn are shared by every entity
+    spawn(0, image)
+    world.clear()
+    gc.collect()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for index in range(count):
+        spawn(index, image)
+    world.flush()
+    gc.collect()
+    total = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    world.clear()
+    return {"count": count, "bytes": total,
+            "bytes_per_entity": total / count}
+
+
+def measure_scenario(name, ticks, screen):
+    """
+    Runs a stress scenario while tracing its allocations.
+
+    :param name: Name of the scenario.
+    :param ticks: Number of ticks, or None for the scenario default.
+    :param screen: The screen surface to draw on.
+    :return: Dictionary with the peak traced bytes and live entities.
+    """
+    from benchmarks.scenarios import SCENARIOS
+    definition = SCENARIOS[name]
+    play = make_play(definition["player_name"],
+                     terrain=definition["terrain"])
+    gc.collect()
+    tracemalloc.start()
+    definition["setup"](play)
+    peak_entities = 0
+    for _ in range(ticks or int(definition["ticks"])):
+        play.update(1 / Constants.FPS)
+        play.draw(screen)
+        peak_entities = max(peak_entities,
+                            sum(play.entity_counts.values()))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    release_input()
+    return {"peak_bytes": peak, "peak_entities": peak_entities}
+
+
+def measure_sound_banks():
+    """
+    Loads every sound bank and measures the decoded bytes it holds and
+    the time it took to decode.
+
+    :return: Dictionary mapping bank names to their bytes and load time.
+    """
+    from src.utils.AudioManager import AudioManager
+    audio_manager = AudioManager()
+    banks = {}
+    for bank in Constants.SOUND_BANKS:
+        audio_manager.unload_bank(bank)
+        start = time.perf_counter()
+        audio_manager.load_bank(bank)
+        load_ms = (time.perf_counter() - start) * 1000
+        banks[bank] = {"bytes": audio_manager.bank_bytes[bank],
+                       "load_ms": load_ms}
+    audio_manager.unload_session_banks()
+    return banks
+
+
+def compare(results, baseline, threshold):
+    """
+    Prints the change of each kind against a baseline.
+
+    :param results: Results of this run.
+    :param baseline: Results of the baseline run.
+    :param threshold: Relative increase considered a regression.
+    :return: Names of the regressed kinds.
+    """
+    regressions = []
+    print(f"\n{'kind':<24} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, result in results.items():
+        current = result["bytes_per_entity"]
+        if name not in baseline:
+            print(f"{name:<24} {'-':>12} {current:>11.0f}B {'new':>8}")
+            continue
+        before = baseline[name]["bytes_per_entity"]
+        change = current / before - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "  improved"
+        print(f"{name:<24} {before:>11.0f}B {current:>11.0f}B "
+              f"{change:>+8.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.
+                                     RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=3000,
+                        help="live entities spawned of each kind")
+    parser.add_argument("--scenarios", nargs="*", default=[],
+                        metavar="NAME",
+                        help="stress scenarios whose peak memory is traced")
+    parser.add_argument("--ticks", type=int, default=None,
+                        help="ticks per scenario (default: its own)")
+    parser.add_argument("--output", default=None,
+                        help="JSON file the results are written to")
+    parser.add_argument("--compare", default=None, metavar="BASELINE",
+                        help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="increase flagged as a regression")
+    args = parser.parse_args()
+
+    screen = init_headless()
+    image = pygame.Surface((10, 10), pygame.SRCALPHA)
+    results = {}
+    for name, spawn in KINDS.items():
+        results[name] = measure_kind(spawn, args.count, image)
+        print(f"{name:<24} {results[name]['bytes_per_entity']:>8.0f} "
+              f"bytes per entity")
+
+    scenarios = {}
+    for name in args.scenarios:
+        scenarios[name] = measure_scenario(name, args.ticks, screen)
+        print(f"{name:<24} {scenarios[name]['peak_bytes'] / 2 ** 20:>8.2f}"
+              f" MiB peak, {scenarios[name]['peak_entities']} entities")
+
+    sound_banks = measure_sound_banks()
+    for name, bank in sound_banks.items():
+        print(f"{'sounds ' + name:<24} {bank['bytes'] / 2 ** 20:>8.2f}"
+              f" MiB decoded in {bank['load_ms']:.1f} ms")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"environment": environment(), "results": results,
+                       "scenarios": scenarios,
+                       "sound_banks": sound_banks}, file, indent=4)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,360 @@
+"""
+Micro-benchmarks of the entity hot paths, run headless.
+
+Results are written as JSON. Passing a saved result file to --compare
+flags the benchmarks whose median time grew beyond the threshold and
+exits with status 1 if there is any.
+
+Usage:
+    python -m benchmarks.micro [--output FILE] [--compare BASELINE]
+        [--threshold FRACTION] [--filter TEXT] [--rounds N]
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pygame
+
+from benchmarks.common import INVULNERABLE_HEALTH, hold_input, \
+    init_headless, make_play, release_input
+from config.Constants import Constants
+
+BENCHMARKS = []
+
+
+def benchmark(name, params=(None,)):
+    """
+    Registers a benchmark. The decorated function receives a parameter
+    and returns the callable to be timed.
+
+    :param name: Name of the benchmark.
+    :param params: Parameters the benchmark is run with.
+    """
+
+    def register(setup):
+        for param in params:
+            full_name = name if param is None else f"{name}[{param}]"
+            BENCHMARKS.append((full_name, setup, param))
+        return setup
+
+    return register
+
+
+def spread_projectiles(count, rect_to_avoid):
+    """
+    Spawns player projectiles spread over the screen, away from a rect.
+
+    :param count: Number of projectiles.
+    :param rect_to_avoid: Area no projectile may touch.
+    """
+    from src.ecs.Components import Components
+    from src.ecs.World import World
+    from src.entities.projectiles.NormalProjectile import NormalProjectile
+    image = pygame.Surface((10, 10), pygame.SRCALPHA)
+    rng = np.random.default_rng(0)
+    spawned = 0
+    while spawned < count:
+        position = pygame.Vector2(rng.uniform(0, Constants.WIDTH),
+                                  rng.uniform(0, Constants.HEIGHT))
+        rect = image.get_rect(center=position)
+        if not rect.inflate(20, 20).colliderect(rect_to_avoid):
+            NormalProjectile.spawn(Components.PLAYER_PROJECTILE, position,
+                                   (0, 0), image, 1)
+            spawned += 1
+    World().flush()
+
+
+def make_player(player_name):
+    """
+    Creates a player standing in the middle of the screen.
+
+    :param player_name: Character to be created.
+    :return: The player.
+    """
+    from src.entities.players.PlayerClassMap import PlayerClassMap
+    player = PlayerClassMap[player_name]()
+    player.update_weapon()
+    return player
+
+
+@benchmark("compute_shot_angle")
+def bench_compute_shot_angle(_):
+    from src.entities.projectiles.ProjectileGenerator import \
+        ProjectileGenerator
+    origin = pygame.Vector2(640, 360)
+    target = pygame.Vector2(900, 120)
+    return lambda: ProjectileGenerator.compute_shot_angle(origin, target)
+
+
+@benchmark("terrain_init")
+def bench_terrain_init(_):
+    from config.AvailableTerrains import AvailableTerrains
+    from src.entities.Terrain import Terrain
+    layout = AvailableTerrains().terrains[0]
+    return lambda: Terrain(layout)
+
+
+@benchmark("laser_beam_generate")
+def bench_laser_beam_generate(_):
+    from src.ecs.Components import Components
+    from src.ecs.World import World
+    from src.entities.abilities.LaserBeam import LaserBeam
+    laser = LaserBeam(make_player("Cyborg"))
+    world = World()
+    target = pygame.Vector2(Constants.WIDTH, Constants.HEIGHT / 3)
+
+    def run():
+        laser.generate(target, 1 / Constants.FPS, Components.ABILITY)
+        world.clear()
+
+    return run
+
+
+@benchmark("missile_barrage_generate")
+def bench_missile_barrage_generate(_):
+    from src.ecs.Components import Components
+    from src.ecs.World import World
+    from src.entities.abilities.MissileBarrage import MissileBarrage
+    barrage = MissileBarrage(make_player("Jones"))
+    world = World()
+    target = pygame.Vector2(Constants.WIDTH, Constants.HEIGHT / 3)
+
+    def run():
+        barrage.generate(target, 1 / Constants.FPS, Components.ABILITY)
+        world.clear()
+
+    return run
+
+
+@benchmark("damage_system", params=(10, 100, 1000))
+def bench_damage_system(count):
+    from src.ecs.DamageSystem import DamageSystem
+    from src.ecs.World import World
+    from src.entities.enemies.LinearEnemy import LinearEnemy
+    World().clear()
+    enemy = LinearEnemy(Constants.WIDTH / 2, Constants.HEIGHT / 2)
+    spread_projectiles(count, enemy.rect)
+    damage_system = DamageSystem()
+    return lambda: damage_system.update(None)
+
+
+@benchmark("damage_resolve", params=(10, 100, 1000))
+def bench_damage_resolve(count):
+    from src.ecs.DamageSystem import DamageSystem
+    from src.ecs.HitBuffer import HitBuffer
+    from src.ecs.Hits import Hits
+    from src.ecs.World import World
+    from src.entities.enemies.LinearEnemy import LinearEnemy
+    World().clear()
+    enemies = [LinearEnemy(x, Constants.HEIGHT / 2)
+               for x in np.linspace(0, Constants.WIDTH, 50)]
+    World().flush()
+    for enemy in enemies:
+        enemy._health_points = float("inf")
+    targets = np.resize([enemy._entity for enemy in enemies], count)
+    damage = np.ones(count)
+    hits = HitBuffer()
+    hits.clear()
+    damage_system = DamageSystem()
+
+    def run():
+        hits.extend(targets, damage, Hits.PROJECTILE)
+        damage_system.resolve(None)
+
+    return run
+
+
+@benchmark("player_update_weapon")
+def bench_player_update_weapon(_):
+    player = make_player("Cyborg")
+    hold_input(mouse_position=(900, 200))
+    return player.update_weapon
+
+
+@benchmark("hud_draw")
+def bench_hud_draw(_):
+    from src.ui.Hud import Hud
+    hud = Hud(make_player("Cyborg"))
+    screen = pygame.display.get_surface()
+    return lambda: hud.draw(screen)
+
+
+def populated_play(enemies):
+    """
+    Creates a Play state with enemies spread over the screen and the player
+    shooting. No enemy spawns and the shots cannot kill the enemies, so the
+    state keeps the same number of enemies however long it is updated.
+
+    :param enemies: Number of enemies.
+    :return: The Play state.
+    """
+    from src.entities.enemies.LinearEnemy import LinearEnemy
+    from src.entities.enemies.WavyEnemy import WavyEnemy
+    play = make_play("Cyborg", spawning=False)
+    rng = np.random.default_rng(0)
+    enemy_classes = (LinearEnemy, WavyEnemy)
+    spread = [enemy_classes[i % 2](rng.uniform(0, Constants.WIDTH),
+                                   rng.uniform(100, Constants.HEIGHT / 2))
+              for i in range(enemies)]
+    for enemy in spread:
+        enemy._health_points = INVULNERABLE_HEALTH
+    play.add_enemies(spread)
+    hold_input(buttons=(True, False, False))
+    return play
+
+
+@benchmark("play_update", params=(0, 10, 50))
+def bench_play_update(enemies):
+    play = populated_play(enemies)
+    return lambda: play.update(1 / Constants.FPS)
+
+
+@benchmark("play_draw", params=(0, 10, 50))
+def bench_play_draw(enemies):
+    play = populated_play(enemies)
+    for _ in range(30):
+        play.update(1 / Constants.FPS)
+    screen = pygame.display.get_surface()
+    return lambda: play.draw(screen)
+
+
+def time_benchmark(run, rounds, min_round_time):
+    """
+    Times a callable. The number of calls per round is calibrated so that
+    each round lasts at least min_round_time.
+
+    :param run: Callable to be timed.
+    :param rounds: Number of rounds.
+    :param min_round_time: Minimum duration of a round in seconds.
+    :return: Dictionary with the timing statistics in microseconds.
+    """
+    run()
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_round_time:
+            break
+        number *= 2
+
+    per_call = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        per_call.append((time.perf_counter() - start) / number * 1e6)
+    return {
+        "median_us": statistics.median(per_call),
+        "min_us": min(per_call),
+        "mean_us": statistics.fmean(per_call),
+        "stdev_us": statistics.stdev(per_call) if rounds > 1 else 0.0,
+        "rounds": rounds,
+        "number": number,
+    }
+
+
+def environment():
+    """
+    Describes where the benchmarks ran.
+
+    :return: Dictionary with versions, platform and commit.
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "commit": commit,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Prints the change of each benchmark against a baseline.
+
+    :param results: Results of this run.
+    :param baseline: Results of the baseline run.
+    :param threshold: Relative median increase considered a regression.
+    :return: Names of the regressed benchmarks.
+    """
+    regressions = []
+    print(f"\n{'benchmark':<34} {'baseline':>12} {'current':>12} "
+          f"{'change':>8}")
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:<34} {'-':>12} {result['median_us']:>10.1f}us "
+                  f"{'new':>8}")
+            continue
+        before = baseline[name]["median_us"]
+        change = result["median_us"] / before - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "  improved"
+        print(f"{name:<34} {before:>10.1f}us {result['median_us']:>10.1f}us "
+              f"{change:>+8.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.
+                                     RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default=None,
+                        help="JSON file the results are written to")
+    parser.add_argument("--compare", default=None, metavar="BASELINE",
+                        help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="median increase flagged as a regression")
+    parser.add_argument("--filter", default=None,
+                        help="only run benchmarks whose name contains it")
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--min-round-time", type=float, default=0.05,
+                        help="minimum duration of a round in seconds")
+    args = parser.parse_args()
+
+    init_headless()
+    results = {}
+    for name, setup, param in BENCHMARKS:
+        if args.filter and args.filter not in name:
+            continue
+        run = setup(param)
+        results[name] = time_benchmark(run, args.rounds,
+                                       args.min_round_time)
+        release_input()
+        print(f"{name:<34} {results[name]['median_us']:>10.1f}us "
+              f"(min {results[name]['min_us']:.1f}us, "
+              f"{results[name]['rounds']}x{results[name]['number']})")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"environment": environment(), "results": results},
+                      file, indent=4)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+Replays a recorded run under a profiler and writes per-frame timings
+tagged with what happened in each frame.
+
+Outputs, in the output directory:
+    frames.csv             time of every frame with entity counts and events
+    profile.pstats         cProfile statistics (--profiler cprofile)
+    profile.collapsed      collapsed stacks for flamegraph tools and
+    profile.speedscope.json  a speedscope profile (--profiler sampling)
+
+Usage:
+    python -m benchmarks.profile_replay REPLAY [--profiler cprofile|sampling]
+        [--output DIR] [--start FRAME] [--frames N] [--interval MS]
+"""
+import argparse
+import cProfile
+import csv
+import json
+import os
+import time
+from collections import Counter
+
+import numpy as np
+import pygame
+
+from benchmarks.sampling_profiler import SamplingProfiler
+from config.Constants import Constants
+from src.utils.AudioManager import AudioManager
+from src.utils.ParticleSystem import ParticleSystem
+from src.utils.Replay import Replay
+
+ENTITY_GROUPS = ("enemies", "player_projectiles", "enemies_projectiles",
+                 "abilities")
+
+
+def count_events(counts):
+    """
+    Subscribes to the gameplay events of the running Play state.
+
+    :param counts: Counter of the events published, by type name.
+    """
+    from src.utils.EventBus import EventBus
+    from src.utils.Events import Events
+    for event_type in (Events.Killed, Events.Damaged, Events.Fired,
+                       Events.Landed, Events.Exploded):
+        EventBus().subscribe(event_type, lambda events: counts.update(
+            type(event).__name__.lower() for event in events))
+
+
+def frame_events(replay, index, play, ability_ready, counts_before,
+                 published):
+    """
+    Describes what happened in a frame.
+
+    :param replay: The replay being played.
+    :param index: Index of the frame.
+    :param play: The Play state after the frame.
+    :param ability_ready: Whether the ability was ready before the frame.
+    :param counts_before: Entity counts before the frame.
+    :param published: Counter of the gameplay events of the frame.
+    :return: List of event names.
+    """
+    events = []
+    button_mask = replay.frame(index)[1]
+    player = play.player
+    if player is not None and ability_ready and button_mask & 0b100:
+        events.append(type(player.ability).__name__)
+    if play.entity_counts["enemies"] > counts_before["enemies"]:
+        events.append("enemy_spawned")
+    events.extend(f"{name}:{count}" for name, count in published.items())
+    return events
+
+
+def play_frames(playback, screen, replay, frames, profiler):
+    """
+    Plays the replay, timing and tagging every frame.
+
+    :param playback: The ReplayPlayback state.
+    :param screen: The screen surface to draw on.
+    :param replay: The replay being played.
+    :param frames: Maximum number of frames, or None for all of them.
+    :param profiler: SamplingProfiler to be labelled with the frame index
+        (optional).
+    :return: List of per-frame records.
+    """
+    particles = ParticleSystem()
+    audio_manager = AudioManager()
+    published = Counter()
+    subscribed = None
+    records = []
+    dt = 1 / Constants.FPS
+    while playback.is_running and (frames is None or len(records) < frames):
+        index = playback.frame
+        play = playback.play
+        # Each Play state starts with a new set of subscribers
+        if play is not subscribed:
+            count_events(published)
+            subscribed = play
+        published.clear()
+        player = play.player
+        ability_ready = player is not None and player.get_ready_ability
+        counts_before = play.entity_counts
+        if profiler is not None:
+            profiler.label = index
+
+        start = time.perf_counter()
+        playback.update(dt)
+        audio_manager.update()
+        if playback.frame == index:
+            break
+        updated = time.perf_counter()
+        playback.draw(screen)
+        pygame.display.flip()
+        drawn = time.perf_counter()
+
+        counts = play.entity_counts
+        record = {
+            "frame": index,
+            "update_ms": (updated - start) * 1000,
+            "draw_ms": (drawn - updated) * 1000,
+            "total_ms": (drawn - start) * 1000,
+        }
+        record.update({group: counts[group] for group in ENTITY_GROUPS})
+        record["particles"] = len(particles)
+        record["events"] = " ".join(frame_events(replay, index, play,
+                                                 ability_ready,
+                                                 counts_before, published))
+        records.append(record)
+    return records
+
+
+def write_frames(records, file_name):
+    """
+    Writes the per-frame records to a CSV file.
+
+    :param records: List of per-frame records.
+    :param file_name: Path of the CSV file.
+    """
+    with open(file_name, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(records[0]))
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def print_summary(records, profiler, slow_fraction=0.05):
+    """
+    Prints frame time statistics, the slowest frames and, when sampled,
+    the functions the slowest frames spent their time in.
+
+    :param records: List of per-frame records.
+    :param profiler: SamplingProfiler used for the run (optional).
+    :param slow_fraction: Fraction of the frames considered slow.
+    """
+    times = np.array([record["total_ms"] for record in records])
+    print(f"{len(records)} frames: mean {times.mean():.2f} ms, "
+          f"p95 {np.percentile(times, 95):.2f} ms, "
+          f"p99 {np.percentile(times, 99):.2f} ms, "
+          f"max {times.max():.2f} ms")
+    voices = AudioManager().voice_manager.counters
+    print("voices: " + ", ".join(f"{name} {count}"
+                                 for name, count in voices.items()))
+
+    slowest = sorted(records, key=lambda record: record["total_ms"],
+                     reverse=True)
+    print("slowest frames:")
+    for record in slowest[:10]:
+        counts = ", ".join(f"{group} {record[group]}"
+                           for group in ENTITY_GROUPS + ("particles",))
+        print(f"  {record['frame']:>6} {record['total_ms']:7.2f} ms  "
+              f"{counts}  {record['events']}")
+
+    if profiler is None or not profiler.samples:
+        return
+    slow_frames = {record["frame"] for record in
+                   slowest[:max(1, int(len(records) * slow_fraction))]}
+    functions = Counter()
+    for label, stack in profiler.samples:
+        if label in slow_frames:
+            for entry in set(stack):
+                functions[entry] += 1
+    total = sum(1 for label, _ in profiler.samples if label in slow_frames)
+    print(f"functions in the slowest {slow_fraction:.0%} of the frames "
+          f"({total} samples):")
+    for (name, file, line), count in functions.most_common(15):
+        print(f"  {count / total:6.1%}  {name} ({file}:{line})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.
+                                     RawDescriptionHelpFormatter)
+    parser.add_argument("replay")
+    parser.add_argument("--profiler", choices=("cprofile", "sampling"),
+                        default="sampling")
+    parser.add_argument("--output", default=None,
+                        help="output directory (default: profiles/<replay>)")
+    parser.add_argument("--start", type=int, default=0, metavar="FRAME")
+    parser.add_argument("--frames", type=int, default=None)
+    parser.add_argument("--interval", type=float, default=1.0,
+                        help="sampling interval in milliseconds")
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from src.Game import Game
+    from src.states.ReplayPlayback import ReplayPlayback
+
+    replay = Replay.load(args.replay)
+    output = args.output or os.path.join(
+        "profiles", os.path.splitext(os.path.basename(args.replay))[0])
+    os.makedirs(output, exist_ok=True)
+
+    game = Game()
+    screen = pygame.display.get_surface()
+    playback = ReplayPlayback(game, replay, args.start)
+
+    if args.profiler == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        records = play_frames(playback, screen, replay, args.frames, None)
+        profiler.disable()
+        profiler.dump_stats(os.path.join(output, "profile.pstats"))
+        sampler = None
+    else:
+        sampler = SamplingProfiler(args.interval / 1000)
+        sampler.start()
+        records = play_frames(playback, screen, replay, args.frames, sampler)
+        sampler.stop()
+        with open(os.path.join(output, "profile.collapsed"), "w") as file:
+            file.write(sampler.collapsed())
+        with open(os.path.join(output, "profile.speedscope.json"),
+                  "w") as file:
+            json.dump(sampler.speedscope(os.path.basename(args.replay)),
+                      file)
+
+    if not records:
+        print("the replay has no frames to play")
+        return
+    write_frames(records, os.path.join(output, "frames.csv"))
+    print_summary(records, sampler)
+    print(f"results written to {output}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
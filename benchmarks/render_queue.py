@@ -0,0 +1,94 @@
+"""
+Compares drawing projectiles one by one against submitting them through
+the render queue.
+
+Usage:
+    python -m benchmarks.render_queue [--projectiles N] [--frames N]
+                                      [--seed N]
+"""
+import argparse
+import os
+import random
+import time
+
+import pygame
+
+from config.Constants import Constants, Layers
+from src.utils.RenderQueue import RenderQueue
+
+
+def build_projectiles(count, rng):
+    """
+    Creates the sprites of projectiles spread over the screen.
+
+    :param count: Number of projectiles.
+    :param rng: Random number generator used to place the projectiles.
+    :return: List of (image, rect) pairs.
+    """
+    image = pygame.image.load(
+        "assets/sprites/projectiles/AssaultRifleProjectile.png").convert_alpha()
+    image = pygame.transform.scale(image, (10, 10))
+    projectiles = []
+    for _ in range(count):
+        position = (rng.uniform(0, Constants.WIDTH),
+                    rng.uniform(0, Constants.HEIGHT))
+        projectiles.append((image, image.get_rect(center=position)))
+    return projectiles
+
+
+def time_frames(draw, screen, frames):
+    """
+    Measures the mean time of a drawing function.
+
+    :param draw: Function that draws one frame.
+    :param screen: The screen surface to draw on.
+    :param frames: Number of frames to be measured.
+    :return: Mean time per frame in milliseconds.
+    """
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw(screen)
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--projectiles", type=int, default=2000)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    screen = pygame.display.set_mode((Constants.WIDTH, Constants.HEIGHT))
+    rng = random.Random(args.seed)
+    player_projectiles = build_projectiles(args.projectiles // 2, rng)
+    enemies_projectiles = build_projectiles(
+        args.projectiles - args.projectiles // 2, rng)
+    queue = RenderQueue()
+
+    def draw_loop(target):
+        for image, rect in player_projectiles:
+            target.blit(image, rect)
+        for image, rect in enemies_projectiles:
+            target.blit(image, rect)
+
+    def draw_queue(target):
+        queue.add_items(player_projectiles, Layers.PLAYER_PROJECTILES)
+        queue.add_items(enemies_projectiles, Layers.ENEMIES_PROJECTILES)
+        queue.flush(target)
+
+    loop_time = time_frames(draw_loop, screen, args.frames)
+    queue_time = time_frames(draw_queue, screen, args.frames)
+
+    print(f"{args.projectiles} projectiles, {args.frames} frames")
+    print(f"per-projectile draw: {loop_time:.3f} ms/frame")
+    print(f"render queue:        {queue_time:.3f} ms/frame")
+    print(f"speedup:             {loop_time / queue_time:.2f}x")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
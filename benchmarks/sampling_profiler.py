@@ -0,0 +1,117 @@
+"""
+Statistical profiler that periodically samples the call stack of the main
+thread. Each sample is tagged with a caller-defined label (for example the
+frame being played), so slow frames can be traced to the code they ran.
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+
+class SamplingProfiler:
+    """
+    Samples the stack of the thread that started it from a background
+    thread.
+    """
+
+    def __init__(self, interval=0.001):
+        """
+        Initializes the profiler.
+
+        :param interval: Time between samples in seconds.
+        """
+        self.__interval = interval
+        self.__thread_id = None
+        self.__sampler = None
+        self.__running = False
+        self.__switch_interval = None
+        self.samples = []
+        self.label = None
+
+    def start(self):
+        """
+        Starts sampling the calling thread.
+        """
+        self.__thread_id = threading.get_ident()
+        self.__running = True
+        # The sampler needs the GIL more often than the default 5 ms
+        self.__switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(self.__interval / 2)
+        self.__sampler = threading.Thread(target=self.__sample_loop,
+                                          daemon=True)
+        self.__sampler.start()
+
+    def stop(self):
+        """
+        Stops sampling.
+        """
+        self.__running = False
+        self.__sampler.join()
+        sys.setswitchinterval(self.__switch_interval)
+
+    def __sample_loop(self):
+        """
+        Records the stack of the sampled thread until stopped.
+        """
+        while self.__running:
+            frame = sys._current_frames().get(self.__thread_id)
+            if frame is not None:
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append((code.co_name,
+                                  os.path.relpath(code.co_filename),
+                                  code.co_firstlineno))
+                    frame = frame.f_back
+                stack.reverse()
+                self.samples.append((self.label, tuple(stack)))
+            time.sleep(self.__interval)
+
+    def collapsed(self):
+        """
+        Returns the samples in the collapsed stack format used by
+        flamegraph tools: one line per distinct stack with its count.
+
+        :return: Text in collapsed stack format.
+        """
+        counts = Counter(";".join(f"{name} ({file}:{line})"
+                                  for name, file, line in stack)
+                         for _, stack in self.samples)
+        return "".join(f"{stack} {count}\n"
+                       for stack, count in counts.most_common())
+
+    def speedscope(self, name):
+        """
+        Returns the samples as a speedscope sampled profile.
+
+        :param name: Name of the profile.
+        :return: Dictionary in the speedscope file format.
+        """
+        frames = []
+        frame_indices = {}
+        samples = []
+        for _, stack in self.samples:
+            indices = []
+            for entry in stack:
+                if entry not in frame_indices:
+                    frame_indices[entry] = len(frames)
+                    frames.append({"name": entry[0], "file": entry[1],
+                                   "line": entry[2]})
+                indices.append(frame_indices[entry])
+            samples.append(indices)
+        interval = self.__interval * 1000
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": len(samples) * interval,
+                "samples": samples,
+                "weights": [interval] * len(samples),
+            }],
+        }
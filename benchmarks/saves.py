@@ -0,0 +1,161 @@
+"""
+Save game benchmark, run headless.
+
+Saves a Play state with a given number of enemies in the text format of
+earlier versions (indented JSON, with the terrain as a list of blocks)
+and in the binary format (see SaveGame), and reports the file size, the
+time to write the state dictionary to a save, the time to read it back
+into a dictionary and the time to restore the Play state from that
+dictionary. Both formats are restored through the current
+Play.from_dict, so the restore time of the text format is that of a
+legacy save loaded today, not that of earlier versions.
+
+Results are written as JSON.
+
+Usage:
+    python -m benchmarks.saves [--enemies N] [--rounds N] [--output FILE]
+"""
+import argparse
+import json
+import os
+import tempfile
+
+import pygame
+
+from benchmarks.common import init_headless
+from benchmarks.loading import time_loads
+from benchmarks.micro import environment
+
+
+def make_state(player_name, enemies):
+    """
+    Creates a Play state with enemies of every type spread over the
+    screen.
+
+    :param player_name: Character of the state.
+    :param enemies: Number of enemies.
+    :return: The game and the dictionary of the Play state.
+    """
+    from config.Constants import Constants
+    from src.Game import Game
+    from src.entities.enemies.EnemyClassMap import EnemyClassMap
+    from src.states.Play import Play
+    game = Game(quality="high", seed=0)
+    state = Play(game, player_name).to_dict()
+    enemy_classes = list(EnemyClassMap.values())
+    state["enemies"] = [
+        enemy_classes[index % len(enemy_classes)](
+            (index * 97) % Constants.WIDTH,
+            Constants.HEIGHT / 3).to_dict()
+        for index in range(enemies)]
+    return game, Play.from_dict(state, game, player_name).to_dict()
+
+
+def legacy_state(state):
+    """
+    Converts a state to the dictionary saved by earlier versions, which
+    stored the terrain as the position and size of each of its blocks.
+
+    :param state: Dictionary of the state, from Play.to_dict.
+    :return: Dictionary of the state with a block list terrain.
+    """
+    from src.entities.Terrain import Terrain
+    terrain = Terrain.from_dict(state["terrain"])
+    blocks = [{"topleft": list(block.rect.topleft),
+               "width": block.image.get_width(),
+               "height": block.image.get_height()}
+              for block in terrain.sprites()]
+    return dict(state, terrain={"blocks": blocks})
+
+
+def write_json(state, file_name):
+    """
+    Writes a state in the text format of earlier versions.
+
+    :param state: Dictionary of the state.
+    :param file_name: Path of the save.
+    """
+    with open(file_name, "w") as file:
+        json.dump(state, file, indent=4)
+
+
+def read_json(file_name):
+    """
+    Reads a state in the text format of earlier versions.
+
+    :param file_name: Path of the save.
+    :return: Dictionary of the state.
+    """
+    with open(file_name) as file:
+        return json.load(file)
+
+
+def measure_format(game, state, write, read, file_name, rounds):
+    """
+    Times writing, reading and restoring a save in one format.
+
+    :param game: The game instance.
+    :param state: Dictionary of the Play state to be saved.
+    :param write: Callable writing a state dictionary to a file.
+    :param read: Callable reading a state dictionary from a file.
+    :param file_name: Path of the save.
+    :param rounds: Number of runs of each step.
+    :return: Dictionary with the size and the median times.
+    """
+    from src.states.Play import Play
+    save_ms = time_loads(lambda: write(state, file_name), rounds)
+    load_ms = time_loads(lambda: read(file_name), rounds)
+    loaded = read(file_name)
+    restore_ms = time_loads(
+        lambda: Play.from_dict(loaded, game, state["player"]["type"]),
+        rounds)
+    return {"bytes": os.path.getsize(file_name), "save_ms": save_ms,
+            "load_ms": load_ms, "restore_ms": restore_ms}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.
+                                     RawDescriptionHelpFormatter)
+    parser.add_argument("--player", default="Cyborg",
+                        help="character of the saved state")
+    parser.add_argument("--enemies", type=int, default=20,
+                        help="enemies in the saved state")
+    parser.add_argument("--rounds", type=int, default=21,
+                        help="runs of each step")
+    parser.add_argument("--output", default=None,
+                        help="JSON file the results are written to")
+    args = parser.parse_args()
+
+    init_headless()
+    from src.utils.SaveGame import SaveGame
+    game, state = make_state(args.player, args.enemies)
+    with tempfile.TemporaryDirectory() as directory:
+        formats = {
+            "json": measure_format(game, legacy_state(state), write_json,
+                                   read_json,
+                                   os.path.join(directory, "save.json"),
+                                   args.rounds),
+            "binary": measure_format(game, state, SaveGame.save,
+                                     SaveGame.load,
+                                     os.path.join(directory, "save.sav"),
+                                     args.rounds),
+        }
+
+    print(f"{'format':<8} {'size':>10} {'save':>10} {'load':>10} "
+          f"{'restore':>10}")
+    for name, result in formats.items():
+        print(f"{name:<8} {result['bytes']:>9}B {result['save_ms']:>8.2f}ms "
+              f"{result['load_ms']:>8.2f}ms {result['restore_ms']:>8.2f}ms")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"environment": environment(),
+                       "enemies": args.enemies, "formats": formats},
+                      file, indent=4)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+Scripted stress scenarios that drive Play into known heavy states. Each
+one runs headless for a fixed number of ticks and reports the update, draw
+and total frame time percentiles.
+
+Usage:
+    python -m benchmarks.scenarios [NAME ...] [--ticks N] [--output FILE]
+        [--list]
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+import pygame
+
+from benchmarks.common import hold_input, init_headless, make_play, \
+    release_input
+from config.AvailableTerrains import AvailableTerrains
+from config.Constants import Constants
+
+SCENARIOS = {}
+PERCENTILES = (50, 95, 99)
+
+
+def scenario(name, player_name, ticks, description, terrain=None):
+    """
+    Registers a scenario. The decorated function receives the Play state
+    and prepares it; the input it holds stays pressed for the whole run.
+
+    :param name: Name of the scenario.
+    :param player_name: Character played in the scenario.
+    :param ticks: Default number of ticks the scenario runs for.
+    :param description: Short description of the load.
+    :param terrain: Terrain layout, or None for the one picked by the seed.
+    """
+
+    def register(setup):
+        SCENARIOS[name] = {"setup": setup, "player_name": player_name,
+                           "ticks": ticks, "description": description,
+                           "terrain": terrain}
+        return setup
+
+    return register
+
+
+def spread_enemies(count, enemy_class, area, seed=0):
+    """
+    Creates enemies at random positions inside an area.
+
+    :param count: Number of enemies.
+    :param enemy_class: Class of the enemies.
+    :param area: Rect the enemies are placed in.
+    :param seed: Seed of the positions.
+    :return: List of enemies.
+    """
+    rng = np.random.default_rng(seed)
+    return [enemy_class(rng.uniform(area.left, area.right),
+                        rng.uniform(area.top, area.bottom))
+            for _ in range(count)]
+
+
+@scenario("laser_50_enemies", "Cyborg", Constants.LASER_DURATION * 60,
+          "50 enemies while Cyborg holds the laser beam")
+def laser_50_enemies(play):
+    from src.entities.enemies.LinearEnemy import LinearEnemy
+    from src.entities.enemies.WavyEnemy import WavyEnemy
+    area = pygame.Rect(0, 50, Constants.WIDTH, Constants.HEIGHT / 2)
+    play.add_enemies(spread_enemies(25, LinearEnemy, area))
+    play.add_enemies(spread_enemies(25, WavyEnemy, area, 1))
+    hold_input(buttons=(False, False, True),
+               mouse_position=(Constants.WIDTH, Constants.HEIGHT / 4))
+
+
+@scenario("barrage_packed_field", "Jones", 180,
+          "Jones fires a missile barrage into 50 packed enemies")
+def barrage_packed_field(play):
+    from src.entities.enemies.LinearEnemy import LinearEnemy
+    area = pygame.Rect(Constants.WIDTH * 0.6, 100, 300, 200)
+    play.add_enemies(spread_enemies(50, LinearEnemy, area))
+    hold_input(buttons=(False, False, True), mouse_position=area.center)
+
+
+@scenario("tanks_bombing_20", "Cyborg", 300,
+          "20 tank enemies dropping their bombs at once")
+def tanks_bombing_20(play):
+    from src.entities.enemies.TankEnemy import TankEnemy
+    play.add_enemies([
+        TankEnemy(x, Constants.TANK_ENEMY_Y)
+        for x in np.linspace(100, Constants.WIDTH - 100, 20)])
+
+
+@scenario("enemy_projectiles_3000", "Cyborg", 120,
+          "3,000 enemy projectiles on screen")
+def enemy_projectiles_3000(play):
+    from src.ecs.Components import Components
+    from src.entities.projectiles.NormalProjectile import NormalProjectile
+    image = pygame.image.load(
+        "assets/sprites/projectiles/WavyEnemyProjectile.png").convert_alpha()
+    image = pygame.transform.scale(image, (
+        Constants.WAVY_ENEMY_PROJECTILE_WIDTH,
+        Constants.WAVY_ENEMY_PROJECTILE_HEIGHT))
+    rng = np.random.default_rng(0)
+    for _ in range(3000):
+        position = pygame.Vector2(rng.uniform(0, Constants.WIDTH),
+                                  rng.uniform(0, Constants.HEIGHT / 2))
+        velocity = pygame.Vector2(rng.uniform(-20, 20), rng.uniform(0, 20))
+        NormalProjectile.spawn(Components.ENEMY_PROJECTILE, position,
+                               velocity, image, 1)
+
+
+def register_terrain_scenarios():
+    """
+    Registers one scenario per available terrain, with the usual enemy
+    spawning and the player shooting.
+    """
+    for index, layout in enumerate(AvailableTerrains().terrains):
+        scenario(f"terrain_{index}", "Cyborg", 300,
+                 f"regular play on terrain {index}", layout)(
+            lambda play: hold_input(buttons=(True, False, False)))
+
+
+register_terrain_scenarios()
+
+
+def run_scenario(name, ticks, screen):
+    """
+    Runs a scenario and times each tick.
+
+    :param name: Name of the scenario.
+    :param ticks: Number of ticks, or None for the scenario default.
+    :param screen: The screen surface to draw on.
+    :return: Dictionary with the percentiles and the peak entity counts.
+    """
+    definition = SCENARIOS[name]
+    play = make_play(definition["player_name"],
+                     terrain=definition["terrain"])
+    definition["setup"](play)
+    ticks = ticks or int(definition["ticks"])
+
+    update_times = []
+    draw_times = []
+    peak_counts = {}
+    for _ in range(ticks):
+        start = time.perf_counter()
+        play.update(1 / Constants.FPS)
+        updated = time.perf_counter()
+        play.draw(screen)
+        pygame.display.flip()
+        drawn = time.perf_counter()
+        update_times.append((updated - start) * 1000)
+        draw_times.append((drawn - updated) * 1000)
+        for group, count in play.entity_counts.items():
+            peak_counts[group] = max(peak_counts.get(group, 0), count)
+    release_input()
+
+    update_times = np.array(update_times)
+    draw_times = np.array(draw_times)
+    result = {"ticks": ticks, "peak_counts": peak_counts}
+    for label, times in (("update", update_times), ("draw", draw_times),
+                         ("total", update_times + draw_times)):
+        result[label] = {f"p{p}": float(np.percentile(times, p))
+                         for p in PERCENTILES}
+        result[label]["max"] = float(times.max())
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.
+                                     RawDescriptionHelpFormatter)
+    parser.add_argument("names", nargs="*",
+                        help="scenarios to run (default: all)")
+    parser.add_argument("--ticks", type=int, default=None,
+                        help="ticks per scenario (default: its own)")
+    parser.add_argument("--output", default=None,
+                        help="JSON file the results are written to")
+    parser.add_argument("--list", action="store_true",
+                        help="list the scenarios and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, definition in SCENARIOS.items():
+            print(f"{name:<24} {definition['description']}")
+        return
+    unknown = [name for name in args.names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+
+    screen = init_headless()
+    results = {}
+    header = "  ".join(f"{label:>7}" for label in
+                       [f"p{p}" for p in PERCENTILES] + ["max"])
+    print(f"{'scenario':<24} {'':<7} {header}  (ms)")
+    for name in args.names or SCENARIOS:
+        results[name] = run_scenario(name, args.ticks, screen)
+        for label in ("update", "draw", "total"):
+            values = "  ".join(f"{value:7.2f}" for value in
+                               results[name][label].values())
+            print(f"{name if label == 'update' else '':<24} {label:<7} "
+                  f"{values}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=4)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
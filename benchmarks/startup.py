@@ -0,0 +1,223 @@
+"""
+Startup profiler, run headless.
+
+Starts the game in fresh processes up to its first interactive menu
+frame: the first frame whose events the menu handles and that reaches
+the display. Reports the median time of each startup phase (importing
+pygame and the game modules, starting the pygame modules, opening the
+window, constructing the AudioManager and the menu, and the first flip)
+and the time from launching the process to that first frame, interpreter
+startup included. The menu constructs the first AudioManager, so the
+menu phase includes it. One more process runs with -X importtime to
+break the imports down per module.
+
+Results are written as JSON. Passing a saved result file to --compare
+prints the change of each phase.
+
+Usage:
+    python -m benchmarks.startup [--runs N] [--top N] [--output FILE]
+        [--compare BASELINE]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.micro import environment
+
+# Run in a fresh process, so that imports and every cache start cold
+STARTUP = """
+import time
+start = time.perf_counter()
+import json, os, sys
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+phases = {}
+
+def timed(owner, name, phase):
+    function = getattr(owner, name)
+
+    def wrapper(*args, **kwargs):
+        begin = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            phases[phase] = phases.get(phase, 0) + (
+                time.perf_counter() - begin) * 1000
+
+    setattr(owner, name, wrapper)
+
+import pygame
+phases["import pygame"] = (time.perf_counter() - start) * 1000
+imported = time.perf_counter()
+from src.Game import Game
+from src.states.Menu import Menu
+from src.utils.AudioManager import AudioManager
+phases["import game"] = (time.perf_counter() - imported) * 1000
+timed(pygame, "init", "pygame init")
+timed(pygame.display, "init", "pygame init")
+timed(pygame.font, "init", "pygame init")
+timed(pygame.display, "set_mode", "set_mode")
+timed(AudioManager, "__init__", "AudioManager")
+timed(Menu, "__init__", "Menu")
+timed(pygame.display, "flip", "first flip")
+constructed = time.perf_counter()
+game = Game()
+phases["Game"] = (time.perf_counter() - constructed) * 1000
+# The menu handles the event and the frame still reaches the display
+pygame.event.post(pygame.event.Event(pygame.QUIT))
+game.run()
+phases["to first frame"] = (time.perf_counter() - start) * 1000
+phases["from launch"] = (time.time() - float(sys.argv[1])) * 1000
+print(json.dumps(phases))
+pygame.quit()
+"""
+
+
+def run_startup(importtime=False):
+    """
+    Starts the game in a fresh process.
+
+    :param importtime: Whether the process runs with -X importtime.
+    :return: The durations of the phases, in milliseconds, and the
+        standard error output of the process.
+    """
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", STARTUP, str(time.time())]
+    environment_variables = dict(os.environ)
+    environment_variables["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    process = subprocess.run(command, capture_output=True, text=True,
+                             check=True, env=environment_variables)
+    return json.loads(process.stdout.strip().splitlines()[-1]), \
+        process.stderr
+
+
+def measure_phases(runs):
+    """
+    Times the startup phases over several processes.
+
+    :param runs: Number of processes.
+    :return: Dictionary mapping each phase to its median duration in
+        milliseconds.
+    """
+    done = [run_startup()[0] for _ in range(runs)]
+    return {phase: statistics.median(run.get(phase, 0) for run in done)
+            for phase in done[0]}
+
+
+def measure_imports():
+    """
+    Breaks the imports of the startup down per module.
+
+    :return: Dictionary mapping module names to their own and cumulative
+        import times in milliseconds, and their nesting depth.
+    """
+    _, output = run_startup(importtime=True)
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = {
+            "self_ms": int(own) / 1000,
+            "cumulative_ms": int(cumulative) / 1000,
+            "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+        }
+    return modules
+
+
+def print_imports(modules, top):
+    """
+    Prints the slowest imports and the share of the game modules.
+
+    :param modules: Per-module import times.
+    :param top: Number of modules printed.
+    """
+    print(f"\n{'module':<52} {'self':>9} {'cumulative':>11}")
+    slowest = sorted(modules.items(),
+                     key=lambda item: -item[1]["cumulative_ms"])
+    for name, module in slowest[:top]:
+        print(f"{name[-52:]:<52} {module['self_ms']:>7.1f}ms "
+              f"{module['cumulative_ms']:>9.1f}ms")
+    game = [module for name, module in modules.items()
+            if name.split(".")[0] in ("src", "config")]
+    print(f"{len(game)} game modules imported, "
+          f"{sum(module['self_ms'] for module in game):.1f}ms of their "
+          f"own code; numpy imported: {'numpy' in modules}")
+
+
+def compare(results, baseline, threshold):
+    """
+    Prints the change of each phase against a baseline.
+
+    :param results: Results of this run.
+    :param baseline: Results of the baseline run.
+    :param threshold: Relative increase considered a regression.
+    :return: Names of the regressed phases.
+    """
+    regressions = []
+    print(f"\n{'phase':<24} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name in dict.fromkeys([*baseline, *results]):
+        if name not in results:
+            print(f"{name:<24} {baseline[name]:>10.1f}ms {'-':>12} "
+                  f"{'gone':>8}")
+            continue
+        if name not in baseline:
+            print(f"{name:<24} {'-':>12} {results[name]:>10.1f}ms "
+                  f"{'new':>8}")
+            continue
+        before = baseline[name]
+        change = results[name] / before - 1 if before else 0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "  improved"
+        print(f"{name:<24} {before:>10.1f}ms {results[name]:>10.1f}ms "
+              f"{change:>+8.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.
+                                     RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=9,
+                        help="startup processes timed")
+    parser.add_argument("--top", type=int, default=20,
+                        help="slowest imports printed")
+    parser.add_argument("--output", default=None,
+                        help="JSON file the results are written to")
+    parser.add_argument("--compare", default=None, metavar="BASELINE",
+                        help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="increase flagged as a regression")
+    args = parser.parse_args()
+
+    phases = measure_phases(args.runs)
+    print(f"{'phase':<24} {'median':>10}")
+    for name, duration in phases.items():
+        print(f"{name:<24} {duration:>8.1f}ms")
+    modules = measure_imports()
+    print_imports(modules, args.top)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"environment": environment(), "phases": phases,
+                       "imports": modules}, file, indent=4)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["phases"]
+        if compare(phases, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
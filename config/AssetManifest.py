@@ -0,0 +1,92 @@
+import math
+
+from config.Constants import Constants
+
+
+class AssetManifest:
+    """
+    Lists the assets baked by tools.bake_assets.
+    IMAGES are baked one by one, with the size the game scales each of
+    them to and whether it keeps its alpha. SPRITES are packed into the
+    texture atlas, with their size, the number of frames laid side by side
+    in the image and whether a mirrored variant is needed. An image loaded
+    at a size missing here is decoded from its source.
+    """
+
+    SCREEN = (Constants.WIDTH, Constants.HEIGHT)
+    PLAYER = (Constants.PLAYER_WIDTH, Constants.PLAYER_HEIGHT)
+    WALK_SHEET = (Constants.PLAYER_WIDTH * 2, Constants.PLAYER_HEIGHT)
+    # Blocks of the 40x30 terrain matrices
+    TILE = (math.ceil(Constants.WIDTH / 40), math.ceil(Constants.HEIGHT / 30))
+
+    IMAGES = (
+        # Screens
+        ("assets/sprites/Background.png", SCREEN, False),
+        ("assets/sprites/GameOver.png", SCREEN, True),
+        ("assets/sprites/Menu.png", SCREEN, False),
+
+        # Players at their own size, for the character selection
+        ("assets/sprites/players/CyborgIdle.png", None, True),
+        ("assets/sprites/players/JonesIdle.png", None, True),
+        ("assets/sprites/players/RainIdle.png", None, True),
+    )
+
+    SPRITES = (
+        # Players
+        ("assets/sprites/players/CyborgIdle.png", PLAYER, 1, True),
+        ("assets/sprites/players/CyborgJump.png", PLAYER, 1, True),
+        ("assets/sprites/players/CyborgWalk.png", WALK_SHEET, 2, True),
+        ("assets/sprites/players/JonesIdle.png", PLAYER, 1, True),
+        ("assets/sprites/players/JonesJump.png", PLAYER, 1, True),
+        ("assets/sprites/players/JonesWalk.png", WALK_SHEET, 2, True),
+        ("assets/sprites/players/RainIdle.png", PLAYER, 1, True),
+        ("assets/sprites/players/RainJump.png", PLAYER, 1, True),
+        ("assets/sprites/players/RainWalk.png", WALK_SHEET, 2, True),
+
+        # Weapons
+        ("assets/sprites/weapons/AssaultRifle.png", (100, 100), 1, False),
+        ("assets/sprites/weapons/PlasmaCannon.png", (100, 100), 1, False),
+        ("assets/sprites/weapons/GrenadeLauncher.png", (100, 100), 1,
+         False),
+        ("assets/sprites/weapons/MissileLauncher.png", (100, 100), 1,
+         False),
+        ("assets/sprites/weapons/PrecisionRifle.png", (70, 70), 1, False),
+        ("assets/sprites/weapons/SpecialPrecisionRifle.png", (70, 70), 1,
+         False),
+
+        # Projectiles
+        ("assets/sprites/projectiles/AssaultRifleProjectile.png", (10, 10),
+         1, False),
+        ("assets/sprites/projectiles/GrenadeLauncherProjectile.png",
+         (15, 15), 1, False),
+        ("assets/sprites/projectiles/PrecisionRifleProjectile.png",
+         (15, 15), 1, False),
+        ("assets/sprites/projectiles/MissileLauncherProjectile.png",
+         (30, 30), 1, False),
+        ("assets/sprites/projectiles/SpecialPrecisionRifleProjectile.png",
+         (25, 25), 1, False),
+        ("assets/sprites/projectiles/LinearEnemyProjectile.png",
+         (Constants.LINEAR_ENEMY_PROJECTILE_WIDTH,
+          Constants.LINEAR_ENEMY_PROJECTILE_HEIGHT), 1, False),
+        ("assets/sprites/projectiles/WavyEnemyProjectile.png",
+         (Constants.WAVY_ENEMY_PROJECTILE_WIDTH,
+          Constants.WAVY_ENEMY_PROJECTILE_HEIGHT), 1, False),
+        ("assets/sprites/projectiles/TankEnemyProjectile.png",
+         (Constants.TANK_BOMB_WIDTH, Constants.TANK_BOMB_HEIGHT), 1, False),
+
+        # Enemies
+        ("assets/sprites/enemies/LinearEnemy.png",
+         (Constants.LINEAR_ENEMY_WIDTH, Constants.LINEAR_ENEMY_HEIGHT), 1,
+         True),
+        ("assets/sprites/enemies/WavyEnemy.png",
+         (Constants.WAVY_ENEMY_WIDTH, Constants.WAVY_ENEMY_HEIGHT), 1,
+         True),
+        ("assets/sprites/enemies/BouncingEnemy.png",
+         (Constants.BOUNCING_ENEMY_WIDTH, Constants.BOUNCING_ENEMY_HEIGHT),
+         1, True),
+        ("assets/sprites/enemies/TankEnemy.png",
+         (Constants.TANK_ENEMY_WIDTH, Constants.TANK_ENEMY_HEIGHT), 1, True),
+
+        # Terrain
+        ("assets/sprites/Tile.png", TILE, 1, False),
+    )
@@ -346,6 +346,12 @@ class AvailableTerrains:
         ]
         self.terrains.append(terrain10)
 
-    def get_random_terrain(self):
-        terrain = random.choice(self.terrains)
+    def get_random_terrain(self, rng=random):
+        """
+        Picks one of the terrains.
+
+        :param rng: Random number generator used for the choice.
+        :return: The chosen terrain.
+        """
+        terrain = rng.choice(self.terrains)
         return terrain
@@ -38,6 +38,41 @@ class Sounds:
     RECHARGED = "recharged"
     STOMP = "stomp"
 
+class Voices:
+    # CATEGORIES, EACH PLAYED ON ITS OWN RESERVED CHANNELS
+    INTERFACE = "interface"
+    WEAPONS = "weapons"
+    IMPACTS = "impacts"
+    DEATHS = "deaths"
+
+class Layers:
+    # RENDER ORDER, FROM BACK TO FRONT
+    TERRAIN = 0
+    PLAYER_PROJECTILES = 1
+    PLAYER = 2
+    ENEMIES = 3
+    ENEMIES_PROJECTILES = 4
+    ABILITIES = 5
+
+class RandomStreams:
+    # GAMEPLAY
+    TERRAIN = "terrain"
+    SPAWN = "spawn"
+    ENEMIES = "enemies"
+
+    # COSMETIC, KEPT APART SO QUALITY CHANGES DO NOT AFFECT GAMEPLAY
+    EFFECTS = "effects"
+
+class States:
+    # GAME STATES, NAMED AFTER THEIR MODULES (SEE StateRegistry)
+    MENU = "Menu"
+    CHARACTER_SELECT = "CharacterSelect"
+    PLAY = "Play"
+    PAUSE = "Pause"
+    SAVE_CONFIRMATION = "SaveConfirmation"
+    GAME_OVER = "GameOver"
+    REPLAY_PLAYBACK = "ReplayPlayback"
+
 class Constants:
     """
     Stores game related constants.
@@ -51,6 +86,86 @@ class Constants:
     GRAVITY = 3000
     EPSILON = 1.0e-9
 
+    # AUDIO
+    AUDIO_QUEUE_SIZE = 256
+    VOICE_CHANNELS = {
+        Voices.INTERFACE: 2,
+        Voices.WEAPONS: 6,
+        Voices.IMPACTS: 5,
+        Voices.DEATHS: 3,
+    }
+    # Sounds are decoded per bank: the core bank at startup, the bank of a
+    # character or enemy when it first appears. Sounds shared by several
+    # of them live in the core bank
+    CORE_SOUND_BANK = "core"
+    SOUND_BANKS = {
+        CORE_SOUND_BANK: (Sounds.BOOM, Sounds.CLICK, Sounds.DEATH,
+                          Sounds.GAME_OVER, Sounds.GUN_SHOT, Sounds.HIT,
+                          Sounds.RECHARGED),
+        "Cyborg": (Sounds.LASER_BEAM,),
+        "Jones": (Sounds.LAUNCHER,),
+        "Rain": (Sounds.CRITICAL_SHOT,),
+        "LinearEnemy": (Sounds.PLASMA,),
+        "WavyEnemy": (Sounds.LASER_SHOT,),
+        "BouncingEnemy": (Sounds.STOMP,),
+    }
+
+    # TRANSFORM CACHE
+    TRANSFORM_CACHE_SIZE = 2048
+    TRANSFORM_ANGLE_STEP = 1
+    TRANSFORM_ALPHA_LEVELS = 16
+
+    # ENTITY COMPONENT SYSTEM
+    WORLD_INITIAL_CAPACITY = 64
+    DAMAGE_LOG_FRAMES = 5 * FPS
+
+    # EFFECTS
+    EXPLOSION_ANIMATION_FRAMES = 16
+    PARTICLE_CAPACITY = 4096
+    PARTICLE_GRAVITY = 600
+    PARTICLE_SIZE = 2
+
+    # QUALITY GOVERNOR
+    # Tiers from best to cheapest. render_scale multiplies the chosen render
+    # resolution, laser_segment_step skips laser segments, particle_ratio
+    # scales emitted particles, hud_interval is the number of frames the HUD
+    # texts are reused for and enemy_projectile_cap limits enemy shots alive
+    QUALITY_TIERS = (
+        {"name": "high", "render_scale": 1.0, "laser_segment_step": 1,
+         "particle_ratio": 1.0, "hud_interval": 1,
+         "enemy_projectile_cap": None},
+        {"name": "medium", "render_scale": 0.75, "laser_segment_step": 2,
+         "particle_ratio": 0.5, "hud_interval": 2,
+         "enemy_projectile_cap": None},
+        {"name": "low", "render_scale": 0.5, "laser_segment_step": 3,
+         "particle_ratio": 0.25, "hud_interval": 4,
+         "enemy_projectile_cap": 40},
+    )
+    QUALITY_FRAME_WINDOW = 60
+    QUALITY_DOWNGRADE_RATIO = 1.0
+    QUALITY_UPGRADE_RATIO = 0.6
+    QUALITY_DOWNGRADE_COOLDOWN = 60
+    QUALITY_UPGRADE_COOLDOWN = 300
+    QUALITY_HISTORY_SIZE = 100
+
+    # REPLAYS
+    REPLAY_KEYFRAME_INTERVAL = 600
+    REPLAY_DIRECTORY = "replays"
+
+    # SAVES
+    SAVE_FILE = "saves/save_game.sav"
+    # Text saves of earlier versions, loaded when there is no binary save
+    LEGACY_SAVE_FILE = "saves/save_game.json"
+
+    # BAKED ASSETS
+    BAKED_ASSETS_DIRECTORY = "assets/baked"
+    BAKED_INDEX_FILE = "index.json"
+    BAKED_IMAGES_FILE = "images.pack"
+    ATLAS_INDEX_FILE = "atlas.json"
+    ATLAS_PAGES_FILE = "atlas.pack"
+    ATLAS_PAGE_SIZE = 1024
+    ATLAS_PADDING = 1
+
     # DIFFICULTY
     SPEED_MULTIPLIER_LIMIT = 2.0
     TIME_UNTIL_LIMIT_DIFFICULTY = 120.0
@@ -88,6 +203,7 @@ class Constants:
     WAVY_ENEMY_AMPLITUDE = 100
     WAVY_ENEMY_ANGULAR_FREQUENCY = 3
     WAVY_ENEMY_MAX_HEALTH = 100
+    WAVY_ENEMY_SCORE = 50
     WAVY_ENEMY_SPEED = 1.0 * ENEMY_SPEED
     # LINEAR ENEMY
     LINEAR_ENEMY_WIDTH = 119.1
@@ -98,11 +214,13 @@ class Constants:
     LINEAR_ENEMY_PROJECTILE_WIDTH = 15
     LINEAR_ENEMY_PROJECTILE_HEIGHT = 15
     LINEAR_ENEMY_MAX_HEALTH = 100
+    LINEAR_ENEMY_SCORE = 30
     LINEAR_ENEMY_SPEED = 150
     # BOUNCING ENEMY
     BOUNCING_ENEMY_WIDTH = 131.25
     BOUNCING_ENEMY_HEIGHT = 75.6
     BOUNCING_ENEMY_MAX_HEALTH = 60
+    BOUNCING_ENEMY_SCORE = 40
     BOUNCING_ENEMY_HORIZONTAL_SPEED = 150
     BOUNCING_ENEMY_FALL_SPEED = 1000
     BOUNCING_ENEMY_RISE_SPEED = 100
@@ -115,6 +233,7 @@ class Constants:
     TANK_ENEMY_WIDTH = 188.8
     TANK_ENEMY_HEIGHT = 121.4
     TANK_ENEMY_MAX_HEALTH = 500
+    TANK_ENEMY_SCORE = 100
     TANK_ENEMY_SPEED = 50
     TANK_ENEMY_Y = 80
     TANK_ENEMY_FIRE_RATE = 2.0
@@ -124,6 +243,7 @@ class Constants:
     TANK_BOMB_DAMAGE = 30
     TANK_BOMB_EXPLOSION_RADIUS = 100
     TANK_BOMB_EXPLOSION_COLOR = (71,151,160,255)
+    TANK_BOMB_EXPLOSION_DURATION = 1.0
 
     # PROJECTILE
     PROJECTILE_DEFAULT_SPEED = 800
@@ -151,6 +271,8 @@ class Constants:
     MISSILE_LIFETIME = 10 * WIDTH / ABILITY_DEFAULT_SPEED
     EXPLOSION_RADIUS = 100
     COLOR_EXPLOSION = (255, 165, 0, 180)
+    EXPLOSION_PARTICLES = 60
+    EXPLOSION_PARTICLE_SPEED = 400
     # LASER BEAM
     LASER_DAMAGE = 2 * ABILITY_DEFAULT_DAMAGE
     LASER_SPEED = ABILITY_DEFAULT_SPEED
@@ -158,10 +280,13 @@ class Constants:
     LASER_COOLDOWN = 5
     LASER_LIFETIME = 1 / 60
     HIT_LIFETIME = 0.5
+    HIT_PARTICLES = 1
+    HIT_PARTICLE_SPEED = 250
     LASER_WIDTH = 5
     LASER_TIME_DIVISOR = 500
     LIMIT_WIDTH_LASER = WIDTH * 5
     SEGMENT_LASER_LENGTH = 20 * 0.8
+    LASER_SEGMENT_VARIANTS = 8
     COLOR_LASER = (255, 10, 60)
     COLOR_LASER_CORE = (255, 255, 255)
     GLOW_COLOR_LASER = (*COLOR_LASER, 150)
@@ -1,8 +1,14 @@
+import os
+import time
+
 import pygame
 
-from config.Constants import Constants, Sounds
-from src.states.Menu import Menu
+from config.Constants import Constants, Sounds, States
+from src.states.StateRegistry import StateRegistry
 from src.utils.AudioManager import AudioManager
+from src.utils.QualityGovernor import QualityGovernor
+from src.utils.RandomService import RandomService
+from src.utils.RenderSurface import RenderSurface
 
 
 class Game:
@@ -10,38 +16,159 @@ class Game:
     Represents the game.
     """
 
-    def __init__(self):
+    def __init__(self, render_size=None, quality=None, seed=None,
+                 record_replays=False):
         """
         Initializes the game.
+
+        :param render_size: Internal resolution the frames are rendered at
+            before being scaled to the window. Defaults to the window size.
+        :param quality: Name of a fixed quality tier. When None the tier
+            adapts to the frame time.
+        :param seed: Seed shared by every run, making them reproducible.
+            When None each run draws its own seed.
+        :param record_replays: Whether the replay of each run is written
+            to Constants.REPLAY_DIRECTORY.
         """
-        pygame.init()
+        # Only the modules the game uses; the mixer is started by the
+        # AudioManager
+        pygame.display.init()
+        pygame.font.init()
         self.__clock = pygame.time.Clock()
         self.__dt = 1 / Constants.FPS
-        self.__screen = pygame.display.set_mode(
+        self.__fps_limit = Constants.FPS
+        self.__window = pygame.display.set_mode(
             (Constants.WIDTH, Constants.HEIGHT))
-        self.__current_state = Menu(self)
+        self.__screen = self.__window
+        RandomService().set_seed(seed)
+        self.__quality_governor = QualityGovernor()
+        self.__applied_tier = None
+        if quality is not None:
+            self.__quality_governor.set_tier(quality)
+            self.__quality_governor.adaptive = False
+        self.set_render_size(render_size)
+        self.__current_state = StateRegistry.create(States.MENU, self)
         self.__audio_manager = AudioManager()
         self.__audio_manager.play_music(Sounds.PLAY)
         self.__load_from_save = False
+        self.__record_replays = record_replays
+        self.__recorded_play = None
+
+    @property
+    def render_size(self):
+        """
+        Returns the internal resolution the frames are rendered at.
+
+        :return: Tuple with the render width and height.
+        """
+        return self.__screen.get_size()
+
+    @property
+    def record_replays(self):
+        """
+        Indicates whether the replay of each run is recorded.
+
+        :return: True if replays are recorded.
+        """
+        return self.__record_replays
+
+    @property
+    def quality_governor(self):
+        """
+        Returns the governor that adapts the quality to the frame time.
+
+        :return: The quality governor.
+        """
+        return self.__quality_governor
+
+    def set_render_size(self, render_size):
+        """
+        Changes the internal resolution. The game keeps working in window
+        coordinates; only the final frame is scaled. Lower quality tiers
+        scale this resolution further down.
+
+        :param render_size: New render resolution, or None for the window
+            size.
+        """
+        self.__base_render_size = render_size or self.__window.get_size()
+        self.__apply_quality()
+
+    def __apply_quality(self):
+        """
+        Applies the render resolution of the current quality tier.
+        """
+        self.__applied_tier = self.__quality_governor.tier_index
+        render_scale = self.__quality_governor.get("render_scale")
+        render_size = (round(self.__base_render_size[0] * render_scale),
+                       round(self.__base_render_size[1] * render_scale))
+        window_size = self.__window.get_size()
+        if render_size == window_size:
+            self.__screen = self.__window
+        else:
+            self.__screen = RenderSurface(window_size, render_size,
+                                          self.__window)
+
+    def play_replay(self, replay, speed=1.0, start_frame=0):
+        """
+        Replaces the current state by the playback of a replay.
+
+        :param replay: The replay to be played.
+        :param speed: Playback speed relative to real time. Zero plays as
+            fast as possible.
+        :param start_frame: Frame the playback starts from.
+        """
+        self.__fps_limit = Constants.FPS * speed
+        self.__current_state = StateRegistry.create(
+            States.REPLAY_PLAYBACK, self, replay, start_frame)
+
+    def __save_replay(self):
+        """
+        Writes the replay of the last Play state, if recording is enabled.
+        """
+        if not self.__record_replays or self.__recorded_play is None:
+            return
+        replay = self.__recorded_play.replay
+        file_name = os.path.join(
+            Constants.REPLAY_DIRECTORY,
+            f"{time.strftime('%Y%m%d-%H%M%S')}-{replay.player_name}"
+            f"-{replay.seed}.replay")
+        try:
+            os.makedirs(Constants.REPLAY_DIRECTORY, exist_ok=True)
+            replay.save(file_name)
+        except (IOError, OSError) as e:
+            print("Error saving the replay: {}".format(e))
 
     def run(self):
         """
         Runs the game.
         """
         while self.__current_state.is_running:
-            self.__clock.tick(Constants.FPS)
+            self.__clock.tick(self.__fps_limit)
+            # Raw time ignores the delay tick() spent waiting for the frame
+            self.__quality_governor.record_frame(self.__clock.get_rawtime())
+            if self.__quality_governor.tier_index != self.__applied_tier:
+                self.__apply_quality()
             events = pygame.event.get()
 
             self.__current_state.handle_events(events)
             self.__current_state.update(self.__dt)
             self.__current_state.draw(self.__screen)
+            self.__audio_manager.update()
 
-            if self.__current_state.__class__.__name__ == "Menu":
+            if self.__current_state.__class__.__name__ == States.MENU:
                 self.__load_from_save = self.__current_state.load_from_save
+            elif (self.__current_state.__class__.__name__ == States.PLAY
+                  and self.__current_state is not self.__recorded_play):
+                self.__save_replay()
+                self.__recorded_play = self.__current_state
             # Check if state change is needed
             if self.__current_state.next_state != self.__current_state:
                 next_state = self.__current_state.next_state
                 self.__current_state.next_state = self.__current_state
                 self.__current_state = next_state
 
+            if self.__screen is not self.__window:
+                self.__screen.present(self.__window)
             pygame.display.flip()
+
+        self.__save_replay()
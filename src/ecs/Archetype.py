@@ -0,0 +1,243 @@
+import numpy as np
+
+from config.Constants import Constants
+from src.ecs.Components import Components
+
+
+class Archetype:
+    """
+    Stores the entities that have exactly the same set of components, one
+    contiguous NumPy column per component, so that systems can process all
+    of them with array operations. Rows keep the order entities were added
+    in.
+    """
+
+    def __init__(self, components):
+        """
+        Initializes an empty archetype.
+
+        :param components: The components of its entities.
+        """
+        self.__components = frozenset(components)
+        self.__capacity = Constants.WORLD_INITIAL_CAPACITY
+        self.__size = 0
+        self.__entities = np.zeros(self.__capacity, dtype=np.int64)
+        self.__columns = {
+            component: np.zeros(self.__capacity,
+                                dtype=Components.SCHEMA[component])
+            for component in self.__components
+            if Components.SCHEMA[component] is not None}
+
+    @property
+    def components(self):
+        """
+        Returns the components of the entities of this archetype.
+
+        :return: Frozen set of component names.
+        """
+        return self.__components
+
+    @property
+    def entities(self):
+        """
+        Returns the entities stored in this archetype, in row order.
+
+        :return: Array of entity ids.
+        """
+        return self.__entities[:self.__size]
+
+    def column(self, component):
+        """
+        Returns the column of a component. Changes made to the returned
+        array are made to the stored entities.
+
+        :param component: Component name.
+        :return: Array with one entry per entity.
+        """
+        return self.__columns[component][:self.__size]
+
+    def extend(self, entities, rows):
+        """
+        Appends entities to the archetype.
+
+        :param entities: Ids of the entities.
+        :param rows: One dictionary per entity mapping its components to
+            their values.
+        :return: Row of the first appended entity.
+        """
+        start = self.__size
+        end = start + len(entities)
+        self.__reserve(end)
+        self.__entities[start:end] = entities
+        for component, column in self.__columns.items():
+            values = [row[component] for row in rows]
+            if column.dtype == object:
+                for index, value in enumerate(values, start):
+                    column[index] = value
+            else:
+                column[start:end] = np.array(values, dtype=column.dtype)
+        self.__size = end
+        return start
+
+    def row(self, index):
+        """
+        Returns the components of one entity.
+
+        :param index: Row of the entity.
+        :return: Dictionary mapping component names to values (None for
+            tags).
+        """
+        values = dict.fromkeys(self.__components)
+        for component, column in self.__columns.items():
+            value = column[index]
+            # Vectors and structured values are views into the column
+            values[component] = value.copy() if isinstance(
+                value, (np.ndarray, np.void)) else value
+        return values
+
+    def get(self, index, component):
+        """
+        Returns a component value of one entity.
+
+        :param index: Row of the entity.
+        :param component: Component name.
+        :return: The stored value.
+        """
+        return self.__columns[component][index]
+
+    def set(self, index, component, value):
+        """
+        Changes a component value of one entity.
+
+        :param index: Row of the entity.
+        :param component: Component name.
+        :param value: The new value.
+        """
+        self.__columns[component][index] = value
+
+    def remove(self, indices):
+        """
+        Removes entities, keeping the order of the remaining ones.
+
+        :param indices: Rows of the entities to be removed.
+        :return: Row from which the remaining entities were shifted.
+        """
+        keep = np.ones(self.__size, dtype=bool)
+        keep[indices] = False
+        first = int(np.min(indices))
+        size = int(np.count_nonzero(keep))
+        for column in list(self.__columns.values()) + [self.__entities]:
+            column[first:size] = column[first:self.__size][keep[first:]]
+            if column.dtype.hasobject:
+                # Releases the objects referenced by the freed rows
+                column[size:self.__size] = np.zeros(1, dtype=column.dtype)
+        self.__size = size
+        return first
+
+    def to_dict(self, encode):
+        """
+        Converts the entities and columns of the archetype into a
+        dictionary.
+
+        :param encode: Function converting the objects stored in object
+            columns into JSON values.
+        :return: A dictionary representing the archetype.
+        """
+        return {
+            "components": sorted(self.__components),
+            "entities": self.entities.tolist(),
+            "columns": {component: self.encode_column(
+                self.column(component), encode)
+                for component in self.__columns},
+        }
+
+    @classmethod
+    def from_dict(cls, data, decode):
+        """
+        Creates an archetype from a dictionary.
+
+        :param data: Dictionary created by to_dict.
+        :param decode: Function converting the JSON values of object
+            columns back into objects.
+        :return: The restored archetype.
+        """
+        instance = cls(data["components"])
+        size = len(data["entities"])
+        instance.__reserve(size)
+        instance.__entities[:size] = data["entities"]
+        for component, values in data["columns"].items():
+            instance.__columns[component][:size] = cls.decode_column(
+                Components.SCHEMA[component], values, decode)
+        instance.__size = size
+        return instance
+
+    @staticmethod
+    def encode_column(column, encode):
+        """
+        Converts a column into a list of JSON values.
+
+        :param column: Array of component values.
+        :param encode: Function converting the stored objects into JSON
+            values.
+        :return: List with one value per entry.
+        """
+        dtype = column.dtype
+        if dtype.names is None:
+            if dtype.hasobject:
+                return [encode(value) for value in column]
+            return column.tolist()
+        return [[encode(value[name]) if dtype[name].hasobject
+                 else value[name].tolist() for name in dtype.names]
+                for value in column]
+
+    @staticmethod
+    def decode_column(dtype, values, decode):
+        """
+        Converts a list created by encode_column back into a column.
+
+        :param dtype: NumPy type of the column.
+        :param values: List with one value per entry.
+        :param decode: Function converting the JSON values of objects back
+            into objects.
+        :return: Array of component values.
+        """
+        column = np.zeros(len(values), dtype=dtype)
+        for index, value in enumerate(values):
+            if dtype.names is not None:
+                column[index] = tuple(
+                    decode(field) if dtype[name].hasobject else field
+                    for name, field in zip(dtype.names, value))
+            elif dtype.hasobject:
+                column[index] = decode(value)
+            else:
+                column[index] = value
+        return column
+
+    def __reserve(self, size):
+        """
+        Grows the columns so that they can hold a number of entities.
+
+        :param size: Number of entities to be held.
+        """
+        if size <= self.__capacity:
+            return
+        while self.__capacity < size:
+            self.__capacity *= 2
+        self.__entities = self.__grow(self.__entities)
+        for component, column in self.__columns.items():
+            self.__columns[component] = self.__grow(column)
+
+    def __grow(self, column):
+        """
+        Copies a column into a larger array.
+
+        :param column: The column.
+        :return: The new column, with the current capacity.
+        """
+        grown = np.zeros((self.__capacity,) + column.shape[1:],
+                         dtype=column.dtype)
+        grown[:self.__size] = column[:self.__size]
+        return grown
+
+    def __len__(self):
+        return self.__size
@@ -0,0 +1,76 @@
+import numpy as np
+
+
+class Components:
+    """
+    Names of the components entities can be made of and the NumPy type of
+    the column each one is stored in. Tags have no column; they only mark
+    the group an entity belongs to.
+    """
+
+    # SPATIAL
+    POSITION = "position"  # center, in pixels
+    PREVIOUS_POSITION = "previous_position"  # center before the last move
+    VELOCITY = "velocity"  # pixels per second
+    SIZE = "size"  # width and height of the image and collider
+    RECT = "rect"  # left, top, width and height, kept by the owner
+
+    # GAMEPLAY
+    HEALTH = "health"
+    DAMAGE = "damage"  # dealt on contact
+    LIFETIME = "lifetime"  # age and duration, in seconds
+    TERRAIN_STOP = "terrain_stop"  # stopped by the terrain
+    FUSE = "fuse"  # bombs waiting to hit the ground
+    EXPLOSIVE = "explosive"  # explodes when it hits an enemy
+    AREA_DAMAGE = "area_damage"  # radius of damage fading with distance
+    HIT_EFFECT = "hit_effect"  # sparks when it hits an enemy
+
+    # PRESENTATION AND BEHAVIOUR
+    SPRITE = "sprite"  # surface drawn at the position
+    FADE = "fade"  # image and angle faded along the lifetime
+    ANIMATION = "animation"  # frames played along the lifetime
+    BEHAVIOUR = "behaviour"  # object driving the entity
+
+    # GROUPS
+    PLAYER_PROJECTILE = "player_projectile"
+    ENEMY_PROJECTILE = "enemy_projectile"
+    ABILITY = "ability"
+    ENEMY = "enemy"
+
+    SCHEMA = {
+        POSITION: np.dtype((np.float64, 2)),
+        PREVIOUS_POSITION: np.dtype((np.float64, 2)),
+        VELOCITY: np.dtype((np.float64, 2)),
+        SIZE: np.dtype((np.int32, 2)),
+        RECT: np.dtype((np.int32, 4)),
+        HEALTH: np.dtype(np.float64),
+        DAMAGE: np.dtype(np.float64),
+        LIFETIME: np.dtype([("age", np.float64), ("duration", np.float64)]),
+        TERRAIN_STOP: np.dtype(np.bool_),
+        FUSE: np.dtype([("time_left", np.float64), ("ground", np.float64),
+                        ("radius", np.float64)]),
+        EXPLOSIVE: np.dtype([("radius", np.float64),
+                             ("damage", np.float64)]),
+        AREA_DAMAGE: np.dtype(np.float64),
+        HIT_EFFECT: None,
+        SPRITE: np.dtype(object),
+        FADE: np.dtype([("image", object), ("angle", np.float64)]),
+        ANIMATION: np.dtype(object),
+        BEHAVIOUR: np.dtype(object),
+        PLAYER_PROJECTILE: None,
+        ENEMY_PROJECTILE: None,
+        ABILITY: None,
+        ENEMY: None,
+    }
+
+    @staticmethod
+    def top_left(positions, sizes):
+        """
+        Computes the top left corner of centered rects the way pygame
+        places a Rect whose center is set to a float position.
+
+        :param positions: Array of centers.
+        :param sizes: Array of widths and heights.
+        :return: Integer array of top left corners.
+        """
+        return np.floor(positions + 0.5).astype(np.int32) - sizes // 2
@@ -0,0 +1,264 @@
+from collections import deque
+
+import numpy as np
+
+from config.Constants import Colors, Constants, Sounds
+from src.ecs.Components import Components
+from src.ecs.ExplosionSpawner import ExplosionSpawner
+from src.ecs.HitBuffer import HitBuffer
+from src.ecs.Hits import Hits
+from src.ecs.World import World
+from src.utils.EventBus import EventBus
+from src.utils.Events import Events
+from src.utils.ParticleSystem import ParticleSystem
+from src.utils.SweptCollision import SweptCollision
+
+
+class DamageSystem:
+    """
+    Resolves the damage of an iteration in two stages. Update tests every
+    projectile against all of its targets at once, along the path it
+    travelled in the iteration, so fast projectiles do not tunnel through
+    them, and records the hits in the HitBuffer next to the ones recorded
+    by bombs and enemies. Resolve then applies the damage of every hit at
+    once, emits the effects and publishes the damage and the deaths on the
+    EventBus in a single pass.
+
+    The hits resolved in the last frames are kept as a damage log.
+    """
+
+    def __init__(self):
+        """
+        Initializes the damage system.
+        """
+        self.__world = World()
+        self.__hits = HitBuffer()
+        self.__particles = ParticleSystem()
+        self.__events = EventBus()
+        self.__explosions = ExplosionSpawner()
+        self.__log = deque(maxlen=Constants.DAMAGE_LOG_FRAMES)
+
+    @property
+    def log(self):
+        """
+        Returns the hits resolved in each of the last frames, oldest first.
+
+        :return: List of structured arrays of Hits.RECORD.
+        """
+        return list(self.__log)
+
+    def update(self, player):
+        """
+        Records the hits of the projectiles and abilities of the iteration.
+
+        :param player: The player sprite, or None if it was removed.
+        """
+        if player is not None:
+            self.__hit_player(player)
+        self.__hit_enemies()
+
+    def resolve(self, player):
+        """
+        Applies the damage of the recorded hits, emits their effects and
+        kills the enemies left without health.
+
+        :param player: The player sprite, or None if it was removed.
+        """
+        records = self.__hits.records
+        self.__log.append(records.copy())
+        if player is not None:
+            for damage in records["damage"][
+                    records["target"] == Hits.PLAYER].tolist():
+                player.inflict_damage(damage)
+        dead = self.__damage_enemies(records)
+        self.__emit_effects(records)
+        for target, damage, cause in zip(records["target"].tolist(),
+                                         records["damage"].tolist(),
+                                         records["cause"].tolist()):
+            self.__events.publish(Events.Damaged(
+                target, damage, cause,
+                Sounds.HIT if target == Hits.PLAYER else None))
+        for enemy in dead:
+            enemy.kill()
+            self.__events.publish(Events.Killed(enemy, enemy.score,
+                                                enemy.rect.center,
+                                                Sounds.DEATH))
+        self.__hits.clear()
+
+    def __hit_player(self, player):
+        """
+        Records the hits of the enemy projectiles that reached the player
+        and removes them. Bombs explode instead of being removed.
+
+        :param player: The player sprite.
+        """
+        target = np.array([tuple(player.rect)])
+        for archetype in self.__world.query(Components.ENEMY_PROJECTILE,
+                                            Components.DAMAGE,
+                                            Components.PREVIOUS_POSITION):
+            hits = np.flatnonzero(
+                np.isfinite(self.__sweep(archetype, target)[:, 0]))
+            if not len(hits):
+                continue
+            entities = archetype.entities[hits].tolist()
+            if Components.FUSE in archetype.components:
+                for entity in entities:
+                    self.__explosions.detonate(entity, player)
+                continue
+            self.__hits.extend(np.full(len(hits), Hits.PLAYER),
+                               archetype.column(Components.DAMAGE)[hits],
+                               Hits.PROJECTILE,
+                               archetype.column(Components.POSITION)[hits])
+            for entity in entities:
+                self.__world.destroy(entity)
+
+    def __hit_enemies(self):
+        """
+        Records the hits of the player projectiles and abilities on the
+        enemies, and of the explosions the enemies are inside of.
+        """
+        enemies = self.__world.query(Components.ENEMY, Components.RECT,
+                                     Components.HEALTH)
+        if not enemies:
+            return
+        ids = np.concatenate([archetype.entities for archetype in enemies])
+        rects = np.concatenate([archetype.column(Components.RECT)
+                                for archetype in enemies])
+
+        for group in (Components.PLAYER_PROJECTILE, Components.ABILITY):
+            for archetype in self.__world.query(
+                    group, Components.DAMAGE, Components.PREVIOUS_POSITION,
+                    exclude=(Components.AREA_DAMAGE,)):
+                self.__record_hits(archetype, ids, rects)
+
+        for archetype in self.__world.query(Components.AREA_DAMAGE,
+                                            Components.DAMAGE):
+            self.__record_area_damage(archetype, ids, rects)
+
+    def __record_hits(self, archetype, ids, rects):
+        """
+        Records the hit of each projectile of an archetype on the first
+        enemy along its path, and removes those projectiles.
+
+        :param archetype: Archetype of the projectiles.
+        :param ids: Array of the enemy ids.
+        :param rects: Array of the enemy rects.
+        """
+        contacts = self.__sweep(archetype, rects)
+        rows = np.flatnonzero(np.isfinite(contacts).any(axis=1))
+        if not len(rows):
+            return
+        targets = ids[contacts[rows].argmin(axis=1)]
+        damage = archetype.column(Components.DAMAGE)[rows]
+        sizes = archetype.column(Components.SIZE)[rows]
+        centers = Components.top_left(
+            archetype.column(Components.POSITION)[rows], sizes) + sizes // 2
+
+        if Components.EXPLOSIVE in archetype.components:
+            explosives = archetype.column(Components.EXPLOSIVE)[rows]
+            self.__hits.extend(targets, damage, Hits.MISSILE, centers,
+                               explosives["radius"], explosives["damage"])
+        elif Components.HIT_EFFECT in archetype.components:
+            self.__hits.extend(targets, damage, Hits.SPARKS, centers)
+        else:
+            self.__hits.extend(targets, damage, Hits.PROJECTILE, centers)
+        for entity in archetype.entities[rows].tolist():
+            self.__world.destroy(entity)
+
+    def __record_area_damage(self, archetype, ids, rects):
+        """
+        Records the damage of the area entities of an archetype on the
+        enemies inside their radius, less the farther they are from the
+        center.
+
+        :param archetype: Archetype of the area entities.
+        :param ids: Array of the enemy ids.
+        :param rects: Array of the enemy rects.
+        """
+        sizes = archetype.column(Components.SIZE)
+        centers = Components.top_left(archetype.column(Components.POSITION),
+                                      sizes) + sizes // 2
+        enemy_centers = rects[:, :2] + rects[:, 2:] // 2
+        distances = np.linalg.norm(
+            centers[:, None, :] - enemy_centers[None, :, :], axis=2)
+        radius = archetype.column(Components.AREA_DAMAGE)[:, None]
+        factors = np.where(distances <= radius, 1 - distances / radius, 0)
+        damage = (archetype.column(Components.DAMAGE)[:, None]
+                  * factors).sum(axis=0)
+        hit = np.flatnonzero(damage)
+        if len(hit):
+            self.__hits.extend(ids[hit], damage[hit], Hits.AREA,
+                               enemy_centers[hit])
+
+    def __damage_enemies(self, records):
+        """
+        Subtracts the damage of the hits from the health of the enemies,
+        in the order the hits happened.
+
+        :param records: The hit records.
+        :return: List of the enemies left without health.
+        """
+        enemies = self.__world.query(Components.ENEMY, Components.HEALTH,
+                                     Components.BEHAVIOUR)
+        if not enemies:
+            return []
+        ids = np.concatenate([archetype.entities for archetype in enemies])
+        health = np.concatenate([archetype.column(Components.HEALTH)
+                                 for archetype in enemies])
+
+        hits = records[records["target"] > Hits.PLAYER]
+        if len(hits):
+            order = np.argsort(ids)
+            rows = order[np.minimum(
+                np.searchsorted(ids, hits["target"], sorter=order),
+                len(ids) - 1)]
+            found = ids[rows] == hits["target"]
+            np.subtract.at(health, rows[found], hits["damage"][found])
+            start = 0
+            for archetype in enemies:
+                end = start + len(archetype)
+                archetype.column(Components.HEALTH)[:] = health[start:end]
+                start = end
+
+        dead = np.flatnonzero(health <= 0)
+        behaviours = np.concatenate([archetype.column(Components.BEHAVIOUR)
+                                     for archetype in enemies])
+        return [enemy for entity, enemy in zip(ids[dead].tolist(),
+                                               behaviours[dead])
+                if self.__world.alive(entity)]
+
+    def __emit_effects(self, records):
+        """
+        Emits the sparks and explosions of the hits.
+
+        :param records: The hit records.
+        """
+        records = records[np.isin(records["cause"],
+                                  (Hits.SPARKS, Hits.MISSILE))]
+        for cause, position, radius, splash in zip(
+                records["cause"].tolist(), records["position"].tolist(),
+                records["radius"].tolist(), records["splash"].tolist()):
+            if cause == Hits.SPARKS:
+                self.__particles.emit_burst(position, Constants.HIT_PARTICLES,
+                                            Colors.RED,
+                                            Constants.HIT_PARTICLE_SPEED,
+                                            Constants.HIT_LIFETIME)
+            elif cause == Hits.MISSILE:
+                self.__explosions.explode(Components.ABILITY, position,
+                                         radius, splash)
+
+    @staticmethod
+    def __sweep(archetype, rects):
+        """
+        Tests the paths of the entities of an archetype against rects.
+
+        :param archetype: Archetype of the moving entities.
+        :param rects: Array (M, 4) of left, top, width and height.
+        :return: Array with one row per entity and one column per rect,
+            holding the fraction of the path at the first contact, or inf
+            where the path misses the rect.
+        """
+        return SweptCollision.swept_rects(
+            archetype.column(Components.PREVIOUS_POSITION),
+            archetype.column(Components.POSITION),
+            archetype.column(Components.SIZE), rects)
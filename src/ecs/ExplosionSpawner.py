@@ -0,0 +1,102 @@
+import pygame
+
+from config.Constants import Constants, Sounds
+from src.ecs.Components import Components
+from src.ecs.HitBuffer import HitBuffer
+from src.ecs.Hits import Hits
+from src.ecs.World import World
+from src.utils.EventBus import EventBus
+from src.utils.Events import Events
+from src.utils.ExplosionAtlas import ExplosionAtlas
+from src.utils.ParticleSystem import ParticleSystem
+
+
+class ExplosionSpawner:
+    """
+    Creates the explosions set off by the systems: bombs that reach the
+    ground or the player turn into their explosion, and missiles that hit
+    an enemy leave an explosion that damages the enemies around it.
+    """
+
+    def __init__(self):
+        """
+        Initializes the explosion spawner.
+        """
+        self.__world = World()
+        self.__hits = HitBuffer()
+        self.__events = EventBus()
+        self.__particles = ParticleSystem()
+        self.__atlas = ExplosionAtlas()
+
+    def detonate(self, entity, player):
+        """
+        Triggers the explosion of a bomb and records its hit on the player
+        if it is inside the explosion area.
+
+        :param entity: Id of the bomb
+        :param player: Player sprite
+        """
+        world = self.__world
+        radius = float(world.get(entity, Components.FUSE)["radius"])
+        size = world.get(entity, Components.SIZE)
+        rect = pygame.Rect(tuple(Components.top_left(
+            world.get(entity, Components.POSITION), size)), tuple(size))
+
+        # Create explosion area
+        explosion_rect = pygame.Rect(0, 0, radius * 2, radius * 2)
+        explosion_rect.center = rect.center
+        frames = self.__atlas.get_frames(
+            radius, Constants.TANK_BOMB_EXPLOSION_COLOR)
+
+        # Applies damage to the player if inside explosion radius
+        if player and explosion_rect.colliderect(player.rect):
+            self.__hits.add(Hits.PLAYER,
+                            world.get(entity, Components.DAMAGE),
+                            Hits.BOMB, explosion_rect.center)
+        self.__events.publish(Events.Landed(explosion_rect.center,
+                                            Sounds.BOOM))
+
+        # From now on the entity shows the explosion
+        world.set(entity, Components.POSITION, explosion_rect.center)
+        world.set(entity, Components.PREVIOUS_POSITION, explosion_rect.center)
+        world.set(entity, Components.VELOCITY, (0, 0))
+        world.set(entity, Components.SIZE, explosion_rect.size)
+        world.set(entity, Components.SPRITE, frames[0])
+        world.set(entity, Components.LIFETIME,
+                  (0.0, Constants.TANK_BOMB_EXPLOSION_DURATION))
+        world.add_component(entity, Components.ANIMATION, frames)
+        world.remove_component(entity, Components.FUSE)
+        world.remove_component(entity, Components.DAMAGE)
+
+    def explode(self, group, center, radius, damage):
+        """
+        Creates the explosion left by a missile, with its particles and
+        sound. While it plays, enemies inside its radius take damage that
+        fades with their distance from the center.
+
+        :param group: Group tag of the explosion (see Components)
+        :param center: Center of the explosion
+        :param radius: Radius of the explosion
+        :param damage: Damage at the center of the explosion
+        :return: Id of the entity
+        """
+        frames = self.__atlas.get_frames(radius, Constants.COLOR_EXPLOSION)
+        center = tuple(center)
+        entity = self.__world.create({
+            Components.POSITION: center,
+            Components.PREVIOUS_POSITION: center,
+            Components.VELOCITY: (0, 0),
+            Components.SIZE: frames[0].get_size(),
+            Components.SPRITE: frames[0],
+            Components.DAMAGE: damage,
+            group: None,
+            Components.LIFETIME: (0.0, Constants.HIT_LIFETIME),
+            Components.ANIMATION: frames,
+            Components.AREA_DAMAGE: radius,
+        })
+        self.__particles.emit_burst(center, Constants.EXPLOSION_PARTICLES,
+                                    Constants.COLOR_EXPLOSION,
+                                    Constants.EXPLOSION_PARTICLE_SPEED,
+                                    Constants.HIT_LIFETIME)
+        self.__events.publish(Events.Exploded(center, radius, Sounds.BOOM))
+        return entity
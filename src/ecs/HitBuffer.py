@@ -0,0 +1,135 @@
+import numpy as np
+
+from config.Constants import Constants
+from src.ecs.Hits import Hits
+
+
+class HitBuffer:
+    """
+    Collects the hits of an iteration. Collision code only appends hit
+    records here; the damage they cause is applied all at once when the
+    DamageSystem resolves them.
+
+    This class implements the Singleton design pattern so that any entity
+    can record the hits it causes.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(HitBuffer, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr(self, "_initialized") and self._initialized:
+            return
+        self._initialized = True
+        self.__records = np.zeros(Constants.WORLD_INITIAL_CAPACITY,
+                                  dtype=Hits.RECORD)
+        self.__size = 0
+
+    @property
+    def records(self):
+        """
+        Returns the hits recorded since the buffer was last cleared, in the
+        order they happened.
+
+        :return: Structured array of Hits.RECORD.
+        """
+        return self.__records[:self.__size]
+
+    def add(self, target, damage, cause, position=(0, 0), radius=0.0,
+            splash=0.0):
+        """
+        Records one hit.
+
+        :param target: Entity id of the target or Hits.PLAYER.
+        :param damage: Damage dealt to the target.
+        :param cause: What caused the hit (see Hits).
+        :param position: Where the effects of the hit are emitted.
+        :param radius: Radius of the explosion left by a missile.
+        :param splash: Damage of the explosion left by a missile.
+        """
+        self.__reserve(self.__size + 1)
+        self.__records[self.__size] = (target, damage, cause, position,
+                                       radius, splash)
+        self.__size += 1
+
+    def extend(self, targets, damage, cause, positions=(0, 0), radius=0.0,
+               splash=0.0):
+        """
+        Records many hits of the same cause.
+
+        :param targets: Array of target ids.
+        :param damage: Array of the damage dealt to each target.
+        :param cause: What caused the hits (see Hits).
+        :param positions: Array of where the effects of each hit are
+            emitted.
+        :param radius: Array of the radius of the explosions left by
+            missiles.
+        :param splash: Array of the damage of those explosions.
+        """
+        start = self.__size
+        end = start + len(targets)
+        self.__reserve(end)
+        records = self.__records[start:end]
+        records["target"] = targets
+        records["damage"] = damage
+        records["cause"] = cause
+        records["position"] = positions
+        records["radius"] = radius
+        records["splash"] = splash
+        self.__size = end
+
+    def clear(self):
+        """
+        Forgets the recorded hits.
+        """
+        self.__size = 0
+
+    def to_dict(self):
+        """
+        Converts the recorded hits into a dictionary.
+
+        :return: A dictionary mapping the fields of Hits.RECORD to the
+            lists of their values.
+        """
+        records = self.records
+        return {name: records[name].tolist() for name in Hits.RECORD.names}
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Replaces the recorded hits with the ones of a dictionary.
+
+        :param data: Dictionary created by to_dict.
+        :return: The restored buffer.
+        """
+        instance = cls()
+        size = len(data["target"])
+        instance.clear()
+        instance.__reserve(size)
+        records = instance.__records[:size]
+        for name in Hits.RECORD.names:
+            records[name] = np.reshape(data[name], records[name].shape)
+        instance.__size = size
+        return instance
+
+    def __reserve(self, size):
+        """
+        Grows the buffer so that it can hold a number of hits.
+
+        :param size: Number of hits to be held.
+        """
+        if size <= len(self.__records):
+            return
+        capacity = len(self.__records)
+        while capacity < size:
+            capacity *= 2
+        records = np.zeros(capacity, dtype=Hits.RECORD)
+        records[:self.__size] = self.__records[:self.__size]
+        self.__records = records
+
+    def __len__(self):
+        return self.__size
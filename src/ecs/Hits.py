@@ -0,0 +1,29 @@
+import numpy as np
+
+
+class Hits:
+    """
+    Causes of the hits recorded during an iteration and the NumPy type of
+    a hit record. The cause decides the sounds and effects emitted once the
+    damage of the iteration is resolved.
+    """
+
+    # Target of the hits on the player (entity ids start at 1)
+    PLAYER = 0
+
+    # CAUSES
+    PROJECTILE = 0  # projectile removed on contact
+    BOMB = 1  # bomb explosion reaching the player
+    CRUSH = 2  # enemy falling on the player
+    SPARKS = 3  # laser segment, sparks where it hit
+    MISSILE = 4  # missile, explodes where it hit
+    AREA = 5  # explosion, damage fading with distance
+
+    RECORD = np.dtype([
+        ("target", np.int64),
+        ("damage", np.float64),
+        ("cause", np.uint8),
+        ("position", np.float64, (2,)),  # where the effects are emitted
+        ("radius", np.float64),  # of the explosion left by a missile
+        ("splash", np.float64),  # damage of that explosion
+    ])
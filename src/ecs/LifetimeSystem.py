@@ -0,0 +1,30 @@
+import numpy as np
+
+from src.ecs.Components import Components
+from src.ecs.World import World
+
+
+class LifetimeSystem:
+    """
+    Ages the entities that have a lifetime and destroys the ones that
+    outlived it.
+    """
+
+    def __init__(self):
+        """
+        Initializes the lifetime system.
+        """
+        self.__world = World()
+
+    def update(self, dt):
+        """
+        Ages the entities.
+
+        :param dt: Duration of one iteration
+        """
+        for archetype in self.__world.query(Components.LIFETIME):
+            lifetime = archetype.column(Components.LIFETIME)
+            lifetime["age"] += dt
+            expired = np.flatnonzero(lifetime["age"] >= lifetime["duration"])
+            for entity in archetype.entities[expired].tolist():
+                self.__world.destroy(entity)
@@ -0,0 +1,28 @@
+from src.ecs.Components import Components
+from src.ecs.World import World
+
+
+class MovementSystem:
+    """
+    Moves every entity that has a velocity, remembering where it was so
+    collisions can be tested along the path.
+    """
+
+    def __init__(self):
+        """
+        Initializes the movement system.
+        """
+        self.__world = World()
+
+    def update(self, dt):
+        """
+        Moves the entities.
+
+        :param dt: Duration of one iteration
+        """
+        for archetype in self.__world.query(Components.POSITION,
+                                            Components.PREVIOUS_POSITION,
+                                            Components.VELOCITY):
+            position = archetype.column(Components.POSITION)
+            archetype.column(Components.PREVIOUS_POSITION)[:] = position
+            position += archetype.column(Components.VELOCITY) * dt
@@ -0,0 +1,74 @@
+import numpy as np
+
+from src.ecs.Components import Components
+from src.ecs.World import World
+from src.utils.TransformCache import TransformCache
+
+
+class RenderSystem:
+    """
+    Queues the sprites of the entities to be drawn, picking the frame of
+    animated entities and the transparency of fading ones from how much of
+    their lifetime has passed.
+    """
+
+    def __init__(self, layers):
+        """
+        Initializes the render system.
+
+        :param layers: Dictionary mapping group tags to the layer their
+            entities are drawn on.
+        """
+        self.__world = World()
+        self.__transform_cache = TransformCache()
+        self.__layers = layers
+
+    def draw(self, queue):
+        """
+        Queues the sprites of every entity of the drawn groups.
+
+        :param queue: The render queue.
+        """
+        for group, layer in self.__layers.items():
+            for archetype in self.__world.query(group, Components.SPRITE,
+                                                Components.POSITION,
+                                                Components.SIZE):
+                queue.add_items(self.__items(archetype), layer)
+
+    def __items(self, archetype):
+        """
+        Builds the (surface, position) pairs of the entities of an
+        archetype.
+
+        :param archetype: The archetype.
+        :return: List of (surface, position) pairs.
+        """
+        positions = Components.top_left(
+            archetype.column(Components.POSITION),
+            archetype.column(Components.SIZE)).tolist()
+        if Components.ANIMATION in archetype.components:
+            progress = self.__progress(archetype)
+            images = [frames[min(int(ratio * len(frames)), len(frames) - 1)]
+                      for frames, ratio in zip(
+                    archetype.column(Components.ANIMATION), progress)]
+        elif Components.FADE in archetype.components:
+            fade = archetype.column(Components.FADE)
+            alphas = 255 * (1 - self.__progress(archetype))
+            images = [self.__transform_cache.get(image, angle, alpha)
+                      for image, angle, alpha in zip(
+                    fade["image"], fade["angle"].tolist(), alphas.tolist())]
+        else:
+            images = archetype.column(Components.SPRITE)
+        return list(zip(images, positions))
+
+    @staticmethod
+    def __progress(archetype):
+        """
+        Returns how much of their lifetime the entities of an archetype
+        have lived.
+
+        :param archetype: The archetype.
+        :return: Array of ratios between 0 and 1.
+        """
+        lifetime = archetype.column(Components.LIFETIME)
+        return np.minimum(lifetime["age"] / lifetime["duration"], 1.0)
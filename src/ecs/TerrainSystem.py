@@ -0,0 +1,113 @@
+import numpy as np
+import pygame
+
+from src.ecs.Components import Components
+from src.ecs.ExplosionSpawner import ExplosionSpawner
+from src.ecs.World import World
+
+
+class TerrainSystem:
+    """
+    Collides moving entities with the terrain: projectiles stop where
+    their path enters a block and bombs explode when they reach the ground.
+    """
+
+    def __init__(self):
+        """
+        Initializes the terrain system.
+        """
+        self.__world = World()
+        self.__explosions = ExplosionSpawner()
+
+    def update(self, dt, terrain, player):
+        """
+        Collides the entities that moved in this iteration.
+
+        :param dt: Duration of one iteration
+        :param terrain: The terrain
+        :param player: Player sprite hit by the explosions (optional)
+        """
+        if not terrain:
+            return
+        self.__stop_projectiles(terrain)
+        self.__burn_fuses(dt, terrain, player)
+
+    def __stop_projectiles(self, terrain):
+        """
+        Removes the projectiles stopped in the previous iteration and stops
+        the ones whose path enters the terrain, clipping them at the entry
+        point.
+
+        :param terrain: The terrain
+        """
+        for archetype in self.__world.query(Components.TERRAIN_STOP,
+                                            Components.POSITION,
+                                            Components.PREVIOUS_POSITION,
+                                            Components.SIZE):
+            stopped = archetype.column(Components.TERRAIN_STOP)
+            entities = archetype.entities
+            for entity in entities[stopped].tolist():
+                self.__world.destroy(entity)
+
+            positions = archetype.column(Components.POSITION)
+            previous = archetype.column(Components.PREVIOUS_POSITION)
+            sizes = archetype.column(Components.SIZE)
+            half_sizes = sizes / 2
+            lows = np.minimum(positions, previous) - half_sizes
+            highs = np.maximum(positions, previous) + half_sizes
+            candidates = np.flatnonzero(~stopped & ~terrain.above_surface(
+                lows[:, 0], highs[:, 0], highs[:, 1]))
+
+            for row in candidates.tolist():
+                start, end = previous[row], positions[row]
+                impact = terrain.segment_collision(start, end)
+                if impact is not None:
+                    end[:] = start + (end - start) * impact
+                    stopped[row] = True
+                elif terrain.collides_rect(pygame.Rect(
+                        tuple(Components.top_left(end, sizes[row])),
+                        tuple(sizes[row]))):
+                    stopped[row] = True
+
+    def __burn_fuses(self, dt, terrain, player):
+        """
+        Resolves when new bombs reach the ground, counts their fuses down
+        and detonates the ones that landed.
+
+        :param dt: Duration of one iteration
+        :param terrain: The terrain
+        :param player: Player sprite hit by the explosions (optional)
+        """
+        for archetype in self.__world.query(Components.FUSE,
+                                            Components.POSITION,
+                                            Components.PREVIOUS_POSITION,
+                                            Components.VELOCITY,
+                                            Components.SIZE):
+            fuses = archetype.column(Components.FUSE)
+            positions = archetype.column(Components.POSITION)
+            sizes = archetype.column(Components.SIZE)
+
+            # Impact time is resolved once against the terrain heightmap,
+            # from where the bomb was before its first move
+            previous = archetype.column(Components.PREVIOUS_POSITION)
+            speeds = archetype.column(Components.VELOCITY)[:, 1]
+            for row in np.flatnonzero(np.isnan(fuses["time_left"])).tolist():
+                rect = pygame.Rect(
+                    tuple(Components.top_left(previous[row], sizes[row])),
+                    tuple(sizes[row]))
+                ground = terrain.ground_below(rect)
+                time_left = terrain.time_until_impact(rect, speeds[row])
+                fuses[row] = (np.inf if time_left is None else time_left,
+                              np.nan if ground is None else ground,
+                              fuses[row]["radius"])
+
+            fuses["time_left"] -= dt
+            landed = np.flatnonzero(fuses["time_left"] <= 0)
+            for row, entity in zip(landed.tolist(),
+                                   archetype.entities[landed].tolist()):
+                height = sizes[row][1]
+                positions[row] = (
+                    Components.top_left(positions[row], sizes[row])[0]
+                    + sizes[row][0] // 2,
+                    fuses[row]["ground"] - height + height // 2)
+                self.__explosions.detonate(entity, player)
@@ -0,0 +1,376 @@
+import itertools
+
+import numpy as np
+
+from src.ecs.Archetype import Archetype
+from src.ecs.Components import Components
+
+# Marks a component taken from an entity in the buffered changes
+_REMOVED = object()
+
+
+class World:
+    """
+    Holds the entities of a game session. An entity is an id whose
+    components are stored in the archetype of its component set, so
+    systems run array operations over whole columns instead of calling
+    every entity.
+
+    Creating and destroying entities, and adding or removing components,
+    is buffered until flush, so systems can change the world while they
+    iterate over it.
+
+    This class implements the Singleton design pattern so that any entity
+    can be spawned into the same world.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(World, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr(self, "_initialized") and self._initialized:
+            return
+        self._initialized = True
+        self.__ids = itertools.count(1)
+        self.__archetypes = {}
+        self.__queries = {}
+        self.__locations = {}
+        self.__created = {}
+        self.__destroyed = set()
+        self.__changed = {}
+
+    def clear(self):
+        """
+        Removes every entity. Ids are never reused, so stale ids of a
+        previous session simply refer to no entity.
+        """
+        self.__archetypes.clear()
+        self.__queries.clear()
+        self.__locations.clear()
+        self.__created.clear()
+        self.__destroyed.clear()
+        self.__changed.clear()
+
+    def create(self, components):
+        """
+        Creates an entity. It joins the queries at the next flush.
+
+        :param components: Dictionary mapping component names to their
+            values (None for tags).
+        :return: Id of the entity.
+        """
+        entity = next(self.__ids)
+        self.__created[entity] = dict(components)
+        return entity
+
+    def destroy(self, entity):
+        """
+        Destroys an entity at the next flush. Unknown ids are ignored.
+
+        :param entity: Id of the entity.
+        """
+        entity = int(entity)
+        if self.__created.pop(entity, None) is None:
+            if entity in self.__locations:
+                self.__destroyed.add(entity)
+
+    def add_component(self, entity, component, value=None):
+        """
+        Gives an entity a component, moving it to another archetype at the
+        next flush.
+
+        :param entity: Id of the entity.
+        :param component: Component name.
+        :param value: Value of the component (None for tags).
+        """
+        entity = int(entity)
+        if entity in self.__created:
+            self.__created[entity][component] = value
+        elif entity in self.__locations:
+            self.__changed.setdefault(entity, {})[component] = value
+
+    def remove_component(self, entity, component):
+        """
+        Takes a component from an entity at the next flush.
+
+        :param entity: Id of the entity.
+        :param component: Component name.
+        """
+        entity = int(entity)
+        if entity in self.__created:
+            self.__created[entity].pop(component, None)
+        elif entity in self.__locations:
+            self.__changed.setdefault(entity, {})[component] = _REMOVED
+
+    def alive(self, entity):
+        """
+        Checks whether an entity exists and is not about to be destroyed.
+
+        :param entity: Id of the entity.
+        :return: True if the entity is alive, False otherwise.
+        """
+        entity = int(entity)
+        return entity in self.__created or (
+                entity in self.__locations and
+                entity not in self.__destroyed)
+
+    def has(self, entity, component):
+        """
+        Checks whether an entity has a component.
+
+        :param entity: Id of the entity.
+        :param component: Component name.
+        :return: True if it has the component, False otherwise.
+        """
+        entity = int(entity)
+        if entity in self.__created:
+            return component in self.__created[entity]
+        location = self.__locations.get(entity)
+        return location is not None and component in location[0].components
+
+    def get(self, entity, component):
+        """
+        Returns a component value of an entity.
+
+        :param entity: Id of the entity.
+        :param component: Component name.
+        :return: The value.
+        """
+        entity = int(entity)
+        if entity in self.__created:
+            return self.__created[entity][component]
+        archetype, row = self.__locations[entity]
+        return archetype.get(row, component)
+
+    def set(self, entity, component, value):
+        """
+        Changes a component value of an entity.
+
+        :param entity: Id of the entity.
+        :param component: Component name.
+        :param value: The new value.
+        """
+        entity = int(entity)
+        if entity in self.__created:
+            self.__created[entity][component] = value
+            return
+        archetype, row = self.__locations[entity]
+        archetype.set(row, component, value)
+
+    def query(self, *components, exclude=()):
+        """
+        Finds the archetypes whose entities have some components.
+
+        :param components: Components the entities must have.
+        :param exclude: Components the entities must not have.
+        :return: List of the non-empty matching archetypes.
+        """
+        key = (frozenset(components), frozenset(exclude))
+        archetypes = self.__queries.get(key)
+        if archetypes is None:
+            archetypes = [archetype for archetype in
+                          self.__archetypes.values()
+                          if self.__matches(archetype.components, *key)]
+            self.__queries[key] = archetypes
+        return [archetype for archetype in archetypes if len(archetype)]
+
+    def count(self, *components, exclude=()):
+        """
+        Counts the entities that have some components, including the ones
+        waiting to be created and leaving out the ones about to be
+        destroyed.
+
+        :param components: Components the entities must have.
+        :param exclude: Components the entities must not have.
+        :return: Number of entities.
+        """
+        include, exclude = frozenset(components), frozenset(exclude)
+        count = sum(len(archetype) for archetype in
+                    self.query(*include, exclude=exclude))
+        count += sum(1 for values in self.__created.values()
+                     if self.__matches(values.keys(), include, exclude))
+        count -= sum(1 for entity in self.__destroyed if self.__matches(
+            self.__locations[entity][0].components, include, exclude))
+        return count
+
+    def flush(self):
+        """
+        Applies the buffered destructions, component changes and creations.
+        """
+        if self.__destroyed:
+            self.__remove(self.__destroyed)
+            for entity in self.__destroyed:
+                self.__changed.pop(entity, None)
+                del self.__locations[entity]
+            self.__destroyed.clear()
+
+        if self.__changed:
+            moved = {}
+            for entity, changes in self.__changed.items():
+                archetype, row = self.__locations[entity]
+                values = archetype.row(row)
+                for component, value in changes.items():
+                    if value is _REMOVED:
+                        values.pop(component, None)
+                    else:
+                        values[component] = value
+                moved[entity] = values
+            self.__changed.clear()
+            self.__remove(moved)
+            self.__insert(moved)
+
+        if self.__created:
+            created = self.__created
+            self.__created = {}
+            self.__insert(created)
+
+    def to_dict(self, encode):
+        """
+        Converts every entity, including the buffered changes, into a
+        dictionary. Archetypes keep their order, which is the order queries
+        return them in.
+
+        :param encode: Function converting the objects stored in object
+            columns (surfaces, behaviours) into JSON values.
+        :return: A dictionary representing the world.
+        """
+        next_id = next(self.__ids)
+        self.__ids = itertools.count(next_id)
+        changed = []
+        for entity, changes in self.__changed.items():
+            values = {component: value for component, value in
+                      changes.items() if value is not _REMOVED}
+            removed = [component for component, value in changes.items()
+                       if value is _REMOVED]
+            changed.append([entity, self.__encode_values(values, encode),
+                            removed])
+        return {
+            "next_id": next_id,
+            "archetypes": [archetype.to_dict(encode) for archetype in
+                           self.__archetypes.values()],
+            "created": [[entity, self.__encode_values(values, encode)]
+                        for entity, values in self.__created.items()],
+            "destroyed": sorted(self.__destroyed),
+            "changed": changed,
+        }
+
+    @classmethod
+    def from_dict(cls, data, decode):
+        """
+        Replaces every entity with the ones of a dictionary.
+
+        :param data: Dictionary created by to_dict.
+        :param decode: Function converting the JSON values of object
+            columns back into objects.
+        :return: The restored world.
+        """
+        instance = cls()
+        instance.clear()
+        instance.__ids = itertools.count(data["next_id"])
+        for archetype_data in data["archetypes"]:
+            archetype = Archetype.from_dict(archetype_data, decode)
+            instance.__archetypes[archetype.components] = archetype
+            for row, entity in enumerate(archetype.entities.tolist()):
+                instance.__locations[entity] = (archetype, row)
+        for entity, values in data["created"]:
+            instance.__created[entity] = cls.__decode_values(values, decode)
+        instance.__destroyed.update(data["destroyed"])
+        for entity, values, removed in data["changed"]:
+            changes = cls.__decode_values(values, decode)
+            changes.update(dict.fromkeys(removed, _REMOVED))
+            instance.__changed[entity] = changes
+        return instance
+
+    @staticmethod
+    def __encode_values(values, encode):
+        """
+        Converts the components of an entity into JSON values.
+
+        :param values: Dictionary mapping component names to their values.
+        :param encode: Function converting objects into JSON values.
+        :return: Dictionary mapping component names to JSON values.
+        """
+        encoded = {}
+        for component, value in values.items():
+            dtype = Components.SCHEMA[component]
+            if dtype is None:
+                encoded[component] = None
+                continue
+            column = np.zeros(1, dtype=dtype)
+            column[0] = value
+            encoded[component] = Archetype.encode_column(column, encode)[0]
+        return encoded
+
+    @staticmethod
+    def __decode_values(values, decode):
+        """
+        Converts the JSON values of the components of an entity back into
+        component values.
+
+        :param values: Dictionary created by __encode_values.
+        :param decode: Function converting JSON values back into objects.
+        :return: Dictionary mapping component names to their values.
+        """
+        decoded = {}
+        for component, value in values.items():
+            dtype = Components.SCHEMA[component]
+            if dtype is None:
+                decoded[component] = None
+                continue
+            decoded[component] = Archetype.decode_column(
+                dtype, [value], decode)[0]
+        return decoded
+
+    def __remove(self, entities):
+        """
+        Removes entities from their archetypes and updates the rows of the
+        entities shifted in their place.
+
+        :param entities: Ids of the entities.
+        """
+        rows = {}
+        for entity in entities:
+            archetype, row = self.__locations[entity]
+            rows.setdefault(archetype, []).append(row)
+        for archetype, indices in rows.items():
+            first = archetype.remove(indices)
+            for row, entity in enumerate(
+                    archetype.entities[first:].tolist(), first):
+                self.__locations[entity] = (archetype, row)
+
+    def __insert(self, entities):
+        """
+        Appends entities to the archetypes of their component sets.
+
+        :param entities: Dictionary mapping entity ids to their components.
+        """
+        batches = {}
+        for entity, values in entities.items():
+            batches.setdefault(frozenset(values), []).append(entity)
+        for components, batch in batches.items():
+            archetype = self.__archetypes.get(components)
+            if archetype is None:
+                archetype = Archetype(components)
+                self.__archetypes[components] = archetype
+                self.__queries.clear()
+            first = archetype.extend(batch,
+                                     [entities[entity] for entity in batch])
+            for row, entity in enumerate(batch, first):
+                self.__locations[entity] = (archetype, row)
+
+    @staticmethod
+    def __matches(components, include, exclude):
+        """
+        Checks whether a component set satisfies a query.
+
+        :param components: The component set.
+        :param include: Components that must be present.
+        :param exclude: Components that must be absent.
+        :return: True if the set matches, False otherwise.
+        """
+        return include.issubset(components) and exclude.isdisjoint(
+            components)
@@ -1,8 +1,11 @@
+import bisect
 import math
 
+import numpy as np
 import pygame
 
 from config.Constants import Constants
+from src.utils.TextureAtlas import TextureAtlas
 
 
 class Block(pygame.sprite.Sprite):
@@ -20,10 +23,9 @@ class Block(pygame.sprite.Sprite):
         :param height: Height of the block
         """
         super().__init__()
-        self.__texture = pygame.image.load(
-            "assets/sprites/Tile.png").convert_alpha()
-        self.image = pygame.transform.scale(self.__texture, (
-        math.ceil(width), math.ceil(height)))
+        # Blocks of the same size share the scaled tile
+        self.image = TextureAtlas().image(
+            "assets/sprites/Tile.png", (math.ceil(width), math.ceil(height)))
         self.rect = self.image.get_rect()
         self.rect.topleft = (x, y)
 
@@ -40,6 +42,7 @@ class Terrain(pygame.sprite.Group):
         :param terrain: Matrix where 'X' represents a block and other characters represent empty space
         """
         super().__init__()
+        self.__grid = list(terrain)
 
         num_blocks_horizontal = len(terrain[0])
         num_blocks_vertical = len(terrain)
@@ -55,11 +58,236 @@ class Terrain(pygame.sprite.Group):
                     block = Block(x, y, width, height)
                     self.add(block)
 
+        self.__build_heightmap()
+
+    def __build_heightmap(self):
+        """
+        Precomputes, for every block column, the sorted y coordinates of the
+        exposed block tops, so that ground queries do not need to scan the
+        whole terrain.
+        """
+        blocks = self.sprites()
+        self.__column_width = min(
+            (block.rect.width for block in blocks), default=Constants.WIDTH)
+        self.__row_height = min(
+            (block.rect.height for block in blocks), default=Constants.HEIGHT)
+        self.__num_columns = math.ceil(Constants.WIDTH / self.__column_width)
+        self.__num_rows = math.ceil(Constants.HEIGHT / self.__row_height)
+
+        spans = [[] for _ in range(self.__num_columns)]
+        self.__occupancy = [[False] * self.__num_columns
+                            for _ in range(self.__num_rows)]
+        for block in blocks:
+            first, last = self.__columns_spanned(block.rect.left,
+                                                 block.rect.right)
+            first_row, last_row = self.__rows_spanned(block.rect.top,
+                                                      block.rect.bottom)
+            for column in range(first, last + 1):
+                spans[column].append((block.rect.top, block.rect.bottom))
+                for row in range(first_row, last_row + 1):
+                    self.__occupancy[row][column] = True
+
+        self.__surfaces = []
+        for column_spans in spans:
+            column_spans.sort()
+            surfaces = []
+            covered_until = None
+            for top, bottom in column_spans:
+                if covered_until is None or top > covered_until:
+                    surfaces.append(top)
+                    covered_until = bottom
+                else:
+                    covered_until = max(covered_until, bottom)
+            self.__surfaces.append(surfaces)
+
+        self.__heightmap = np.array(
+            [surfaces[0] if surfaces else Constants.HEIGHT
+             for surfaces in self.__surfaces])
+
+    def __columns_spanned(self, left, right):
+        """
+        Returns the first and last heightmap columns overlapped by a
+        horizontal span, clamped to the screen.
+
+        :param left: Left x coordinate of the span.
+        :param right: Right x coordinate of the span (exclusive).
+        :return: Tuple with the first and last column indices.
+        """
+        first = int(left // self.__column_width)
+        last = int((max(right, left + 1) - 1) // self.__column_width)
+        return max(first, 0), min(last, self.__num_columns - 1)
+
+    def __rows_spanned(self, top, bottom):
+        """
+        Returns the first and last grid rows overlapped by a vertical span,
+        clamped to the screen.
+
+        :param top: Top y coordinate of the span.
+        :param bottom: Bottom y coordinate of the span (exclusive).
+        :return: Tuple with the first and last row indices.
+        """
+        first = int(top // self.__row_height)
+        last = int((max(bottom, top + 1) - 1) // self.__row_height)
+        return max(first, 0), min(last, self.__num_rows - 1)
+
+    def collides_rect(self, rect):
+        """
+        Checks whether a rect overlaps any terrain block, looking only at
+        the grid cells it covers.
+
+        :param rect: Rect to be tested.
+        :return: True if the rect overlaps the terrain, False otherwise.
+        """
+        if (rect.right <= 0 or rect.left >= Constants.WIDTH or
+                rect.bottom <= 0 or rect.top >= Constants.HEIGHT):
+            return False
+        first, last = self.__columns_spanned(rect.left, rect.right)
+        first_row, last_row = self.__rows_spanned(rect.top, rect.bottom)
+        for row in range(first_row, last_row + 1):
+            cells = self.__occupancy[row]
+            for column in range(first, last + 1):
+                if cells[column]:
+                    return True
+        return False
+
+    def segment_collision(self, start, end):
+        """
+        Walks the terrain grid along a segment (Amanatides-Woo traversal)
+        and finds where it first enters a block.
+
+        :param start: Segment start point.
+        :param end: Segment end point.
+        :return: Fraction of the segment (0 to 1) at the entry point, or
+            None if the segment does not touch the terrain.
+        """
+        dx = end[0] - start[0]
+        dy = end[1] - start[1]
+
+        # Clip the segment to the grid area before walking it
+        t_min, t_max = 0.0, 1.0
+        for origin, delta, high in ((start[0], dx, Constants.WIDTH),
+                                    (start[1], dy, Constants.HEIGHT)):
+            if abs(delta) < Constants.EPSILON:
+                if origin < 0 or origin >= high:
+                    return None
+                continue
+            t_low = (0 - origin) / delta
+            t_high = (high - origin) / delta
+            if t_low > t_high:
+                t_low, t_high = t_high, t_low
+            t_min = max(t_min, t_low)
+            t_max = min(t_max, t_high)
+        if t_min > t_max:
+            return None
+
+        x = start[0] + dx * t_min
+        y = start[1] + dy * t_min
+        column = min(int(x // self.__column_width), self.__num_columns - 1)
+        row = min(int(y // self.__row_height), self.__num_rows - 1)
+
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        if abs(dx) < Constants.EPSILON:
+            t_next_x = t_delta_x = float("inf")
+        else:
+            boundary = (column + (step_x > 0)) * self.__column_width
+            t_next_x = (boundary - start[0]) / dx
+            t_delta_x = self.__column_width / abs(dx)
+        if abs(dy) < Constants.EPSILON:
+            t_next_y = t_delta_y = float("inf")
+        else:
+            boundary = (row + (step_y > 0)) * self.__row_height
+            t_next_y = (boundary - start[1]) / dy
+            t_delta_y = self.__row_height / abs(dy)
+
+        t = t_min
+        while t <= t_max:
+            if not (0 <= column < self.__num_columns and
+                    0 <= row < self.__num_rows):
+                return None
+            if self.__occupancy[row][column]:
+                return t
+            if t_next_x < t_next_y:
+                t = t_next_x
+                t_next_x += t_delta_x
+                column += step_x
+            else:
+                t = t_next_y
+                t_next_y += t_delta_y
+                row += step_y
+        return None
+
+    @property
+    def heightmap(self):
+        """
+        Returns the y coordinate of the topmost surface of each block column.
+        Columns without blocks hold the screen height.
+
+        :return: Numpy array with one entry per column.
+        """
+        return self.__heightmap
+
+    def above_surface(self, lefts, rights, bottoms):
+        """
+        Tells, for many rects at once, whether each one lies entirely above
+        the topmost surface of the columns it spans and so cannot touch the
+        terrain. Rects spanning more than two columns are compared with
+        the highest surface of the whole terrain.
+
+        :param lefts: Array with the left x coordinate of each rect.
+        :param rights: Array with the right x coordinate of each rect.
+        :param bottoms: Array with the bottom y coordinate of each rect.
+        :return: Boolean array, True where the rect is above the terrain.
+        """
+        last_column = self.__num_columns - 1
+        first = np.clip(lefts // self.__column_width, 0,
+                        last_column).astype(int)
+        last = np.clip((np.maximum(rights, lefts + 1) - 1)
+                       // self.__column_width, 0, last_column).astype(int)
+        surface = np.minimum(self.__heightmap[first],
+                             self.__heightmap[last])
+        surface[last - first > 1] = self.__heightmap.min()
+        return bottoms <= surface
+
+    def ground_below(self, rect):
+        """
+        Finds the first terrain surface at or below the bottom of a rect.
+
+        :param rect: Rect whose horizontal span is checked.
+        :return: Y coordinate of the surface, or None if there is no ground.
+        """
+        first, last = self.__columns_spanned(rect.left, rect.right)
+        ground = None
+        for column in range(first, last + 1):
+            surfaces = self.__surfaces[column]
+            index = bisect.bisect_left(surfaces, rect.bottom)
+            if index < len(surfaces) and (
+                    ground is None or surfaces[index] < ground):
+                ground = surfaces[index]
+        return ground
+
+    def time_until_impact(self, rect, vertical_speed):
+        """
+        Computes how long a rect falling at constant speed takes to reach
+        the ground below it.
+
+        :param rect: Falling rect.
+        :param vertical_speed: Downward speed in pixels per second.
+        :return: Time until impact, or None if it never touches the ground.
+        """
+        ground = self.ground_below(rect)
+        if ground is None or vertical_speed <= 0:
+            return None
+        return (ground - rect.bottom) / vertical_speed
+
     def to_dict(self):
         """
         Converts the Terrain state into a dictionary.
-        Each block's position and dimensions are stored.
+        The matrix the terrain was built from is stored; terrains restored
+        from their blocks store each block's position and dimensions.
         """
+        if self.__grid is not None:
+            return {"grid": list(self.__grid)}
         blocks = []
         for sprite in self.sprites():
             blocks.append({
@@ -75,10 +303,14 @@ class Terrain(pygame.sprite.Group):
     def from_dict(cls, data):
         """
         Creates an instance of Terrain from a dictionary.
-        The dictionary should contain a list of blocks with their positions and dimensions.
+        The dictionary should contain the terrain matrix or a list of blocks
+        with their positions and dimensions.
         """
+        if "grid" in data:
+            return cls(data["grid"])
         instance = cls.__new__(cls)
         pygame.sprite.Group.__init__(instance)
+        instance.__grid = None
         for block_data in data.get("blocks", []):
             topleft = block_data["topleft"]
             width = block_data["width"]
@@ -87,4 +319,5 @@ class Terrain(pygame.sprite.Group):
             y = topleft[1]
             block = Block(x, y, width, height)
             instance.add(block)
+        instance.__build_heightmap()
         return instance
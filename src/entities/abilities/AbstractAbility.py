@@ -3,7 +3,7 @@ from abc import ABC, abstractmethod
 import pygame
 
 from config.Constants import Constants
-from src.utils.AudioManager import AudioManager
+from src.utils.EventBus import EventBus
 
 
 class AbstractAbility(pygame.sprite.Sprite, ABC):
@@ -23,7 +23,7 @@ class AbstractAbility(pygame.sprite.Sprite, ABC):
         self._image = None
         self._damage = Constants.ABILITY_DEFAULT_DAMAGE
         self._lifetime = None
-        self._audio_manager = AudioManager()
+        self._events = EventBus()
 
     @property
     def damage(self):
@@ -37,3 +37,20 @@ class AbstractAbility(pygame.sprite.Sprite, ABC):
     @abstractmethod
     def generate(self, target, dt, abilities_group):
         pass
+
+    def snapshot(self):
+        """
+        Converts the state the ability keeps between uses into a
+        dictionary.
+
+        :return: A dictionary representing the ability state.
+        """
+        return {}
+
+    def restore(self, data):
+        """
+        Restores the state of the ability from a dictionary.
+
+        :param data: Dictionary created by snapshot.
+        """
+        pass
@@ -4,6 +4,8 @@ from config.Constants import Constants, Sounds
 from src.entities.abilities.AbstractAbility import AbstractAbility
 from src.entities.projectiles.AbilityProjectile import ProjectileAbility
 from src.entities.projectiles.ProjectileGenerator import ProjectileGenerator
+from src.utils.Events import Events
+from src.utils.TextureAtlas import TextureAtlas
 
 
 class CriticalShot(AbstractAbility):
@@ -22,10 +24,9 @@ class CriticalShot(AbstractAbility):
         self._speed = Constants.CRITICAL_SHOT_SPEED
         self._damage = Constants.CRITICAL_DAMAGE
         self._lifetime = Constants.CRITICAL_SHOT_LIFETIME
-        critical_shot_image = pygame.image.load(
-            "assets/sprites/projectiles/SpecialPrecisionRifleProjectile.png").convert_alpha()
-        critical_shot_image = pygame.transform.scale(
-            critical_shot_image, (25, 25))
+        critical_shot_image = TextureAtlas().image(
+            "assets/sprites/projectiles/SpecialPrecisionRifleProjectile.png",
+            (25, 25))
         self._image = critical_shot_image
 
     def generate(self, target, dt, projectiles):
@@ -34,7 +35,7 @@ class CriticalShot(AbstractAbility):
 
         :param target: Point where the shot is aimed
         :param dt: Duration of one iteration (delta time)
-        :param projectiles: Sprite group to add the projectile to
+        :param projectiles: Group tag of the projectile
         """
         import math
         if hasattr(self._agent, "get_projectile_origin"):
@@ -50,7 +51,8 @@ class CriticalShot(AbstractAbility):
         position = pygame.math.Vector2(origin)
         enhanced_image = self.__apply_glow_effect(self._image)
 
-        projectile = ProjectileAbility(
+        ProjectileAbility.spawn(
+            projectiles,
             position,
             angle,
             velocity,
@@ -58,9 +60,7 @@ class CriticalShot(AbstractAbility):
             self._damage,
             self._lifetime
         )
-
-        projectiles.add(projectile)
-        self._audio_manager.play_sound(Sounds.CRITICAL_SHOT)
+        self._events.publish(Events.Fired(origin, Sounds.CRITICAL_SHOT))
 
         return True
 
@@ -1,10 +1,14 @@
 import numpy as np
 import pygame
 
-from config.Constants import Constants, Colors, Sounds
+from config.Constants import Constants, RandomStreams, Sounds
+from src.ecs.Components import Components
 from src.entities.abilities.AbstractAbility import AbstractAbility
 from src.entities.projectiles.AbilityProjectile import ProjectileAbility
 from src.entities.projectiles.ProjectileGenerator import ProjectileGenerator
+from src.utils.Events import Events
+from src.utils.QualityGovernor import QualityGovernor
+from src.utils.RandomService import RandomService
 
 
 class LaserBeam(AbstractAbility):
@@ -25,6 +29,13 @@ class LaserBeam(AbstractAbility):
         self.__width_laser = Constants.LASER_WIDTH
         self.__laser_color = Constants.COLOR_LASER
         self.__glow_color = Constants.GLOW_COLOR_LASER
+        self.__quality_governor = QualityGovernor()
+        self.__random = RandomService()
+        # Game time drives the wave, so replays place the segments again
+        self.__elapsed_time = 0
+        self.__segment_surfaces = [
+            self.__create_segment_surface(Constants.SEGMENT_LASER_LENGTH)
+            for _ in range(Constants.LASER_SEGMENT_VARIANTS)]
 
     def generate(self, target, dt, beams):
         """
@@ -32,7 +43,7 @@ class LaserBeam(AbstractAbility):
 
         :param target: Point where the laser is aimed
         :param dt: Duration of one iteration
-        :param beams: Sprite group to add the segments to
+        :param beams: Group tag of the segments
         """
         if hasattr(self._agent, "get_projectile_origin"):
             origin = self._agent.get_projectile_origin()
@@ -43,25 +54,48 @@ class LaserBeam(AbstractAbility):
         direction = pygame.math.Vector2(np.cos(angle), np.sin(angle))
         safe_distance = self._agent.rect.width / 2
         beam_start = origin + direction * safe_distance
+        self.__elapsed_time += dt
         self.__create_laser_segments(beam_start, direction, beams)
-        self._audio_manager.play_sound(Sounds.LASER_BEAM)
+        self._events.publish(Events.Fired(origin, Sounds.LASER_BEAM))
 
         return True
 
+    def snapshot(self):
+        """
+        Converts the game time driving the wave into a dictionary.
+
+        :return: A dictionary representing the laser state.
+        """
+        return {"elapsed_time": self.__elapsed_time}
+
+    def restore(self, data):
+        """
+        Restores the game time driving the wave from a dictionary.
+
+        :param data: Dictionary created by snapshot.
+        """
+        self.__elapsed_time = data["elapsed_time"]
+
     def __create_laser_segments(self, start_pos, direction, beams):
         """
         Creates laser segments with a fluid effect
 
         :param start_pos: Starting position of the laser
         :param direction: Direction of the laser
-        :param beams: Sprite group to add the segments to
+        :param beams: Group tag of the segments
         """
         max_length = Constants.LIMIT_WIDTH_LASER
         segment_length = Constants.SEGMENT_LASER_LENGTH
         num_segments = int(max_length / segment_length)
-        time_factor = pygame.time.get_ticks() / Constants.LASER_TIME_DIVISOR
-
-        for i in range(num_segments):
+        time_factor = (self.__elapsed_time * 1000
+                       / Constants.LASER_TIME_DIVISOR)
+        effects_random = self.__random.numpy_stream(RandomStreams.EFFECTS)
+        # Segments overlap, so lower quality tiers skip some of them and
+        # give the remaining ones the damage of the skipped ones
+        step = self.__quality_governor.get("laser_segment_step")
+        segment_damage = self._damage * step / num_segments
+
+        for i in range(0, num_segments, step):
             segment_start = start_pos + direction * i * segment_length * 0.2
             if not (
                     0 <= segment_start.x <= Constants.WIDTH and 0 <= segment_start.y <= Constants.HEIGHT):
@@ -71,23 +105,21 @@ class LaserBeam(AbstractAbility):
             wave_offset = np.sin(time_factor + i * 0.2) * (
                     self.__width_laser * 0.2)
             segment_pos = segment_start + perpendicular * wave_offset
-            segment_surface = self.__create_segment_surface(segment_length)
+            segment_surface = self.__segment_surfaces[
+                effects_random.integers(len(self.__segment_surfaces))]
             angle = np.arctan2(direction.y, direction.x)
 
-            laser_segment = ProjectileAbility(
+            # Segments spark where they hit an enemy
+            ProjectileAbility.spawn(
+                beams,
                 segment_pos,
                 angle,
                 direction,
                 segment_surface,
-                self._damage / num_segments,
-                self._lifetime
+                segment_damage,
+                self._lifetime,
+                components={Components.HIT_EFFECT: None}
             )
-            laser_segment.explosion_radius = Constants.EXPLOSION_RADIUS
-            laser_segment.explosion_damage = 0
-            laser_segment.create_hit_effect = self.create_hit_effect
-            laser_segment.has_hit = False
-
-            beams.add(laser_segment)
 
     def __create_segment_surface(self, length):
         """
@@ -111,8 +143,9 @@ class LaserBeam(AbstractAbility):
             (length, surface.get_height() // 2),
             int(self.__width_laser)
         )
+        effects_random = self.__random.numpy_stream(RandomStreams.EFFECTS)
         for _ in range(2):
-            pos_x = np.random.randint(0, length)
+            pos_x = effects_random.integers(0, length)
             pygame.draw.circle(
                 surface,
                 Constants.COLOR_LASER_CORE,
@@ -121,40 +154,3 @@ class LaserBeam(AbstractAbility):
             )
 
         return surface
-
-    def __draw_hit_effect(self, radius):
-        """
-        Creates an explosion effect
-
-        :param radius: Radius of the hit effect
-        """
-        surface_size = radius * 2
-        image_hit_effect = pygame.Surface((surface_size, surface_size),
-                                          pygame.SRCALPHA)
-        pygame.draw.circle(image_hit_effect, Colors.RED_GLOW,
-                           (radius, radius), radius * 0.3)
-        return image_hit_effect
-
-    def create_hit_effect(self, laser, ability_projectiles):
-        """
-        Creates an effect when a laser is hit
-
-        :param laser: The laser that was hit
-        :param ability_projectiles: Group to add the explosion effect to
-        """
-        if not laser.has_hit:
-            image_explosion = self.__draw_hit_effect(laser.explosion_radius)
-
-            effect = ProjectileAbility(
-                pygame.math.Vector2(laser.rect.center),
-                0,
-                pygame.math.Vector2(0, 0),
-                image_explosion,
-                laser.explosion_damage,
-                Constants.HIT_LIFETIME
-            )
-            effect.radio = laser.explosion_radius
-            ability_projectiles.add(effect)
-            laser.has_hit = True
-            return effect
-        return None
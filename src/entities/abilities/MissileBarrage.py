@@ -1,10 +1,13 @@
 import numpy as np
 import pygame
 
-from config.Constants import Constants, Colors, Sounds
+from config.Constants import Constants, Sounds
+from src.ecs.Components import Components
 from src.entities.abilities.AbstractAbility import AbstractAbility
 from src.entities.projectiles.AbilityProjectile import ProjectileAbility
 from src.entities.projectiles.ProjectileGenerator import ProjectileGenerator
+from src.utils.Events import Events
+from src.utils.TextureAtlas import TextureAtlas
 
 
 class MissileBarrage(AbstractAbility):
@@ -26,10 +29,9 @@ class MissileBarrage(AbstractAbility):
         self.__num_missiles = Constants.MISSILE_SHOT_CAPACITY
         self.__angle_spread = Constants.ANGLE_SPREAD_MISSILE * (np.pi / 180)
         self.__explosion_radius = Constants.EXPLOSION_RADIUS
-        missile_image = pygame.image.load(
-            "assets/sprites/projectiles/MissileLauncherProjectile.png").convert_alpha()
-        missile_image = pygame.transform.scale(
-            missile_image, (30, 30))
+        missile_image = TextureAtlas().image(
+            "assets/sprites/projectiles/MissileLauncherProjectile.png",
+            (30, 30))
         self._image = missile_image
 
     def generate(self, missile_target, dt, missiles):
@@ -38,7 +40,7 @@ class MissileBarrage(AbstractAbility):
 
         :param missile_target: Point where the center missile will be headed.
         :param dt: The duration of one iteration.
-        :param missiles: Missiles sprite group.
+        :param missiles: Group tag of the missiles.
         """
 
         if hasattr(self._agent, "get_projectile_origin"):
@@ -62,76 +64,31 @@ class MissileBarrage(AbstractAbility):
             velocity.x = self._speed * np.cos(missile_angle)
             velocity.y = self._speed * np.sin(missile_angle)
             initial_position = pygame.math.Vector2(origin)
-            self_collision = True
             temp_position = pygame.math.Vector2(initial_position)
+            missile_rect = pygame.Rect(
+                (0, 0), ProjectileAbility.size(self._image, missile_angle))
 
-            while self_collision:
+            # Missiles leave the launcher before they can hit anything
+            while True:
                 temp_position.x += velocity.x * dt
                 temp_position.y += velocity.y * dt
-                missile = ProjectileAbility(
-                    pygame.math.Vector2(temp_position),
-                    missile_angle,
-                    velocity,
-                    self._image,
-                    self._damage,
-                    self._lifetime
-                )
-                missile.explosion_radius = self.__explosion_radius
-                missile.explosion_damage = self._damage * 0.8
-                missile.create_explosion = self.create_explosion
-                missile.has_exploded = False
-
-                if pygame.sprite.collide_rect(self._agent, missile):
-                    missile.kill()
-                else:
-                    missiles.add(missile)
-                    self_collision = False
+                missile_rect.center = temp_position
+                if not self._agent.rect.colliderect(missile_rect):
+                    break
+
+            # Missiles explode where they hit an enemy
+            ProjectileAbility.spawn(
+                missiles,
+                pygame.math.Vector2(temp_position),
+                missile_angle,
+                velocity,
+                self._image,
+                self._damage,
+                self._lifetime,
+                components={Components.EXPLOSIVE: (
+                    self.__explosion_radius, self._damage * 0.8)}
+            )
 
-        self._audio_manager.play_sound(Sounds.LAUNCHER)
+        self._events.publish(Events.Fired(origin, Sounds.LAUNCHER))
 
         return True
-
-    def __draw_explosion(self, radius, color):
-        """
-        Creates an explosion effect with area of effect damage
-
-        :param radius: Radius of the explosion
-        :param color: Color of the explosion (RGBA)
-        """
-        surface_size = radius * 2
-        image_explosion = pygame.Surface((surface_size, surface_size),
-                                         pygame.SRCALPHA)
-        pygame.draw.circle(image_explosion,
-                           (color[0], color[1], color[2], 80),
-                           (radius, radius), radius)
-        pygame.draw.circle(image_explosion, color,
-                           (radius, radius), radius * 0.7)
-        pygame.draw.circle(image_explosion, Colors.GLOW_WHITE,
-                           (radius, radius), radius * 0.3)
-        return image_explosion
-
-    def create_explosion(self, missile, ability_projectiles):
-        """
-        Creates an explosion effect when a missile is hit
-
-        :param missile: The missile that was hit
-        :param ability_projectiles: Group to add the explosion effect to
-        """
-        if not missile.has_exploded:
-            image_explosion = self.__draw_explosion(missile.explosion_radius,
-                                                    Constants.COLOR_EXPLOSION)
-
-            explosion = ProjectileAbility(
-                pygame.math.Vector2(missile.rect.center),
-                0,
-                pygame.math.Vector2(0, 0),
-                image_explosion,
-                missile.explosion_damage,
-                Constants.HIT_LIFETIME
-            )
-            explosion.radius = missile.explosion_radius
-            ability_projectiles.add(explosion)
-            self._audio_manager.play_sound(Sounds.BOOM)
-            missile.has_exploded = True
-            return explosion
-        return None
@@ -3,11 +3,18 @@ from abc import ABC, abstractmethod
 import pygame
 
 from config.Constants import Constants
+from src.ecs.Components import Components
+from src.ecs.World import World
+from src.utils.AudioManager import AudioManager
+from src.utils.QualityGovernor import QualityGovernor
 
 
 class AbstractEnemy(pygame.sprite.Sprite, ABC):
     """
     Represents an enemy.
+    The enemy drives its own movement and attacks, while its rect and
+    health live in the World so the DamageSystem can hit every enemy at
+    once.
     """
 
     def __init__(self, x=0, y=Constants.HEIGHT / 10):
@@ -19,26 +26,33 @@ class AbstractEnemy(pygame.sprite.Sprite, ABC):
         """
         super().__init__()
         self.original_image = None
+        self.flipped_image = None
         self.image = None
         self.rect = None
         self._speed = Constants.ENEMY_SPEED
-        self._health_points = None
+        self._score = 0
+        self._quality_governor = QualityGovernor()
+        self._world = World()
+        AudioManager().load_bank(type(self).__name__)
         self._initialize_sprite(x, y)
+        self._entity = self._world.create({
+            Components.ENEMY: None,
+            Components.RECT: tuple(self.rect),
+            Components.HEALTH: 0,
+            Components.BEHAVIOUR: self,
+        })
 
     @abstractmethod
     def _initialize_sprite(self, x, y):
         pass
 
-    def update(self, dt, player_projectiles, ability_projectiles,
-               enemies_projectiles, player,
-               terrain=None, speed_multiplier=1.0):
+    def update(self, dt, enemies_projectiles, player, terrain=None,
+               speed_multiplier=1.0):
         """
         Updates the enemy state.
 
-        :param ability_projectiles: projectiles originated from abilities
         :param dt: Time since last update
-        :param player_projectiles: Player projectiles on screen
-        :param enemies_projectiles: Enemies projectiles on screen.
+        :param enemies_projectiles: Group tag of the enemies projectiles.
         :param player: The player to be targeted.
         :param terrain: Terrain sprite group (optional)
         :param speed_multiplier: increases the enemy speed.
@@ -47,10 +61,12 @@ class AbstractEnemy(pygame.sprite.Sprite, ABC):
 
         self._move(dt, terrain)
         self._limit_bounds()
-        self._compute_damage(player_projectiles, ability_projectiles)
         self._update_sprite(self._speed)
+        self._sync_body()
 
-        if player:
+        projectile_cap = self._quality_governor.get("enemy_projectile_cap")
+        if player and (projectile_cap is None or self._world.count(
+                enemies_projectiles) < projectile_cap):
             target = pygame.math.Vector2(player.sprite.rect.centerx,
                                          player.sprite.rect.centery)
             self._attack(dt, target, enemies_projectiles)
@@ -71,8 +87,7 @@ class AbstractEnemy(pygame.sprite.Sprite, ABC):
         if velocity_x > 0:
             self.image = self.original_image
         else:
-            self.image = pygame.transform.flip(self.original_image, True,
-                                               False)
+            self.image = self.flipped_image
 
     def _limit_bounds(self):
         """
@@ -93,45 +108,49 @@ class AbstractEnemy(pygame.sprite.Sprite, ABC):
             out_of_bounds = True
         return out_of_bounds
 
-    def _compute_damage(self, player_projectiles, ability_projectiles):
+    def _sync_body(self):
         """
-        Computes projectile collision and damage taken.
-
-        :param player_projectiles: Player projectiles on screen.
+        Copies the rect of the enemy to its entity.
         """
+        self._world.set(self._entity, Components.RECT, tuple(self.rect))
 
-        for projectile in player_projectiles:
-            if pygame.sprite.collide_rect(self, projectile):
-                self._health_points -= projectile.damage
-                projectile.kill()
+    @abstractmethod
+    def _attack(self, dt, target, projectiles):
+        pass
 
-        for ability in ability_projectiles:
-            if hasattr(ability, 'radius'):
-                distance = pygame.math.Vector2(
-                    ability.rect.centerx - self.rect.centerx,
-                    ability.rect.centery - self.rect.centery
-                ).length()
+    def kill(self):
+        """
+        Removes the enemy from its groups and destroys its entity.
+        """
+        super().kill()
+        self._world.destroy(self._entity)
 
-                if distance <= ability.radius:
-                    distance_factor = 1 - (distance / ability.radius)
-                    actual_damage = ability.damage * distance_factor
-                    self._health_points -= actual_damage
+    @property
+    def _health_points(self):
+        """
+        Returns the current enemy health, stored in its entity.
 
-            elif pygame.sprite.collide_rect(self, ability):
-                self._health_points -= ability.damage
+        :return: Current health points
+        """
+        return float(self._world.get(self._entity, Components.HEALTH))
 
-                if hasattr(ability,
-                           'create_explosion') and not ability.has_exploded:
-                    ability.create_explosion(ability, ability_projectiles)
-                elif hasattr(ability,
-                             'create_hit_effect') and not ability.has_hit:
-                    ability.create_hit_effect(ability, ability_projectiles)
+    @_health_points.setter
+    def _health_points(self, health_points):
+        """
+        Changes the current enemy health.
 
-                ability.kill()
+        :param health_points: New health points
+        """
+        self._world.set(self._entity, Components.HEALTH, health_points)
 
-    @abstractmethod
-    def _attack(self, dt, target, projectiles):
-        pass
+    @property
+    def score(self):
+        """
+        Returns the points awarded for killing the enemy.
+
+        :return: Score of the enemy
+        """
+        return self._score
 
     @property
     def health(self):
@@ -153,3 +172,29 @@ class AbstractEnemy(pygame.sprite.Sprite, ABC):
             "health": self._health_points,
             "speed": self._speed,
         }
+
+    def snapshot(self):
+        """
+        Converts the state the enemy keeps outside the World, and the id
+        of its entity, into a dictionary.
+
+        :return: A dictionary from which restore resumes the enemy.
+        """
+        return {
+            "type": self.__class__.__name__,
+            "entity": self._entity,
+            "rect": list(self.rect),
+            "speed": self._speed,
+        }
+
+    def restore(self, data):
+        """
+        Restores the enemy state from a dictionary. The entity it refers to
+        is restored with the World.
+
+        :param data: Dictionary created by snapshot.
+        """
+        self._entity = data["entity"]
+        self.rect = pygame.Rect(data["rect"])
+        self._speed = data["speed"]
+        self._update_sprite(self._speed)
@@ -1,10 +1,13 @@
-import random
-
 import pygame
 
-from config.Constants import Constants, Sounds
+from config.Constants import Constants, RandomStreams, Sounds
+from src.ecs.HitBuffer import HitBuffer
+from src.ecs.Hits import Hits
 from src.entities.enemies.AbstractEnemy import AbstractEnemy
-from src.utils.AudioManager import AudioManager
+from src.utils.EventBus import EventBus
+from src.utils.Events import Events
+from src.utils.RandomService import RandomService
+from src.utils.TextureAtlas import TextureAtlas
 
 
 class BouncingEnemy(AbstractEnemy):
@@ -30,17 +33,15 @@ class BouncingEnemy(AbstractEnemy):
         """
         super().__init__(x=x, y=y)
         self._health_points = Constants.BOUNCING_ENEMY_MAX_HEALTH
+        self._score = Constants.BOUNCING_ENEMY_SCORE
         self._speed = -Constants.BOUNCING_ENEMY_HORIZONTAL_SPEED
         self._update_sprite(self._speed)
         self.__state = self.MOVING
         self.__timer = 0
         self.__wait_timer = 0
-        self.__fall_time = random.uniform(
-            Constants.BOUNCING_ENEMY_MIN_TIME_BEFORE_FALL,
-            Constants.BOUNCING_ENEMY_MAX_TIME_BEFORE_FALL
-        )
+        self.__fall_time = self.__random_fall_time()
         self.__original_y = y
-        self.__audio_manager = AudioManager()
+        self.__ground_y = None
 
     def _initialize_sprite(self, x, y):
         """
@@ -49,10 +50,12 @@ class BouncingEnemy(AbstractEnemy):
         :param x: Initial x coordinate
         :param y: Initial y coordinate
         """
-        self.original_image = pygame.image.load(
-            "assets/sprites/enemies/BouncingEnemy.png").convert_alpha()
-        self.original_image = pygame.transform.scale(self.original_image, (
-            Constants.BOUNCING_ENEMY_WIDTH, Constants.BOUNCING_ENEMY_HEIGHT))
+        size = (Constants.BOUNCING_ENEMY_WIDTH,
+                Constants.BOUNCING_ENEMY_HEIGHT)
+        self.original_image = TextureAtlas().image(
+            "assets/sprites/enemies/BouncingEnemy.png", size)
+        self.flipped_image = TextureAtlas().image(
+            "assets/sprites/enemies/BouncingEnemy.png", size, flipped=True)
         self.rect = self.original_image.get_rect(center=(x, y))
 
     def _move(self, dt, terrain=None):
@@ -76,18 +79,25 @@ class BouncingEnemy(AbstractEnemy):
 
 
         elif self.__state == self.FALLING:
+            # Ground is looked up once, when the fall begins
+            if terrain and self.__ground_y is None:
+                ground = terrain.ground_below(self.rect)
+                self.__ground_y = Constants.HEIGHT if ground is None \
+                    else ground
+
             # Fast falling movement
             self.rect.y += Constants.BOUNCING_ENEMY_FALL_SPEED * dt
 
-            # Check terrain collision
-            if terrain:
-                hits = pygame.sprite.spritecollide(self, terrain, False)
-                if hits:
-                    self.__audio_manager.play_sound(Sounds.STOMP)
-                    self.rect.bottom = hits[0].rect.top
-                    self.__state = self.WAITING
-                    self.__timer = 0
-                    return
+            # Check landing
+            if (self.__ground_y is not None and
+                    self.rect.bottom > self.__ground_y):
+                EventBus().publish(Events.Landed(self.rect.midbottom,
+                                                 Sounds.STOMP))
+                self.rect.bottom = self.__ground_y
+                self.__ground_y = None
+                self.__state = self.WAITING
+                self.__timer = 0
+                return
 
         elif self.__state == self.RISING:
             # Slow rising movement
@@ -96,10 +106,7 @@ class BouncingEnemy(AbstractEnemy):
                 # Only change state, don't force Y position
                 self.__state = self.MOVING
                 self.__timer = 0
-                self.__fall_time = random.uniform(
-                    Constants.BOUNCING_ENEMY_MIN_TIME_BEFORE_FALL,
-                    Constants.BOUNCING_ENEMY_MAX_TIME_BEFORE_FALL
-                )
+                self.__fall_time = self.__random_fall_time()
         self.__update_behavior(dt)
 
     def __update_behavior(self, dt):
@@ -130,30 +137,39 @@ class BouncingEnemy(AbstractEnemy):
                 self.__state = self.RISING
                 self.__timer = 0
 
+    @staticmethod
+    def __random_fall_time():
+        """
+        Draws how long the enemy moves horizontally before dropping.
+
+        :return: Time before the next fall in seconds.
+        """
+        return RandomService().stream(RandomStreams.ENEMIES).uniform(
+            Constants.BOUNCING_ENEMY_MIN_TIME_BEFORE_FALL,
+            Constants.BOUNCING_ENEMY_MAX_TIME_BEFORE_FALL)
+
     def _attack(self, dt, target, enemies_projectiles):
         # Checks for collision during fall
         if (self.__state == self.FALLING and target and
                 pygame.sprite.collide_rect(self, target.sprite)):
-            target.sprite.inflict_damage(Constants.BOUNCING_ENEMY_FALL_DAMAGE)
+            HitBuffer().add(Hits.PLAYER, Constants.BOUNCING_ENEMY_FALL_DAMAGE,
+                            Hits.CRUSH, self.rect.center)
 
-    def update(self, dt, player_projectiles, ability_projectiles,
-               enemies_projectiles, player,
-               terrain=None, speed_multiplier=1.0):
+    def update(self, dt, enemies_projectiles, player, terrain=None,
+               speed_multiplier=1.0):
         """
         Updates enemy state and position.
 
         :param dt: Time since last update
-        :param player_projectiles: Player projectiles on screen
-        :param ability_projectiles: Player abilities on screen
-        :param enemies_projectiles: Enemies projectiles on screen
+        :param enemies_projectiles: Group tag of the enemies projectiles
         :param player: Player sprite
         :param terrain: Terrain sprite group
         :param speed_multiplier: Speed multiplier for game difficulty
         """
         self._move(dt, terrain)
         self.__update_behavior(dt)
-        self._compute_damage(player_projectiles, ability_projectiles)
         self._update_sprite(self._speed)
+        self._sync_body()
         self._attack(dt, player, enemies_projectiles)
 
     def to_dict(self):
@@ -169,12 +185,39 @@ class BouncingEnemy(AbstractEnemy):
         data["original_y"] = self.__original_y
         return data
 
+    def snapshot(self):
+        """
+        Adds the fall cycle to the state of the enemy.
+        """
+        data = super().snapshot()
+        data["state"] = self.__state
+        data["timer"] = self.__timer
+        data["wait_timer"] = self.__wait_timer
+        data["fall_time"] = self.__fall_time
+        data["original_y"] = self.__original_y
+        data["ground_y"] = self.__ground_y
+        return data
+
+    def restore(self, data):
+        """
+        Restores the enemy state, including its fall cycle.
+        """
+        super().restore(data)
+        self.__state = data["state"]
+        self.__timer = data["timer"]
+        self.__wait_timer = data["wait_timer"]
+        self.__fall_time = data["fall_time"]
+        self.__original_y = data["original_y"]
+        self.__ground_y = data["ground_y"]
+
     @classmethod
     def from_dict(cls, data):
         """
         Creates an instance of BouncingEnemy from a dictionary.
         """
         instance = cls(data["centerx"], data["bottom"])
+        # The constructor centers the sprite on the given point
+        instance.rect.bottom = data["bottom"]
         instance._health_points = data["health"]
         instance._speed = data["speed"]
         instance._speed = data.get("velocity_x",
@@ -182,8 +225,6 @@ class BouncingEnemy(AbstractEnemy):
         instance.__state = data.get("state", cls.MOVING)
         instance.__timer = data.get("timer", 0)
         instance.__wait_timer = data.get("wait_timer", 0)
-        instance.__fall_time = data.get("fall_time", random.uniform(
-            Constants.BOUNCING_ENEMY_MIN_TIME_BEFORE_FALL,
-            Constants.BOUNCING_ENEMY_MAX_TIME_BEFORE_FALL))
+        instance.__fall_time = data.get("fall_time", instance.__fall_time)
         instance.__original_y = data.get("original_y", instance.rect.centery)
         return instance
@@ -3,6 +3,7 @@ import pygame
 from config.Constants import Constants, Sounds
 from src.entities.enemies.AbstractEnemy import AbstractEnemy
 from src.entities.projectiles.ProjectileGenerator import ProjectileGenerator
+from src.utils.TextureAtlas import TextureAtlas
 
 
 class LinearEnemy(AbstractEnemy):
@@ -19,12 +20,12 @@ class LinearEnemy(AbstractEnemy):
         """
         super().__init__(x=x, y=y)
         self._health_points = Constants.LINEAR_ENEMY_MAX_HEALTH
+        self._score = Constants.LINEAR_ENEMY_SCORE
         self._speed = Constants.LINEAR_ENEMY_SPEED
-        projectile_image = pygame.image.load(
-            "assets/sprites/projectiles/LinearEnemyProjectile.png").convert_alpha()
-        projectile_image = pygame.transform.scale(projectile_image, (
-            Constants.LINEAR_ENEMY_PROJECTILE_WIDTH,
-            Constants.LINEAR_ENEMY_PROJECTILE_HEIGHT))
+        projectile_image = TextureAtlas().image(
+            "assets/sprites/projectiles/LinearEnemyProjectile.png",
+            (Constants.LINEAR_ENEMY_PROJECTILE_WIDTH,
+             Constants.LINEAR_ENEMY_PROJECTILE_HEIGHT))
 
         self.__projectile_generator = ProjectileGenerator(
             Constants.LINEAR_ENEMY_PROJECTILE_SPEED,
@@ -41,10 +42,11 @@ class LinearEnemy(AbstractEnemy):
         :param x: Initial x coordinate
         :param y: Initial y coordinate
         """
-        self.original_image = pygame.image.load(
-            "assets/sprites/enemies/LinearEnemy.png").convert_alpha()
-        self.original_image = pygame.transform.scale(self.original_image, (
-            Constants.LINEAR_ENEMY_WIDTH, Constants.LINEAR_ENEMY_HEIGHT))
+        size = (Constants.LINEAR_ENEMY_WIDTH, Constants.LINEAR_ENEMY_HEIGHT)
+        self.original_image = TextureAtlas().image(
+            "assets/sprites/enemies/LinearEnemy.png", size)
+        self.flipped_image = TextureAtlas().image(
+            "assets/sprites/enemies/LinearEnemy.png", size, flipped=True)
         self.rect = self.original_image.get_rect(center=(x, y))
 
     def _move(self, dt, terrain=None):
@@ -76,12 +78,30 @@ class LinearEnemy(AbstractEnemy):
         """
         return super().to_dict()
 
+    def snapshot(self):
+        """
+        Adds the firing timer to the state of the enemy.
+        """
+        data = super().snapshot()
+        data["projectile_generator"] = \
+            self.__projectile_generator.snapshot()
+        return data
+
+    def restore(self, data):
+        """
+        Restores the enemy state, including its firing timer.
+        """
+        super().restore(data)
+        self.__projectile_generator.restore(data["projectile_generator"])
+
     @classmethod
     def from_dict(cls, data):
         """
         Creates an instance of LinearEnemy from a dictionary.
         """
         instance = cls(data["centerx"], data["bottom"])
+        # The constructor centers the sprite on the given point
+        instance.rect.bottom = data["bottom"]
         instance._health_points = data["health"]
         instance._speed = data["speed"]
         return instance
@@ -3,6 +3,7 @@ import pygame
 from config.Constants import Constants
 from src.entities.enemies.AbstractEnemy import AbstractEnemy
 from src.entities.projectiles.BombProjectile import BombProjectile
+from src.utils.TextureAtlas import TextureAtlas
 
 
 class TankEnemy(AbstractEnemy):
@@ -19,6 +20,7 @@ class TankEnemy(AbstractEnemy):
         """
         super().__init__(x=x, y=y)
         self._health_points = Constants.TANK_ENEMY_MAX_HEALTH
+        self._score = Constants.TANK_ENEMY_SCORE
         self._speed = Constants.TANK_ENEMY_SPEED
         self._update_sprite(self._speed)
         self.__time_since_last_shot = 0
@@ -30,10 +32,11 @@ class TankEnemy(AbstractEnemy):
         :param x: Initial x coordinate
         :param y: Initial y coordinate
         """
-        self.original_image = pygame.image.load(
-            "assets/sprites/enemies/TankEnemy.png").convert_alpha()
-        self.original_image = pygame.transform.scale(self.original_image, (
-            Constants.TANK_ENEMY_WIDTH, Constants.TANK_ENEMY_HEIGHT))
+        size = (Constants.TANK_ENEMY_WIDTH, Constants.TANK_ENEMY_HEIGHT)
+        self.original_image = TextureAtlas().image(
+            "assets/sprites/enemies/TankEnemy.png", size)
+        self.flipped_image = TextureAtlas().image(
+            "assets/sprites/enemies/TankEnemy.png", size, flipped=True)
         self._original_image = self.original_image.copy()
         self.rect = self.original_image.get_rect(center=(x, y))
 
@@ -64,21 +67,21 @@ class TankEnemy(AbstractEnemy):
 
         :param dt: Time since last update
         :param target: Target position (not used for bombs)
-        :param enemies_projectiles: Group of enemy projectiles
+        :param enemies_projectiles: Group tag of the enemy projectiles
         """
         self.__time_since_last_shot += dt
 
         if self.__time_since_last_shot >= Constants.TANK_ENEMY_FIRE_RATE:
             self.__time_since_last_shot = 0
 
-            bomb_image = pygame.image.load(
-                "assets/sprites/projectiles/TankEnemyProjectile.png").convert_alpha()
-            bomb_image = pygame.transform.scale(bomb_image, (
-                Constants.TANK_BOMB_WIDTH, Constants.TANK_BOMB_HEIGHT))
+            bomb_image = TextureAtlas().image(
+                "assets/sprites/projectiles/TankEnemyProjectile.png",
+                (Constants.TANK_BOMB_WIDTH, Constants.TANK_BOMB_HEIGHT))
 
             # Create bomb with vertical velocity
             velocity = pygame.Vector2(0, Constants.TANK_BOMB_SPEED)
-            bomb = BombProjectile(
+            BombProjectile.spawn(
+                enemies_projectiles,
                 position=pygame.Vector2(self.rect.centerx, self.rect.bottom),
                 velocity=velocity,
                 image=bomb_image,
@@ -86,20 +89,35 @@ class TankEnemy(AbstractEnemy):
                 explosion_radius=Constants.TANK_BOMB_EXPLOSION_RADIUS
             )
 
-            enemies_projectiles.add(bomb)
-
     def to_dict(self):
         """
         Converts the enemy's state into a dictionary.
         """
         return super().to_dict()
 
+    def snapshot(self):
+        """
+        Adds the time since the last bomb to the state of the enemy.
+        """
+        data = super().snapshot()
+        data["time_since_last_shot"] = self.__time_since_last_shot
+        return data
+
+    def restore(self, data):
+        """
+        Restores the enemy state, including the time since the last bomb.
+        """
+        super().restore(data)
+        self.__time_since_last_shot = data["time_since_last_shot"]
+
     @classmethod
     def from_dict(cls, data):
         """
         Creates an instance of TankEnemy from a dictionary.
         """
         instance = cls(data["centerx"], data["bottom"])
+        # The constructor centers the sprite on the given point
+        instance.rect.bottom = data["bottom"]
         instance._health_points = data["health"]
         instance._speed = data["speed"]
         return instance
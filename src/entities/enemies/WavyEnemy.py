@@ -5,6 +5,7 @@ from config.Constants import Constants
 from config.Constants import Sounds
 from src.entities.enemies.AbstractEnemy import AbstractEnemy
 from src.entities.projectiles.ProjectileGenerator import ProjectileGenerator
+from src.utils.TextureAtlas import TextureAtlas
 
 
 class WavyEnemy(AbstractEnemy):
@@ -21,17 +22,17 @@ class WavyEnemy(AbstractEnemy):
         """
         super().__init__(x=x, y=y)
         self._health_points = Constants.WAVY_ENEMY_MAX_HEALTH
+        self._score = Constants.WAVY_ENEMY_SCORE
         self._speed = Constants.WAVY_ENEMY_SPEED
         self._update_sprite(self._speed)
         self.__timer = 0
         self.__amplitude = Constants.WAVY_ENEMY_AMPLITUDE
         self.__angular_frequency = Constants.WAVY_ENEMY_ANGULAR_FREQUENCY
 
-        projectile_image = pygame.image.load(
-            "assets/sprites/projectiles/WavyEnemyProjectile.png").convert_alpha()
-        projectile_image = pygame.transform.scale(projectile_image, (
-            Constants.WAVY_ENEMY_PROJECTILE_WIDTH,
-            Constants.WAVY_ENEMY_PROJECTILE_HEIGHT))
+        projectile_image = TextureAtlas().image(
+            "assets/sprites/projectiles/WavyEnemyProjectile.png",
+            (Constants.WAVY_ENEMY_PROJECTILE_WIDTH,
+             Constants.WAVY_ENEMY_PROJECTILE_HEIGHT))
         self.__projectile_generator = ProjectileGenerator(
             Constants.WAVY_ENEMY_PROJECTILE_SPEED,
             Constants.WAVY_ENEMY_FIRE_RATE,
@@ -46,14 +47,12 @@ class WavyEnemy(AbstractEnemy):
         :param x: Initial x coordinate
         :param y: Initial y coordinate
         """
-        self.original_image = pygame.image.load(
-            "assets/sprites/enemies/WavyEnemy.png").convert_alpha()
-        self.original_image = pygame.transform.scale(
-            self.original_image,
-            (Constants.WAVY_ENEMY_WIDTH, Constants.WAVY_ENEMY_HEIGHT)
-        )
-        self.original_image = pygame.transform.flip(self.original_image, True,
-                                                    False)
+        # The sprite is drawn facing left
+        size = (Constants.WAVY_ENEMY_WIDTH, Constants.WAVY_ENEMY_HEIGHT)
+        self.original_image = TextureAtlas().image(
+            "assets/sprites/enemies/WavyEnemy.png", size, flipped=True)
+        self.flipped_image = TextureAtlas().image(
+            "assets/sprites/enemies/WavyEnemy.png", size)
         self.rect = self.original_image.get_rect()
         self.rect.centerx = x
         self.rect.bottom = y
@@ -97,6 +96,28 @@ class WavyEnemy(AbstractEnemy):
         data["angular_frequency"] = self.__angular_frequency
         return data
 
+    def snapshot(self):
+        """
+        Adds the wave and firing timers to the state of the enemy.
+        """
+        data = super().snapshot()
+        data["timer"] = self.__timer
+        data["amplitude"] = self.__amplitude
+        data["angular_frequency"] = self.__angular_frequency
+        data["projectile_generator"] = \
+            self.__projectile_generator.snapshot()
+        return data
+
+    def restore(self, data):
+        """
+        Restores the enemy state, including its wave and firing timers.
+        """
+        super().restore(data)
+        self.__timer = data["timer"]
+        self.__amplitude = data["amplitude"]
+        self.__angular_frequency = data["angular_frequency"]
+        self.__projectile_generator.restore(data["projectile_generator"])
+
     @classmethod
     def from_dict(cls, data):
         """
@@ -2,8 +2,10 @@ from abc import ABC, abstractmethod
 
 import pygame
 
-from config.Constants import Constants, Sounds
+from config.Constants import Constants
 from src.utils.AudioManager import AudioManager
+from src.utils.InputManager import InputManager
+from src.utils.TextureAtlas import TextureAtlas
 
 
 class AbstractPlayer(pygame.sprite.Sprite, ABC):
@@ -32,7 +34,10 @@ class AbstractPlayer(pygame.sprite.Sprite, ABC):
         self._has_durable_ability = False
         self._prev_mouse_pressed = False
         self._audio_manager = AudioManager()
+        self._audio_manager.load_bank(type(self).__name__)
+        self._input = InputManager()
         self._facing_left = False
+        # Sprites facing right and left, indexed by _facing_left
         self._sprite_idle = None
         self._sprite_jump = None
         self._sprite_walk_frames = None
@@ -48,6 +53,25 @@ class AbstractPlayer(pygame.sprite.Sprite, ABC):
         self.__walk_frame_timer = 0
         self.__walk_frame_duration = 0.3
 
+    def _load_sprites(self, name):
+        """
+        Loads the idle, walk and jump sprites of a character from the
+        TextureAtlas, facing right and left.
+
+        :param name: Name of the character, prefixing its sprite files.
+        """
+        atlas = TextureAtlas()
+        size = (Constants.PLAYER_WIDTH, Constants.PLAYER_HEIGHT)
+        walk_size = (Constants.PLAYER_WIDTH * 2, Constants.PLAYER_HEIGHT)
+        path = f"assets/sprites/players/{name}"
+        self._sprite_idle = [atlas.image(f"{path}Idle.png", size, flipped)
+                             for flipped in (False, True)]
+        self._sprite_jump = [atlas.image(f"{path}Jump.png", size, flipped)
+                             for flipped in (False, True)]
+        self._sprite_walk_frames = [
+            atlas.frames(f"{path}Walk.png", walk_size, 2, flipped)
+            for flipped in (False, True)]
+
     @property
     def get_ability_cooldown(self):
         """
@@ -101,6 +125,15 @@ class AbstractPlayer(pygame.sprite.Sprite, ABC):
         """
         return self._ready_ability
 
+    @property
+    def ability(self):
+        """
+        Gets the special ability of the player.
+
+        :return: The ability generator.
+        """
+        return self.__ability_generator
+
     @abstractmethod
     def choose_ability(self):
         """
@@ -129,36 +162,33 @@ class AbstractPlayer(pygame.sprite.Sprite, ABC):
 
         pass
 
-    def update(self, keys, terrain, dt, player_projectiles,
-               enemies_projectiles, abilities):
+    def update(self, keys, terrain, dt, player_projectiles, abilities):
         """
-        Updates the player's state, including movement, animation, and collisions.
+        Updates the player's state, including movement and animation.
+        Damage taken is applied by the DamageSystem.
 
         :param keys: Dictionary of key states.
         :param terrain: Group of terrain sprites.
         :param dt: Time delta since last update.
-        :param player_projectiles: List of player projectiles.
-        :param enemies_projectiles: List of enemy projectiles.
-        :param abilities: List of active abilities.
+        :param player_projectiles: Group tag of the player projectiles.
+        :param abilities: Group tag of the abilities.
         """
         self._handle_input(terrain, keys, dt, player_projectiles, abilities)
         self._limit_bounds()
-        self._compute_damage(enemies_projectiles)
 
+        facing = int(self._facing_left)
         if self._is_jumping:
-            self.image = self._sprite_jump
+            self.image = self._sprite_jump[facing]
         elif keys[pygame.K_a] or keys[pygame.K_d]:
+            walk_frames = self._sprite_walk_frames[facing]
             self.__walk_frame_timer += dt
             if self.__walk_frame_timer >= self.__walk_frame_duration:
                 self.__walk_frame_timer = 0
                 self.__walk_frame_index = (self.__walk_frame_index + 1) % len(
-                    self._sprite_walk_frames)
-            self.image = self._sprite_walk_frames[self.__walk_frame_index]
+                    walk_frames)
+            self.image = walk_frames[self.__walk_frame_index]
         else:
-            self.image = self._sprite_idle
-
-        if self._facing_left:
-            self.image = pygame.transform.flip(self.image, True, False)
+            self.image = self._sprite_idle[facing]
 
         center = self.rect.center
         self.rect = self.image.get_rect()
@@ -174,16 +204,16 @@ class AbstractPlayer(pygame.sprite.Sprite, ABC):
         :param terrain: Group of terrain sprites.
         :param keys: Dictionary of key states.
         :param dt: Time delta since last update.
-        :param projectiles: List of active projectiles.
-        :param abilities: List of active abilities.
+        :param projectiles: Group tag of the projectiles.
+        :param abilities: Group tag of the abilities.
         """
         self._compute_vertical_position(terrain, keys, dt)
         self._compute_horizontal_position(terrain, keys, dt)
 
-        if (pygame.mouse.get_pressed()[0] and not
-        (pygame.mouse.get_pressed()[2] and self._ready_ability)):
-            target = pygame.math.Vector2(pygame.mouse.get_pos()[0],
-                                         pygame.mouse.get_pos()[1])
+        if (self._input.mouse_buttons[0] and not
+        (self._input.mouse_buttons[2] and self._ready_ability)):
+            target = pygame.math.Vector2(self._input.mouse_position[0],
+                                         self._input.mouse_position[1])
             origin = (
                 self.get_projectile_origin()
                 if hasattr(self, "get_projectile_origin")
@@ -193,9 +223,9 @@ class AbstractPlayer(pygame.sprite.Sprite, ABC):
                                                 projectiles)
         self._compute_cooldown_ability(dt)
 
-        if pygame.mouse.get_pressed()[2]:
-            target_ability = pygame.math.Vector2(pygame.mouse.get_pos()[0],
-                                                 pygame.mouse.get_pos()[1])
+        if self._input.mouse_buttons[2]:
+            target_ability = pygame.math.Vector2(
+                self._input.mouse_position[0], self._input.mouse_position[1])
             if self._ready_ability:
                 self.__ability_generator.generate(target_ability, dt,
                                                   abilities)
@@ -212,7 +242,7 @@ class AbstractPlayer(pygame.sprite.Sprite, ABC):
         """
         import math
 
-        if pygame.mouse.get_pressed()[2]:
+        if self._input.mouse_buttons[2]:
             self._current_weapon_original_image = self._special_weapon_original_image.copy()
 
             offset_x = 50 + self._special_weapon_offset.x
@@ -222,7 +252,7 @@ class AbstractPlayer(pygame.sprite.Sprite, ABC):
 
             offset_x, offset_y = 50, 0
 
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        mouse_x, mouse_y = self._input.mouse_position
         dx = mouse_x - self.rect.centerx
         dy = mouse_y - self.rect.centery
         angle = math.degrees(math.atan2(-dy, dx))
@@ -233,6 +263,17 @@ class AbstractPlayer(pygame.sprite.Sprite, ABC):
         self.rect.centerx + offset_x, self.rect.centery + offset_y)
         self._weapon_rect = self._weapon_image.get_rect(center=new_center)
 
+    def render_items(self):
+        """
+        Returns the surfaces that represent the player, in drawing order.
+
+        :return: List of (surface, rect) pairs for the body and the weapon.
+        """
+        items = [(self.image, self.rect)]
+        if self._weapon_image is not None:
+            items.append((self._weapon_image, self._weapon_rect))
+        return items
+
     def _compute_vertical_position(self, terrain, keys, dt):
         """
         Computes player's vertical position.
@@ -292,23 +333,14 @@ class AbstractPlayer(pygame.sprite.Sprite, ABC):
         if self.rect.bottom > Constants.HEIGHT:
             self.rect.bottom = Constants.HEIGHT
 
-    def _compute_damage(self, enemies_projectiles):
-        """
-        Computes projectile collision and damage taken.
-
-        :param enemies_projectiles: Enemies projectiles on screen.
-        """
-        for projectile in enemies_projectiles:
-            projectile.compute_collision(self)
-
     def inflict_damage(self, damage):
         """
-        Inflicts damage on the player.
+        Inflicts damage on the player. Hits are recorded in the HitBuffer
+        and resolved by the DamageSystem, which calls this method.
 
         :param damage: The damage to be inflicted on the player.
         """
         self._health_points -= damage
-        self._audio_manager.play_sound(Sounds.HIT)
 
     def to_dict(self):
         """
@@ -326,3 +358,44 @@ class AbstractPlayer(pygame.sprite.Sprite, ABC):
             "ready_ability": self._ready_ability,
             "time_cooldown_ability": self._ability_downtime,
         }
+
+    def snapshot(self):
+        """
+        Converts the whole player state, including the weapon, ability and
+        animation timers left out of to_dict, into a dictionary.
+
+        :return: A dictionary from which restore resumes the player.
+        """
+        return {
+            "rect": list(self.rect),
+            "health": self._health_points,
+            "is_jumping": self._is_jumping,
+            "y_speed": self._y_speed,
+            "ready_ability": self._ready_ability,
+            "ability_downtime": self._ability_downtime,
+            "prev_mouse_pressed": self._prev_mouse_pressed,
+            "facing_left": self._facing_left,
+            "walk_frame_index": self.__walk_frame_index,
+            "walk_frame_timer": self.__walk_frame_timer,
+            "projectile_generator": self._projectile_generator.snapshot(),
+            "ability": self.__ability_generator.snapshot(),
+        }
+
+    def restore(self, data):
+        """
+        Restores the player state from a dictionary.
+
+        :param data: Dictionary created by snapshot.
+        """
+        self.rect = pygame.Rect(data["rect"])
+        self._health_points = data["health"]
+        self._is_jumping = data["is_jumping"]
+        self._y_speed = data["y_speed"]
+        self._ready_ability = data["ready_ability"]
+        self._ability_downtime = data["ability_downtime"]
+        self._prev_mouse_pressed = data["prev_mouse_pressed"]
+        self._facing_left = data["facing_left"]
+        self.__walk_frame_index = data["walk_frame_index"]
+        self.__walk_frame_timer = data["walk_frame_timer"]
+        self._projectile_generator.restore(data["projectile_generator"])
+        self.__ability_generator.restore(data["ability"])
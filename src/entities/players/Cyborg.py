@@ -4,6 +4,7 @@ from config.Constants import Constants, Sounds
 from src.entities.abilities.LaserBeam import LaserBeam
 from src.entities.players.AbstractPlayer import AbstractPlayer
 from src.entities.projectiles.ProjectileGenerator import ProjectileGenerator
+from src.utils.TextureAtlas import TextureAtlas
 
 
 class Cyborg(AbstractPlayer):
@@ -17,9 +18,9 @@ class Cyborg(AbstractPlayer):
         self._ability_time_left = Constants.LASER_DURATION
         self._has_durable_ability = True
 
-        projectile_image = pygame.image.load(
-            "assets/sprites/projectiles/AssaultRifleProjectile.png").convert_alpha()
-        projectile_image = pygame.transform.scale(projectile_image, (10, 10))
+        projectile_image = TextureAtlas().image(
+            "assets/sprites/projectiles/AssaultRifleProjectile.png",
+            (10, 10))
         projectile_speed = Constants.CYBORG_PROJECTILE_SPEED
         projectile_frequency = Constants.CYBORG_PROJECTILE_FREQUENCY
         projectile_damage = int(Constants.CYBORG_PROJECTILE_DAMAGE)
@@ -33,36 +34,9 @@ class Cyborg(AbstractPlayer):
                                                          is_player_projectile=True
                                                          )
 
-        self._sprite_idle = pygame.image.load(
-            "assets/sprites/players/CyborgIdle.png").convert_alpha()
-        self._sprite_idle = pygame.transform.scale(
-            self._sprite_idle,
-            (Constants.PLAYER_WIDTH, Constants.PLAYER_HEIGHT)
-        )
-
-        walk_sheet = pygame.image.load(
-            "assets/sprites/players/CyborgWalk.png").convert_alpha()
-        sheet_width, sheet_height = walk_sheet.get_size()
-        frame_width = sheet_width // 2
-        frame_height = sheet_height
-        frame1 = walk_sheet.subsurface(
-            (0, 0, frame_width, frame_height)).copy()
-        frame2 = walk_sheet.subsurface(
-            (frame_width, 0, frame_width, frame_height)).copy()
-        frame1 = pygame.transform.scale(frame1, (
-        Constants.PLAYER_WIDTH, Constants.PLAYER_HEIGHT))
-        frame2 = pygame.transform.scale(frame2, (
-        Constants.PLAYER_WIDTH, Constants.PLAYER_HEIGHT))
-        self._sprite_walk_frames = [frame1, frame2]
-
-        self._sprite_jump = pygame.image.load(
-            "assets/sprites/players/CyborgJump.png").convert_alpha()
-        self._sprite_jump = pygame.transform.scale(
-            self._sprite_jump,
-            (Constants.PLAYER_WIDTH, Constants.PLAYER_HEIGHT)
-        )
-
-        self.image = self._sprite_idle
+        self._load_sprites("Cyborg")
+
+        self.image = self._sprite_idle[0]
         self.rect = self.image.get_rect()
         self.rect.centerx = x
         self.rect.bottom = y
@@ -70,16 +44,12 @@ class Cyborg(AbstractPlayer):
         weapon_width = 100
         weapon_height = 100
 
-        self._weapon_original_image = pygame.image.load(
-            "assets/sprites/weapons/AssaultRifle.png").convert_alpha()
-        self._weapon_original_image = pygame.transform.scale(
-            self._weapon_original_image, (
-                weapon_width, weapon_height))
+        self._weapon_original_image = TextureAtlas().image(
+            "assets/sprites/weapons/AssaultRifle.png",
+            (weapon_width, weapon_height))
 
-        self._special_weapon_original_image = pygame.image.load(
-            "assets/sprites/weapons/PlasmaCannon.png").convert_alpha()
-        self._special_weapon_original_image = pygame.transform.scale(
-            self._special_weapon_original_image,
+        self._special_weapon_original_image = TextureAtlas().image(
+            "assets/sprites/weapons/PlasmaCannon.png",
             (weapon_width, weapon_height))
 
         self._current_weapon_original_image = self._weapon_original_image.copy()
@@ -128,7 +98,7 @@ class Cyborg(AbstractPlayer):
 
         :param dt: The duration of one iteration.
         """
-        if pygame.mouse.get_pressed()[2] and self._ready_ability:
+        if self._input.mouse_buttons[2] and self._ready_ability:
             self._ability_time_left -= dt
             if self._ability_time_left <= 0:
                 self._ability_time_left = 0
@@ -142,6 +112,21 @@ class Cyborg(AbstractPlayer):
         data = super().to_dict()
         return data
 
+    def snapshot(self):
+        """
+        Adds the time left on the laser to the state of the player.
+        """
+        data = super().snapshot()
+        data["ability_time_left"] = self._ability_time_left
+        return data
+
+    def restore(self, data):
+        """
+        Restores the player state, including the time left on the laser.
+        """
+        super().restore(data)
+        self._ability_time_left = data["ability_time_left"]
+
     @classmethod
     def from_dict(cls, data):
         """
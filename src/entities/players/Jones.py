@@ -4,6 +4,7 @@ from config.Constants import Constants, Sounds
 from src.entities.abilities.MissileBarrage import MissileBarrage
 from src.entities.players.AbstractPlayer import AbstractPlayer
 from src.entities.projectiles.ProjectileGenerator import ProjectileGenerator
+from src.utils.TextureAtlas import TextureAtlas
 
 
 class Jones(AbstractPlayer):
@@ -20,9 +21,9 @@ class Jones(AbstractPlayer):
         self._health_points = self._initial_health
         self._ability_cooldown = Constants.MISSILE_COOLDOWN
 
-        projectile_image = pygame.image.load(
-            "assets/sprites/projectiles/GrenadeLauncherProjectile.png").convert_alpha()
-        projectile_image = pygame.transform.scale(projectile_image, (15, 15))
+        projectile_image = TextureAtlas().image(
+            "assets/sprites/projectiles/GrenadeLauncherProjectile.png",
+            (15, 15))
         projectile_speed = Constants.JONES_PROJECTILE_SPEED
         projectile_frequency = Constants.JONES_PROJECTILE_FREQUENCY
         projectile_damage = int(Constants.JONES_PROJECTILE_DAMAGE)
@@ -36,33 +37,9 @@ class Jones(AbstractPlayer):
                                                          is_player_projectile=True
                                                          )
 
-        self._sprite_idle = pygame.image.load(
-            "assets/sprites/players/JonesIdle.png").convert_alpha()
-        self._sprite_idle = pygame.transform.scale(
-            self._sprite_idle,
-            (Constants.PLAYER_WIDTH, Constants.PLAYER_HEIGHT)
-        )
-
-        walk_sheet = pygame.image.load(
-            "assets/sprites/players/JonesWalk.png").convert_alpha()
-        walk_sheet = pygame.transform.scale(
-            walk_sheet, (Constants.PLAYER_WIDTH * 2, Constants.PLAYER_HEIGHT)
-        )
-        frame1 = walk_sheet.subsurface(
-            (0, 0, Constants.PLAYER_WIDTH, Constants.PLAYER_HEIGHT)).copy()
-        frame2 = walk_sheet.subsurface((Constants.PLAYER_WIDTH, 0,
-                                        Constants.PLAYER_WIDTH,
-                                        Constants.PLAYER_HEIGHT)).copy()
-        self._sprite_walk_frames = [frame1, frame2]
-
-        self._sprite_jump = pygame.image.load(
-            "assets/sprites/players/JonesJump.png").convert_alpha()
-        self._sprite_jump = pygame.transform.scale(
-            self._sprite_jump,
-            (Constants.PLAYER_WIDTH, Constants.PLAYER_HEIGHT)
-        )
-
-        self.image = self._sprite_idle
+        self._load_sprites("Jones")
+
+        self.image = self._sprite_idle[0]
         self.rect = self.image.get_rect()
         self.rect.centerx = x
         self.rect.bottom = y
@@ -70,16 +47,12 @@ class Jones(AbstractPlayer):
         weapon_width = 100
         weapon_height = 100
 
-        self._weapon_original_image = pygame.image.load(
-            "assets/sprites/weapons/GrenadeLauncher.png").convert_alpha()
-        self._weapon_original_image = pygame.transform.scale(
-            self._weapon_original_image, (
-                weapon_width, weapon_height))
+        self._weapon_original_image = TextureAtlas().image(
+            "assets/sprites/weapons/GrenadeLauncher.png",
+            (weapon_width, weapon_height))
 
-        self._special_weapon_original_image = pygame.image.load(
-            "assets/sprites/weapons/MissileLauncher.png").convert_alpha()
-        self._special_weapon_original_image = pygame.transform.scale(
-            self._special_weapon_original_image,
+        self._special_weapon_original_image = TextureAtlas().image(
+            "assets/sprites/weapons/MissileLauncher.png",
             (weapon_width, weapon_height))
 
         self._current_weapon_original_image = self._weapon_original_image.copy()
@@ -111,7 +84,7 @@ class Jones(AbstractPlayer):
                 self._audio_manager.play_sound(Sounds.RECHARGED)
 
     def _compute_duration_ability(self, dt):
-        if pygame.mouse.get_pressed()[2] and self._ready_ability:
+        if self._input.mouse_buttons[2] and self._ready_ability:
             self._ready_ability = False
             self._ability_downtime = 0
 
@@ -4,6 +4,7 @@ from config.Constants import Constants, Sounds
 from src.entities.abilities.CriticalShot import CriticalShot
 from src.entities.players.AbstractPlayer import AbstractPlayer
 from src.entities.projectiles.ProjectileGenerator import ProjectileGenerator
+from src.utils.TextureAtlas import TextureAtlas
 
 
 class Rain(AbstractPlayer):
@@ -19,9 +20,9 @@ class Rain(AbstractPlayer):
         self._health_points = self._initial_health
         self._ability_cooldown = Constants.CRITICAL_SHOT_COOLDOWN
 
-        projectile_image = pygame.image.load(
-            "assets/sprites/projectiles/PrecisionRifleProjectile.png").convert_alpha()
-        projectile_image = pygame.transform.scale(projectile_image, (15, 15))
+        projectile_image = TextureAtlas().image(
+            "assets/sprites/projectiles/PrecisionRifleProjectile.png",
+            (15, 15))
         projectile_speed = Constants.RAIN_PROJECTILE_SPEED
         projectile_frequency = Constants.RAIN_PROJECTILE_FREQUENCY
         projectile_damage = int(Constants.RAIN_PROJECTILE_DAMAGE)
@@ -36,34 +37,9 @@ class Rain(AbstractPlayer):
                                                          )
         self.time_projectile_generation = 0
 
-        self._sprite_idle = pygame.image.load(
-            "assets/sprites/players/RainIdle.png").convert_alpha()
-        self._sprite_idle = pygame.transform.scale(
-            self._sprite_idle,
-            (Constants.PLAYER_WIDTH, Constants.PLAYER_HEIGHT)
-        )
-
-        walk_sheet = pygame.image.load(
-            "assets/sprites/players/RainWalk.png").convert_alpha()
-        walk_sheet = pygame.transform.scale(
-            walk_sheet, (Constants.PLAYER_WIDTH * 2, Constants.PLAYER_HEIGHT)
-        )
-
-        frame1 = walk_sheet.subsurface(
-            (0, 0, Constants.PLAYER_WIDTH, Constants.PLAYER_HEIGHT)).copy()
-        frame2 = walk_sheet.subsurface((Constants.PLAYER_WIDTH, 0,
-                                        Constants.PLAYER_WIDTH,
-                                        Constants.PLAYER_HEIGHT)).copy()
-        self._sprite_walk_frames = [frame1, frame2]
-
-        self._sprite_jump = pygame.image.load(
-            "assets/sprites/players/RainJump.png").convert_alpha()
-        self._sprite_jump = pygame.transform.scale(
-            self._sprite_jump,
-            (Constants.PLAYER_WIDTH, Constants.PLAYER_HEIGHT)
-        )
-
-        self.image = self._sprite_idle
+        self._load_sprites("Rain")
+
+        self.image = self._sprite_idle[0]
         self.rect = self.image.get_rect()
         self.rect.centerx = x
         self.rect.bottom = y
@@ -73,16 +49,12 @@ class Rain(AbstractPlayer):
         weapon_width = 70
         weapon_height = 70
 
-        self._weapon_original_image = pygame.image.load(
-            "assets/sprites/weapons/PrecisionRifle.png").convert_alpha()
-        self._weapon_original_image = pygame.transform.scale(
-            self._weapon_original_image, (
-                weapon_width, weapon_height))
+        self._weapon_original_image = TextureAtlas().image(
+            "assets/sprites/weapons/PrecisionRifle.png",
+            (weapon_width, weapon_height))
 
-        self._special_weapon_original_image = pygame.image.load(
-            "assets/sprites/weapons/SpecialPrecisionRifle.png").convert_alpha()
-        self._special_weapon_original_image = pygame.transform.scale(
-            self._special_weapon_original_image,
+        self._special_weapon_original_image = TextureAtlas().image(
+            "assets/sprites/weapons/SpecialPrecisionRifle.png",
             (weapon_width, weapon_height))
 
         self._current_weapon_original_image = self._weapon_original_image.copy()
@@ -105,7 +77,7 @@ class Rain(AbstractPlayer):
         return CriticalShot(self)
 
     def _compute_cooldown_ability(self, dt):
-        mouse_buttons = pygame.mouse.get_pressed()
+        mouse_buttons = self._input.mouse_buttons
         if mouse_buttons[0] and not self._ready_ability:
 
             self.time_projectile_generation += dt
@@ -123,7 +95,7 @@ class Rain(AbstractPlayer):
                 self._audio_manager.play_sound(Sounds.RECHARGED)
 
     def _compute_duration_ability(self, dt):
-        if pygame.mouse.get_pressed()[2]:
+        if self._input.mouse_buttons[2]:
             self._ready_ability = False
             if self._charged_shots >= Constants.NORMAL_SHOTS_REQUIRED:
                 self._charged_shots = 0
@@ -139,6 +111,24 @@ class Rain(AbstractPlayer):
         data["time_projectile_geration"] = self.time_projectile_generation
         return data
 
+    def snapshot(self):
+        """
+        Adds the charge of the critical shot to the state of the player.
+        """
+        data = super().snapshot()
+        data["charged_shots"] = self._charged_shots
+        data["time_projectile_generation"] = self.time_projectile_generation
+        return data
+
+    def restore(self, data):
+        """
+        Restores the player state, including the charge of the critical
+        shot.
+        """
+        super().restore(data)
+        self._charged_shots = data["charged_shots"]
+        self.time_projectile_generation = data["time_projectile_generation"]
+
     @classmethod
     def from_dict(cls, data):
         """
@@ -1,6 +1,7 @@
 import numpy as np
-import pygame
 
+from src.ecs.Components import Components
+from src.utils.TransformCache import TransformCache
 from .AbstractProjectile import AbstractProjectile
 
 
@@ -9,59 +10,45 @@ class ProjectileAbility(AbstractProjectile):
     Base class for projectile-based abilities that move along a trajectory
     """
 
-    def __init__(self, position, angle, velocity, image, damage,
-                 lifetime=None):
+    @classmethod
+    def spawn(cls, group, position, angle, velocity, image, damage,
+              lifetime=None, animation=None, components=None):
         """
-        Initializes a projectile ability
+        Creates a projectile ability
 
+        :param group: Group tag of the projectile (see Components)
         :param position: position of the projectile
         :param angle: angle in radians (0 to 2pi)
         :param velocity: velocity vector of the projectile
         :param image: image of the projectile
         :param damage: damage caused by the projectile
         :param lifetime: lifetime in seconds (None for unlimited)
-        """
-        super().__init__(position, velocity, image, damage)
-        self.__initialize_sprite(position, angle, image)
-        self.__time_alive = 0
-        self.__lifetime = lifetime
-
-    def update(self, dt, terrain=None, player=None):
-        """
-        Update the projectile behavior (lifetime)
-
-        :param dt: Duration of one iteration
-        """
-        if self.__lifetime is not None:
-            self.__time_alive += dt
-        if self.__time_alive >= self.__lifetime:
-            self.kill()
-            return
-        if hasattr(self.image, "set_alpha"):
-            alpha = int(255 * (1 - self.__time_alive / self.__lifetime))
-            self.image.set_alpha(alpha)
-        self._move(dt)
-
-    def __initialize_sprite(self, position, angle, image):
-        """
-        Initialize the sprite for the projectile
+        :param animation: pre-rendered frames played along the lifetime
+            instead of fading the image (optional)
+        :param components: extra components describing what happens when
+            the projectile hits (optional)
+        :return: Id of the entity
+        """
+        angle = np.degrees(angle)
+        rotated = TransformCache().get(image, angle)
+        entity_components = cls._components(group, position, velocity,
+                                            rotated, damage)
+        entity_components[Components.LIFETIME] = (
+            0.0, np.inf if lifetime is None else lifetime)
+        if animation:
+            entity_components[Components.ANIMATION] = animation
+        elif lifetime is not None:
+            entity_components[Components.FADE] = (image, angle)
+        entity_components.update(components or {})
+        return cls._spawn(entity_components)
+
+    @staticmethod
+    def size(image, angle):
+        """
+        Returns the size a projectile ability is spawned with.
 
-        :param position: Position of the projectile
-        :param angle: Angle in radians
-        :param image: Image of the projectile
-        """
-        self._image = image
-        self._original_image = image
-        self._angle = np.degrees(angle)
-        self.image = pygame.transform.rotate(self._image, self._angle)
-        self.rect = self.image.get_rect()
-        self.rect.center = position
-
-    def draw(self, screen):
-        """
-        Draws the projectile on screen.
-        Abstract method that must be implemented by child classes.
-
-        :param screen: Screen surface
+        :param image: image of the projectile
+        :param angle: angle in radians (0 to 2pi)
+        :return: Tuple with the width and height
         """
-        pass
+        return TransformCache().get(image, np.degrees(angle)).get_size()
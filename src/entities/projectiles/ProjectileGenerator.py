@@ -2,7 +2,8 @@ import numpy as np
 import pygame
 
 from config.Constants import Constants
-from src.utils.AudioManager import AudioManager
+from src.utils.EventBus import EventBus
+from src.utils.Events import Events
 from .BombProjectile import BombProjectile
 from .NormalProjectile import NormalProjectile
 
@@ -30,7 +31,7 @@ class ProjectileGenerator:
         self.__projectile_image = projectile_image
         self.__projectile_damage = projectile_damage
         self.__sound = sound
-        self.__audio_manager = AudioManager()
+        self.__events = EventBus()
         self.__projectile_type = projectile_type
         self.__is_player_projectile = is_player_projectile
         self.__time_without_generation = 0
@@ -42,7 +43,7 @@ class ProjectileGenerator:
         :param origin: Origin of the projectile
         :param target: Point where the projectile will be directed
         :param dt: Time since last update
-        :param projectiles: Projectile sprite group
+        :param projectiles: Group tag of the projectiles (see Components)
         """
         self.__time_without_generation += dt
 
@@ -57,7 +58,8 @@ class ProjectileGenerator:
 
             if self.__projectile_type == "bomb":
                 velocity = pygame.Vector2(0, self.__projectile_speed)
-                projectile = BombProjectile(
+                BombProjectile.spawn(
+                    projectiles,
                     position=origin,
                     velocity=velocity,
                     image=self.__projectile_image,
@@ -65,15 +67,31 @@ class ProjectileGenerator:
                     explosion_radius=Constants.TANK_BOMB_EXPLOSION_RADIUS
                 )
             else:
-                projectile = NormalProjectile(
+                NormalProjectile.spawn(
+                    projectiles,
                     position=origin,
                     velocity=velocity,
                     image=self.__projectile_image,
                     damage=self.__projectile_damage,
                 )
 
-            projectiles.add(projectile)
-            self.__audio_manager.play_sound(self.__sound)
+            self.__events.publish(Events.Fired(origin, self.__sound))
+
+    def snapshot(self):
+        """
+        Converts the firing timer into a dictionary.
+
+        :return: A dictionary with the time since the last shot.
+        """
+        return {"time_without_generation": self.__time_without_generation}
+
+    def restore(self, data):
+        """
+        Restores the firing timer from a dictionary.
+
+        :param data: Dictionary created by snapshot.
+        """
+        self.__time_without_generation = data["time_without_generation"]
 
     @staticmethod
     def compute_shot_angle(origin, target):
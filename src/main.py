@@ -1,8 +1,66 @@
+import argparse
+import os
+
+from config.Constants import Constants
 from src.Game import Game
+from src.utils.Replay import Replay
+
+
+def parse_resolution(value):
+    """
+    Parses a resolution given as WIDTHxHEIGHT.
+
+    :param value: Resolution text, e.g. 960x540.
+    :return: Tuple with the width and height.
+    """
+    try:
+        width, height = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid resolution '{value}', expected WIDTHxHEIGHT")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(
+            f"invalid resolution '{value}', expected positive sizes")
+    return width, height
 
 
 def main():
-    game = Game()
+    parser = argparse.ArgumentParser(description="Alien Force")
+    parser.add_argument("--render-resolution", type=parse_resolution,
+                        default=None, metavar="WIDTHxHEIGHT",
+                        help="internal resolution the game is rendered at "
+                             "before being scaled to the window "
+                             "(e.g. 960x540)")
+    parser.add_argument("--quality", default=None,
+                        choices=[tier["name"]
+                                 for tier in Constants.QUALITY_TIERS],
+                        help="fixed quality tier; by default the quality "
+                             "adapts to the frame time")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed for every run, making them reproducible")
+    parser.add_argument("--record-replays", action="store_true",
+                        help="write the replay of each run to "
+                             f"{Constants.REPLAY_DIRECTORY}/")
+    parser.add_argument("--replay", default=None, metavar="FILE",
+                        help="play a recorded replay back")
+    parser.add_argument("--replay-speed", type=float, default=1.0,
+                        help="playback speed relative to real time, 0 "
+                             "plays as fast as possible")
+    parser.add_argument("--seek", type=int, default=0, metavar="FRAME",
+                        help="frame the replay playback starts from")
+    parser.add_argument("--headless", action="store_true",
+                        help="run without opening a window or audio device")
+    args = parser.parse_args()
+
+    if args.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+    game = Game(args.render_resolution, args.quality, args.seed,
+                args.record_replays)
+    if args.replay is not None:
+        game.play_replay(Replay.load(args.replay), args.replay_speed,
+                         args.seek)
     game.run()
 
 
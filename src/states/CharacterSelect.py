@@ -1,11 +1,9 @@
 import pygame
 
-from config.Constants import Constants, Sounds
-from src.entities.players.Cyborg import Cyborg
-from src.entities.players.Jones import Jones
-from src.entities.players.Rain import Rain
+from config.Constants import Constants, Sounds, States
 from src.states.AbstractState import AbstractState
-from src.states.Play import Play
+from src.states.StateRegistry import StateRegistry
+from src.utils.AssetLoader import AssetLoader
 from src.utils.AudioManager import AudioManager
 
 
@@ -22,10 +20,9 @@ class CharacterSelect(AbstractState):
         """
         super().__init__(game)
 
-        self.__bg_image = pygame.image.load(
-            "assets/sprites/Menu.png").convert()
-        self.__bg_image = pygame.transform.scale(self.__bg_image, (
-            Constants.WIDTH, Constants.HEIGHT))
+        self.__bg_image = AssetLoader().load_image(
+            "assets/sprites/Menu.png",
+            (Constants.WIDTH, Constants.HEIGHT), alpha=False)
         # Font configuration
         self.__font_title = pygame.font.Font(None, 74)
         self.__font_chars = pygame.font.Font(None, 54)
@@ -41,24 +38,24 @@ class CharacterSelect(AbstractState):
         self.__characters = [
             {
                 'name': 'Captain Cyborg',
-                'class': Cyborg,
+                'player': 'Cyborg',
                 'desc': 'Especialista em armas de assalto',
-                'image': pygame.image.load(
-                    "assets/sprites/players/CyborgIdle.png").convert_alpha()
+                'image': AssetLoader().load_image(
+                    "assets/sprites/players/CyborgIdle.png")
             },
             {
                 'name': 'Sergeant Jones',
-                'class': Jones,
+                'player': 'Jones',
                 'desc': 'Especialista em explosivos',
-                'image': pygame.image.load(
-                    "assets/sprites/players/JonesIdle.png").convert_alpha()
+                'image': AssetLoader().load_image(
+                    "assets/sprites/players/JonesIdle.png")
             },
             {
                 'name': 'Lieutenant Rain',
-                'class': Rain,
+                'player': 'Rain',
                 'desc': 'Especialista em precisão',
-                'image': pygame.image.load(
-                    "assets/sprites/players/RainIdle.png").convert_alpha()
+                'image': AssetLoader().load_image(
+                    "assets/sprites/players/RainIdle.png")
             }
         ]
 
@@ -182,10 +179,7 @@ class CharacterSelect(AbstractState):
                     self.__update_character_info()
                     self.__audio_manager.play_sound(Sounds.CLICK)
                 elif event.key == pygame.K_SPACE:
-                    selected_char = self.__characters[self.__selected][
-                        'class']()
-                    selected_char_name = selected_char.__class__.__name__
-                    self._next_state = Play(self._game, selected_char_name)
+                    self.__start_play()
                     self.__audio_manager.play_sound(Sounds.CLICK)
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left mouse button
@@ -210,9 +204,13 @@ class CharacterSelect(AbstractState):
 
                     # Check if clicked on character preview
                     if preview_rect.collidepoint(mouse_pos):
-                        selected_char = self.__characters[self.__selected][
-                            'class']()
-                        selected_char_name = selected_char.__class__.__name__
-                        self._next_state = Play(self._game,
-                                                selected_char_name)
+                        self.__start_play()
                         self.__audio_manager.play_sound(Sounds.CLICK)
+
+    def __start_play(self):
+        """
+        Starts a run with the selected character.
+        """
+        self._next_state = StateRegistry.create(
+            States.PLAY, self._game,
+            self.__characters[self.__selected]['player'])
@@ -1,7 +1,9 @@
 import pygame
 
-from config.Constants import Constants, Colors
+from config.Constants import Constants, Colors, States
 from src.states.AbstractState import AbstractState
+from src.states.StateRegistry import StateRegistry
+from src.utils.AssetLoader import AssetLoader
 from src.utils.AudioManager import AudioManager
 
 
@@ -19,11 +21,9 @@ class GameOver(AbstractState):
         :param score: The player's final score.
         """
         super().__init__(game)
-        self.__game_over_image = pygame.image.load(
-            "assets/sprites/GameOver.png").convert_alpha()
-        self.__game_over_image = pygame.transform.scale(
-            self.__game_over_image, (
-                Constants.WIDTH, Constants.HEIGHT))
+        self.__game_over_image = AssetLoader().load_image(
+            "assets/sprites/GameOver.png",
+            (Constants.WIDTH, Constants.HEIGHT))
         self.__score = score
         self.__font_large = pygame.font.Font(None, 120)
         self.__font_medium = pygame.font.Font(None, 60)
@@ -31,6 +31,18 @@ class GameOver(AbstractState):
         self.__audio_manager = AudioManager()
         self.__player_name = player_name
 
+        # Static texts, rendered once instead of every frame
+        self.__overlay = pygame.Surface((Constants.WIDTH, Constants.HEIGHT),
+                                        pygame.SRCALPHA)
+        self.__overlay.fill((0, 0, 0, 200))
+        self.__title = self.__font_large.render("GAME OVER", True, Colors.RED)
+        self.__title_rect = self.__title.get_rect(
+            center=(Constants.WIDTH / 2, Constants.HEIGHT / 3))
+        self.__score_text = self.__font_medium.render(
+            f"Final Score: {self.__score}", True, Colors.WHITE)
+        self.__score_rect = self.__score_text.get_rect(
+            center=(Constants.WIDTH / 2, Constants.HEIGHT / 2))
+
         # Menu options
         self.__options = [
             {'text': 'Reiniciar', 'action': self.__restart_game},
@@ -51,14 +63,13 @@ class GameOver(AbstractState):
 
     def __restart_game(self):
         """Restarts the game."""
-        from src.states.Play import Play
-        self._next_state = Play(self._game, self.__player_name)
+        self._next_state = StateRegistry.create(States.PLAY, self._game,
+                                                self.__player_name)
         self.__audio_manager.unpause_music()
 
     def __return_to_menu(self):
         """Returns to the main menu."""
-        from src.states.Menu import Menu
-        self._next_state = Menu(self._game)
+        self._next_state = StateRegistry.create(States.MENU, self._game)
         self.__audio_manager.unpause_music()
 
     def update(self, dt):
@@ -77,23 +88,9 @@ class GameOver(AbstractState):
         :param screen: The screen surface to draw on.
         """
         screen.blit(self.__game_over_image, (0, 0))
-        overlay = pygame.Surface((Constants.WIDTH, Constants.HEIGHT),
-                                 pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        screen.blit(overlay, (0, 0))
-
-        # Title
-        title = self.__font_large.render("GAME OVER", True, Colors.RED)
-        title_rect = title.get_rect(
-            center=(Constants.WIDTH / 2, Constants.HEIGHT / 3))
-        screen.blit(title, title_rect)
-
-        # Score
-        score_text = self.__font_medium.render(f"Final Score: {self.__score}",
-                                               True, Colors.WHITE)
-        score_rect = score_text.get_rect(
-            center=(Constants.WIDTH / 2, Constants.HEIGHT / 2))
-        screen.blit(score_text, score_rect)
+        screen.blit(self.__overlay, (0, 0))
+        screen.blit(self.__title, self.__title_rect)
+        screen.blit(self.__score_text, self.__score_rect)
 
         # Draws the options
         for surface, rect in zip(self.__options_surfaces,
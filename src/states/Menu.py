@@ -1,11 +1,14 @@
 import json
+import os
 
 import pygame
 
-from config.Constants import Constants, Sounds
+from config.Constants import Constants, Sounds, States
 from src.states.AbstractState import AbstractState
-from src.states.CharacterSelect import CharacterSelect
+from src.states.StateRegistry import StateRegistry
+from src.utils.AssetLoader import AssetLoader
 from src.utils.AudioManager import AudioManager
+from src.utils.SaveGame import SaveGame
 
 
 class Menu(AbstractState):
@@ -20,10 +23,9 @@ class Menu(AbstractState):
         :param game: The main game instance.
         """
         super().__init__(game)
-        self.__bg_image = pygame.image.load(
-            "assets/sprites/Menu.png").convert()
-        self.__bg_image = pygame.transform.scale(self.__bg_image, (
-            Constants.WIDTH, Constants.HEIGHT))
+        self.__bg_image = AssetLoader().load_image(
+            "assets/sprites/Menu.png",
+            (Constants.WIDTH, Constants.HEIGHT), alpha=False)
         self.__font = pygame.font.Font(None, 74)
         self.__title = self.__font.render('Alien Force', True,
                                           pygame.Color('white'))
@@ -83,7 +85,8 @@ class Menu(AbstractState):
                 self._is_running = False
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
-                    self._next_state = CharacterSelect(self._game)
+                    self._next_state = StateRegistry.create(
+                        States.CHARACTER_SELECT, self._game)
                     self.__audio_manager.play_sound(Sounds.CLICK)
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left mouse button
@@ -94,17 +97,34 @@ class Menu(AbstractState):
 
     def __start_from_beginning(self):
         self._load_from_save = False
-        self._next_state = CharacterSelect(self._game)
+        self._next_state = StateRegistry.create(States.CHARACTER_SELECT,
+                                                self._game)
 
     def __start_from_save(self):
         self._load_from_save = True
         try:
-            with open("saves/save_game.json", "r") as f:
-                data = json.load(f)
+            data = self.__read_save()
         except FileNotFoundError:
             print("Error: save file not found! Starting new game")
             self.__start_from_beginning()
             return
+        except ValueError as e:
+            print("Error: {}! Starting new game".format(e))
+            self.__start_from_beginning()
+            return
         player_name = "Jones"  # Default name
-        from src.states.Play import Play
-        self._next_state = Play.from_dict(data, self._game, player_name)
+        self._next_state = StateRegistry.get(States.PLAY).from_dict(
+            data, self._game, player_name)
+
+    @staticmethod
+    def __read_save():
+        """
+        Reads the saved game, from the text save of earlier versions when
+        there is no binary save.
+
+        :return: Dictionary of the saved Play state.
+        """
+        if not os.path.exists(Constants.SAVE_FILE):
+            with open(Constants.LEGACY_SAVE_FILE, "r") as f:
+                return json.load(f)
+        return SaveGame.load(Constants.SAVE_FILE)
@@ -1,7 +1,8 @@
 import pygame
 
-from config.Constants import Constants, Sounds
+from config.Constants import Constants, Sounds, States
 from src.states.AbstractState import AbstractState
+from src.states.StateRegistry import StateRegistry
 from src.utils.AudioManager import AudioManager
 
 
@@ -22,6 +23,12 @@ class Pause(AbstractState):
         self._next_state = self
         self.__audio_manager = AudioManager()
 
+        # Semi-transparent surface to darken the game, built once so it can
+        # be reused every frame
+        self.__overlay = pygame.Surface((Constants.WIDTH, Constants.HEIGHT))
+        self.__overlay.fill(pygame.Color('black'))
+        self.__overlay.set_alpha(128)  # 128 is 50% opacity
+
         # Font configuration
         self.__font_title = pygame.font.Font(None, 74)
         self.__font_options = pygame.font.Font(None, 48)
@@ -66,11 +73,7 @@ class Pause(AbstractState):
         # Draw current game state (frozen)
         self.__play_state.draw(screen)
 
-        # Create semi-transparent surface to darken the game
-        overlay = pygame.Surface((Constants.WIDTH, Constants.HEIGHT))
-        overlay.fill(pygame.Color('black'))
-        overlay.set_alpha(128)  # 128 is 50% opacity
-        screen.blit(overlay, (0, 0))
+        screen.blit(self.__overlay, (0, 0))
 
         # Draw pause menu
         screen.blit(self.__title, self.__title_rect)
@@ -86,10 +89,9 @@ class Pause(AbstractState):
         """
         for event in events:
             if event.type == pygame.QUIT:
-                from src.states.SaveConfirmation import SaveConfirmation
-                self._next_state = SaveConfirmation(self._game,
-                                                    self.__play_state,
-                                                    False)
+                self._next_state = StateRegistry.create(
+                    States.SAVE_CONFIRMATION, self._game, self.__play_state,
+                    False)
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.__resume_game()
@@ -115,7 +117,7 @@ class Pause(AbstractState):
         """
         Returns to the main menu.
         """
-        from src.states.SaveConfirmation import SaveConfirmation
-        self._next_state = SaveConfirmation(self._game, self.__play_state,
-                                            True)
+        self._next_state = StateRegistry.create(States.SAVE_CONFIRMATION,
+                                                self._game, self.__play_state,
+                                                True)
         self.__audio_manager.play_sound(Sounds.CLICK)
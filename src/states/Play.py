@@ -1,9 +1,15 @@
-import random
-
 import pygame
 
 from config.AvailableTerrains import AvailableTerrains
-from config.Constants import Constants, Sounds
+from config.Constants import Constants, Layers, RandomStreams, Sounds, States
+from src.ecs.Components import Components
+from src.ecs.DamageSystem import DamageSystem
+from src.ecs.HitBuffer import HitBuffer
+from src.ecs.LifetimeSystem import LifetimeSystem
+from src.ecs.MovementSystem import MovementSystem
+from src.ecs.RenderSystem import RenderSystem
+from src.ecs.TerrainSystem import TerrainSystem
+from src.ecs.World import World
 from src.entities.Terrain import Terrain
 from src.entities.enemies.BouncingEnemy import BouncingEnemy
 from src.entities.enemies.EnemyClassMap import EnemyClassMap
@@ -12,9 +18,20 @@ from src.entities.enemies.TankEnemy import TankEnemy
 from src.entities.enemies.WavyEnemy import WavyEnemy
 from src.entities.players.PlayerClassMap import PlayerClassMap
 from src.states.AbstractState import AbstractState
-from src.states.Pause import Pause
+from src.states.StateRegistry import StateRegistry
 from src.ui.Hud import Hud
+from src.utils.AssetLoader import AssetLoader
 from src.utils.AudioManager import AudioManager
+from src.utils.EntityManager import EntityManager
+from src.utils.EventBus import EventBus
+from src.utils.Events import Events
+from src.utils.InputManager import InputManager
+from src.utils.ParticleSystem import ParticleSystem
+from src.utils.QualityGovernor import QualityGovernor
+from src.utils.RandomService import RandomService
+from src.utils.RenderQueue import RenderQueue
+from src.utils.Replay import Replay
+from src.utils.SnapshotCodec import SnapshotCodec
 
 
 class Play(AbstractState):
@@ -22,53 +39,164 @@ class Play(AbstractState):
     Game in progress state.
     """
 
-    def __init__(self, game, player_name):
+    def __init__(self, game, player_name, seed=None, terrain=None,
+                 player=None):
         """
         Initializes the game state.
 
         :param game: The main game instance.
         :param player_name: The character selected by the player.
+        :param seed: Seed of the run (optional, see RandomService).
+        :param terrain: Terrain restored from a save (optional). By default
+            the run draws one of the available terrains.
+        :param player: Player restored from a save (optional). By default
+            a new player of the selected character is placed on the
+            terrain.
         """
         super().__init__(game)
         self.__spawn_timer = 0
         self.__audio_manager = AudioManager()
         self.__speed_multiplier = 1.0
-
-        terrains = AvailableTerrains()
-        random_terrain = terrains.get_random_terrain()
-        self.__terrain = Terrain(random_terrain)
+        self.__random = RandomService()
+        self.__seed = self.__random.start_run(seed)
+        self.__world = World()
+        self.__world.clear()
+        HitBuffer().clear()
+
+        # Subscribers consume the events of each iteration at its end
+        self.__events = EventBus()
+        self.__events.reset()
+        self.__events.subscribe(Events.Killed, self.__score_kills)
+        for event_type in (Events.Killed, Events.Damaged, Events.Fired,
+                           Events.Landed, Events.Exploded):
+            self.__events.subscribe(event_type,
+                                    self.__audio_manager.play_event_sounds)
+
+        if terrain is None:
+            terrains = AvailableTerrains()
+            random_terrain = terrains.get_random_terrain(
+                self.__random.stream(RandomStreams.TERRAIN))
+            terrain = Terrain(random_terrain)
+        self.__terrain = terrain
 
         self.__player_name = player_name
-        player = PlayerClassMap[self.__player_name]()
-        player.rect.centerx = Constants.WIDTH / 2
-        player.rect.bottom = 0
+        restored_player = player is not None
+        if not restored_player:
+            player = PlayerClassMap[self.__player_name]()
+            player.rect.centerx = Constants.WIDTH / 2
+            player.rect.bottom = 0
 
         self.__player = pygame.sprite.GroupSingle(player)
         self.__enemies = pygame.sprite.Group()
-        self.__player_projectiles = pygame.sprite.Group()
-        self.__enemies_projectiles = pygame.sprite.Group()
-        self.__abilities = pygame.sprite.Group()
+        self.__entity_manager = EntityManager()
+        self.__register_entities()
+        self.__particles = ParticleSystem()
+        self.__particles.clear()
+        self.__render_queue = RenderQueue()
+
+        # Projectiles and abilities live in the World and are updated by
+        # the systems; enemies keep their own behaviour
+        self.__movement_system = MovementSystem()
+        self.__lifetime_system = LifetimeSystem()
+        self.__terrain_system = TerrainSystem()
+        self.__damage_system = DamageSystem()
+        self.__render_system = RenderSystem({
+            Components.PLAYER_PROJECTILE: Layers.PLAYER_PROJECTILES,
+            Components.ENEMY_PROJECTILE: Layers.ENEMIES_PROJECTILES,
+            Components.ABILITY: Layers.ABILITIES,
+        })
 
         self.__hud = Hud(player)
 
-        self.__bg_image = pygame.image.load(
-            "assets/sprites/Background.png").convert()
-        self.__bg_image = pygame.transform.scale(self.__bg_image, (
-            Constants.WIDTH, Constants.HEIGHT))
+        self.__bg_image = AssetLoader().load_image(
+            "assets/sprites/Background.png",
+            (Constants.WIDTH, Constants.HEIGHT), alpha=False)
+
+        if not restored_player:
+            self.__adjust_player_initial_position()
 
-        self.__adjust_player_initial_position()
+        # When replays are recorded, every frame of input is kept so the
+        # run can be played back
+        self.__input = InputManager()
+        self.__quality_governor = QualityGovernor()
+        self.__frame = 0
+        self.__replay = None
+        if game.record_replays:
+            self.__replay = Replay(self.__seed, self.__player_name,
+                                   self.__terrain.to_dict())
 
     def __adjust_player_initial_position(self):
         """
         Adjusts the initial player position to be on terrain.
         """
         player = self.__player.sprite
-        while player.rect.bottom < Constants.HEIGHT:
-            player.rect.y += 1
-            hits = pygame.sprite.spritecollide(player, self.__terrain, False)
-            if hits:
-                player.rect.bottom = hits[0].rect.top
-                break
+        ground = self.__terrain.ground_below(player.rect)
+        player.rect.bottom = Constants.HEIGHT if ground is None else ground
+
+    def __register_entities(self):
+        """
+        Registers the entity groups of the session in the entity manager.
+        """
+        self.__entity_manager.register("enemies", Components.ENEMY,
+                                       cull=False)
+        self.__entity_manager.register("player_projectiles",
+                                       Components.PLAYER_PROJECTILE)
+        self.__entity_manager.register("enemies_projectiles",
+                                       Components.ENEMY_PROJECTILE)
+        self.__entity_manager.register("abilities", Components.ABILITY)
+
+    @property
+    def player(self):
+        """
+        Returns the player sprite.
+
+        :return: The player, or None if it was removed.
+        """
+        return self.__player.sprite
+
+    def add_enemies(self, enemies):
+        """
+        Adds enemies to the game.
+
+        :param enemies: Enemies to be added.
+        """
+        self.__enemies.add(enemies)
+
+    @property
+    def entity_counts(self):
+        """
+        Returns the number of live entities in each sprite group.
+
+        :return: Dictionary mapping group names to entity counts.
+        """
+        return self.__entity_manager.live_counts
+
+    @property
+    def damage_log(self):
+        """
+        Returns the hits resolved in each of the last frames.
+
+        :return: List of structured arrays of Hits.RECORD, oldest first.
+        """
+        return self.__damage_system.log
+
+    @property
+    def seed(self):
+        """
+        Returns the seed the random streams of this run started from.
+
+        :return: The run seed.
+        """
+        return self.__seed
+
+    @property
+    def replay(self):
+        """
+        Returns the recording of this run.
+
+        :return: The replay, or None if replays are not recorded.
+        """
+        return self.__replay
 
     def update(self, dt):
         """
@@ -76,40 +204,35 @@ class Play(AbstractState):
 
         :param dt: Time since last update.
         """
-        keys = pygame.key.get_pressed()
+        self.__record_input()
+        keys = self.__input.keys
 
         player = self.__player.sprite
-        self.__player_projectiles.update(dt, self.__terrain, player)
-        self.__enemies_projectiles.update(dt, self.__terrain, player)
-        self.__abilities.update(dt, self.__speed_multiplier)
+        self.__lifetime_system.update(dt)
+        self.__movement_system.update(dt)
+        self.__terrain_system.update(dt, self.__terrain, player)
+        self.__entity_manager.cull()
+        self.__world.flush()
+        self.__particles.update(dt)
 
         self.__player.update(keys, self.__terrain, dt,
-                             self.__player_projectiles,
-                             self.__enemies_projectiles, self.__abilities)
-
-        self.__enemies.update(dt, self.__player_projectiles, self.__abilities,
-                              self.__enemies_projectiles,
-                              self.__player, self.__terrain,
-                              self.__speed_multiplier)
-
-        for enemy in self.__enemies.sprites():
-            if enemy.health <= 0:
-                if isinstance(enemy, TankEnemy):
-                    self.__hud.add_score(100)
-                elif isinstance(enemy, WavyEnemy):
-                    self.__hud.add_score(50)
-                elif isinstance(enemy, LinearEnemy):
-                    self.__hud.add_score(30)
-                elif isinstance(enemy, BouncingEnemy):
-                    self.__hud.add_score(40)
-                enemy.kill()
-                self.__audio_manager.play_sound(Sounds.DEATH)
+                             Components.PLAYER_PROJECTILE, Components.ABILITY)
+
+        self.__enemies.update(dt, Components.ENEMY_PROJECTILE, self.__player,
+                              self.__terrain, self.__speed_multiplier)
+
+        # Projectiles spawned in this iteration can already hit
+        self.__world.flush()
+        self.__damage_system.update(self.__player.sprite)
+        self.__damage_system.resolve(self.__player.sprite)
+        self.__world.flush()
 
         if player.health_points <= 0:
-            from src.states.GameOver import GameOver
-            self._next_state = GameOver(self._game, self.__hud.score,
-                                        self.__player_name)
+            self._next_state = StateRegistry.create(
+                States.GAME_OVER, self._game, self.__hud.score,
+                self.__player_name)
             self.__audio_manager.pause_music()
+            self.__audio_manager.unload_session_banks()
             self.__audio_manager.play_sound(Sounds.GAME_OVER)
 
         self.__spawn_timer += dt
@@ -120,6 +243,37 @@ class Play(AbstractState):
         if self.__speed_multiplier < Constants.SPEED_MULTIPLIER_LIMIT:
             self.__speed_multiplier += Constants.DIFFICULTY_FACTOR
 
+        self.__events.dispatch()
+
+    def __score_kills(self, events):
+        """
+        Adds the score of the enemies killed in the iteration.
+
+        :param events: List of Killed events.
+        """
+        self.__hud.add_score(sum(event.score for event in events))
+
+    def __record_input(self):
+        """
+        Captures the input of the frame and, when replays are recorded,
+        appends it to the replay together with a keyframe every few
+        seconds. Keyframes hold the state of to_dict, which playback checks
+        the replayed game against, and the snapshot playback seeks from.
+        """
+        self.__input.capture()
+        if self.__replay is None:
+            return
+        if self.__frame % Constants.REPLAY_KEYFRAME_INTERVAL == 0:
+            state = self.to_dict()
+            del state["terrain"]
+            state["snapshot"] = self.snapshot()
+            self.__replay.add_keyframe(self.__frame, state)
+        key_mask, button_mask, mouse_position = self.__input.to_frame()
+        self.__replay.add_frame(key_mask, button_mask,
+                                self.__quality_governor.tier_index,
+                                mouse_position)
+        self.__frame += 1
+
     def draw(self, screen):
         """
         Draws the game state.
@@ -128,17 +282,15 @@ class Play(AbstractState):
         """
         screen.blit(self.__bg_image, (0, 0))
 
-        self.__terrain.draw(screen)
-
-        for projectile in self.__player_projectiles:
-            projectile.draw(screen)
+        queue = self.__render_queue
+        queue.add_group(self.__terrain, Layers.TERRAIN)
         for player in self.__player:
-            player.draw(screen)
-        self.__enemies.draw(screen)
-        for projectile in self.__enemies_projectiles:
-            projectile.draw(screen)
+            queue.add_items(player.render_items(), Layers.PLAYER)
+        queue.add_group(self.__enemies, Layers.ENEMIES)
+        self.__render_system.draw(queue)
+        queue.flush(screen)
 
-        self.__abilities.draw(screen)
+        self.__particles.draw(screen)
 
         self.__hud.draw(screen)
 
@@ -151,16 +303,16 @@ class Play(AbstractState):
         for event in events:
             if event.type == pygame.KEYDOWN:
                 if event.key in [pygame.K_ESCAPE, pygame.K_p]:
-                    self._next_state = Pause(self._game, self)
+                    self._next_state = StateRegistry.create(States.PAUSE,
+                                                            self._game, self)
                     self.__audio_manager.pause_music()
                     self.__audio_manager.play_sound(Sounds.CLICK)
             if event.type == pygame.QUIT:
                 self.__audio_manager.pause_music()
                 self.__audio_manager.play_sound(Sounds.CLICK)
                 if self.__player.sprite is not None:
-                    from src.states.SaveConfirmation import SaveConfirmation
-                    self._next_state = SaveConfirmation(self._game, self,
-                                                        False)
+                    self._next_state = StateRegistry.create(
+                        States.SAVE_CONFIRMATION, self._game, self, False)
                 else:
                     self._is_running = False
 
@@ -177,13 +329,14 @@ class Play(AbstractState):
                 (BouncingEnemy, Constants.BOUNCING_ENEMY_SPAWN_CHANCE),
                 (TankEnemy, Constants.TANK_ENEMY_SPAWN_CHANCE)
             ]
-            enemy_class = random.choices(
+            spawn_random = self.__random.stream(RandomStreams.SPAWN)
+            enemy_class = spawn_random.choices(
                 [et[0] for et in enemy_types],
                 weights=[et[1] for et in enemy_types]
             )[0]
 
             spawn_positions = [0, Constants.WIDTH]
-            spawn_x = random.choice(spawn_positions)
+            spawn_x = spawn_random.choice(spawn_positions)
 
             self.__enemies.add(enemy_class(spawn_x))
 
@@ -198,6 +351,8 @@ class Play(AbstractState):
             "player": None if self.__player.sprite is None else self.__player.sprite.to_dict(),
             "enemies": [enemy.to_dict() for enemy in
                         self.__enemies.sprites()],
+            "random": self.__random.to_dict(),
+            "score": self.__hud.score,
         }
         return state
 
@@ -211,25 +366,25 @@ class Play(AbstractState):
         :param game: The main game instance.
         :return: A restored instance of Play.
         """
-        # Create the Play state instance using the provided game and player
-        instance = cls(game, player_name)
-        instance.__spawn_timer = data.get("spawn_timer", 0)
-        instance.__speed_multiplier = data.get("speed_multiplier", 1.0)
-
         # Restore Terrain
-        instance.__terrain = Terrain.from_dict(data["terrain"])
+        terrain = Terrain.from_dict(data["terrain"])
 
         # Restore Player state
         player_data = data.get("player")
-        if data.get("player") is not None:
-            player_type = player_data.get("type")
-            instance.__player_name = player_type
-            restored_player = PlayerClassMap[player_type].from_dict(
+        restored_player = None
+        if player_data is not None:
+            player_name = player_data.get("type")
+            restored_player = PlayerClassMap[player_name].from_dict(
                 player_data)
-            instance.__player = pygame.sprite.GroupSingle(restored_player)
         else:
             print("player not found")
 
+        # The restored terrain and player are used as they are
+        instance = cls(game, player_name, terrain=terrain,
+                       player=restored_player)
+        instance.__spawn_timer = data.get("spawn_timer", 0)
+        instance.__speed_multiplier = data.get("speed_multiplier", 1.0)
+
         # Restore Enemies
         restored_enemies = []
         for enemy_data in data.get("enemies", []):
@@ -239,9 +394,93 @@ class Play(AbstractState):
                 restored_enemies.append(enemy)
         instance.__enemies = pygame.sprite.Group(restored_enemies)
 
-        instance.__player_projectiles = pygame.sprite.Group()
-        instance.__enemies_projectiles = pygame.sprite.Group()
-        instance.__abilities = pygame.sprite.Group()
-        instance.__hud = Hud(instance.__player.sprite)
+        instance.__hud.add_score(data.get("score", 0))
 
+        # Restore the random streams, older saves start a new run instead
+        if "random" in data:
+            RandomService.from_dict(data["random"])
+            instance.__seed = data["random"]["seed"]
+
+        instance.__restart_recording()
         return instance
+
+    def snapshot(self):
+        """
+        Converts the state that to_dict leaves out into a dictionary: the
+        entities of the World, the whole state of the player, its ability
+        and the enemies, and the hits, events and particles still pending.
+        Together with to_dict, which holds the random streams, it resumes
+        the run exactly where it was taken.
+
+        :return: A dictionary from which from_keyframe resumes the run.
+        """
+        enemies = self.__enemies.sprites()
+        codec = SnapshotCodec(enemies)
+        player = self.__player.sprite
+        snapshot = {
+            "frame": self.__frame,
+            "player": None if player is None else player.snapshot(),
+            "enemies": [enemy.snapshot() for enemy in enemies],
+            "world": self.__world.to_dict(codec.encode),
+            "hits": HitBuffer().to_dict(),
+            "events": self.__events.to_dict(codec.encode),
+            "particles": self.__particles.to_dict(),
+        }
+        snapshot["surfaces"] = codec.to_dict()
+        return snapshot
+
+    @classmethod
+    def from_keyframe(cls, keyframe, game, player_name, terrain):
+        """
+        Creates an instance of Play resuming a run from a keyframe of its
+        replay.
+
+        :param keyframe: Dictionary created by to_dict, without the
+            terrain, with the dictionary created by snapshot under
+            "snapshot".
+        :param game: The main game instance.
+        :param player_name: name of the player's type.
+        :param terrain: Dictionary of the terrain of the run.
+        :return: A restored instance of Play.
+        """
+        snapshot = keyframe["snapshot"]
+        instance = cls(game, player_name, keyframe["random"]["seed"],
+                       terrain=Terrain.from_dict(terrain))
+        if snapshot["player"] is None:
+            instance.__player.empty()
+        else:
+            instance.__player.sprite.restore(snapshot["player"])
+
+        # Enemies are created before the World is restored, which drops
+        # the entities they create and gives them back their own
+        enemies = [EnemyClassMap[data["type"]]()
+                   for data in snapshot["enemies"]]
+        codec = SnapshotCodec(enemies, snapshot["surfaces"])
+        World.from_dict(snapshot["world"], codec.decode)
+        for enemy, data in zip(enemies, snapshot["enemies"]):
+            enemy.restore(data)
+        instance.__enemies = pygame.sprite.Group(enemies)
+
+        HitBuffer.from_dict(snapshot["hits"])
+        EventBus.from_dict(snapshot["events"], codec.decode)
+        ParticleSystem.from_dict(snapshot["particles"])
+        RandomService.from_dict(keyframe["random"])
+        instance.__spawn_timer = keyframe["spawn_timer"]
+        instance.__speed_multiplier = keyframe["speed_multiplier"]
+        instance.__hud.add_score(keyframe["score"])
+        instance.__frame = snapshot["frame"]
+
+        instance.__restart_recording()
+        return instance
+
+    def __restart_recording(self):
+        """
+        Starts the recording of a restored run from the restored state.
+        """
+        if self.__replay is None:
+            return
+        start_state = self.to_dict()
+        del start_state["terrain"]
+        self.__frame = 0
+        self.__replay = Replay(self.__seed, self.__player_name,
+                               self.__terrain.to_dict(), start_state)
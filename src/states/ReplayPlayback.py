@@ -0,0 +1,187 @@
+import json
+
+import pygame
+
+from config.Constants import Constants, States
+from src.states.AbstractState import AbstractState
+from src.states.StateRegistry import StateRegistry
+from src.utils.InputManager import InputManager
+from src.utils.QualityGovernor import QualityGovernor
+
+
+class ReplayPlayback(AbstractState):
+    """
+    Plays a recorded run back by feeding its input to a Play state frame
+    by frame. The game ends when the recording does.
+    """
+
+    def __init__(self, game, replay, start_frame=0):
+        """
+        Initializes the playback.
+
+        :param game: The main game instance.
+        :param replay: The replay to be played.
+        :param start_frame: Frame the playback starts from.
+        """
+        super().__init__(game)
+        self.__replay = replay
+        self.__input = InputManager()
+        self.__quality_governor = QualityGovernor()
+        # The recorded tiers are replayed instead of adapting to this run
+        self.__quality_governor.adaptive = False
+        self.__play = None
+        self.__frame = 0
+        self.__diverged_frame = None
+        self.seek(start_frame)
+
+    @property
+    def frame(self):
+        """
+        Returns the index of the next frame to be played.
+
+        :return: Frame index.
+        """
+        return self.__frame
+
+    @property
+    def play(self):
+        """
+        Returns the Play state being driven by the replay.
+
+        :return: The Play state.
+        """
+        return self.__play
+
+    @property
+    def diverged_frame(self):
+        """
+        Returns the first keyframe the replayed game did not match.
+
+        :return: Index of the frame, or None while the playback matches
+            the recording.
+        """
+        return self.__diverged_frame
+
+    def seek(self, frame):
+        """
+        Moves the playback to a frame. The game is resumed from the last
+        keyframe before the frame, unless the current frame is closer, and
+        simulated up to the frame without being drawn, so a seek lands on
+        the state the recorded run had at that frame. Keyframes of older
+        replays cannot be resumed from, so they are replayed from the start
+        of the run instead.
+
+        :param frame: Index of the frame.
+        """
+        frame = max(0, min(frame, len(self.__replay)))
+        index = self.__replay.last_keyframe(frame)
+        keyframe = None if index is None else self.__replay.keyframe(index)
+        if keyframe is not None and "snapshot" in keyframe:
+            if self.__play is None or not index <= self.__frame <= frame:
+                self.__resume(index, keyframe)
+        elif self.__play is None or frame < self.__frame:
+            self.__restart()
+        while self.__frame < frame and self.__is_playing():
+            self.__step(1 / Constants.FPS)
+
+    def update(self, dt):
+        """
+        Plays the next recorded frame.
+
+        :param dt: Time since last update.
+        """
+        if self.__is_playing():
+            self.__step(dt)
+        else:
+            self.__input.stop_playback()
+            self._is_running = False
+
+    def draw(self, screen):
+        """
+        Draws the game being replayed.
+
+        :param screen: The screen surface to draw on.
+        """
+        self.__play.draw(screen)
+
+    def handle_events(self, events):
+        """
+        Stops the playback when the window is closed or escape is pressed.
+
+        :param events: List of pygame events to process.
+        """
+        for event in events:
+            if (event.type == pygame.QUIT or event.type == pygame.KEYDOWN
+                    and event.key == pygame.K_ESCAPE):
+                self.__input.stop_playback()
+                self._is_running = False
+
+    def __restart(self):
+        """
+        Recreates the game the recorded run started from.
+        """
+        play_class = StateRegistry.get(States.PLAY)
+        self.__frame = 0
+        start_state = self.__replay.start_state
+        if start_state is not None:
+            self.__play = play_class.from_dict(start_state, self._game,
+                                               self.__replay.player_name)
+        else:
+            self.__play = play_class(self._game, self.__replay.player_name,
+                                     self.__replay.seed)
+
+    def __resume(self, index, keyframe):
+        """
+        Recreates the game from a keyframe of the recorded run.
+
+        :param index: Index of the frame the keyframe precedes.
+        :param keyframe: The keyframe.
+        """
+        play_class = StateRegistry.get(States.PLAY)
+        self.__frame = index
+        self.__play = play_class.from_keyframe(keyframe, self._game,
+                                               self.__replay.player_name,
+                                               self.__replay.terrain)
+
+    def __is_playing(self):
+        """
+        Indicates whether there are frames left and the run has not ended.
+
+        :return: True while the playback can go on.
+        """
+        return (self.__frame < len(self.__replay)
+                and self.__play.next_state is self.__play)
+
+    def __step(self, dt):
+        """
+        Feeds the input of the next frame and updates the game.
+
+        :param dt: Time since last update.
+        """
+        keyframe = self.__replay.keyframe(self.__frame)
+        if keyframe is not None and self.__diverged_frame is None:
+            self.__check(keyframe)
+        key_mask, button_mask, tier, mouse_position = self.__replay.frame(
+            self.__frame)
+        self.__input.feed(key_mask, button_mask, mouse_position)
+        self.__quality_governor.set_tier(tier)
+        self.__play.update(dt)
+        self.__frame += 1
+
+    def __check(self, keyframe):
+        """
+        Compares the game with a keyframe of the recording, reporting the
+        first frame where they differ.
+
+        :param keyframe: Dictionary of the recorded state, without the
+            terrain.
+        """
+        state = self.__play.to_dict()
+        del state["terrain"]
+        keyframe = {key: value for key, value in keyframe.items()
+                    if key != "snapshot"}
+        # Keyframes of loaded replays went through JSON
+        if json.loads(json.dumps(state)) != json.loads(json.dumps(keyframe)):
+            self.__diverged_frame = self.__frame
+            print("Warning: replay diverged from its recording at frame "
+                  "{}".format(self.__frame))
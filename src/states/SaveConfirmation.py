@@ -1,12 +1,12 @@
-import json
 import os
 
 import pygame
 
-from config.Constants import Constants, Sounds
+from config.Constants import Constants, Sounds, States
 from src.states.AbstractState import AbstractState
-from src.states.Menu import Menu
+from src.states.StateRegistry import StateRegistry
 from src.utils.AudioManager import AudioManager
+from src.utils.SaveGame import SaveGame
 
 
 class SaveConfirmation(AbstractState):
@@ -27,6 +27,12 @@ class SaveConfirmation(AbstractState):
         self._next_state = self
         self.__audio_manager = AudioManager()
 
+        # Semi-transparent surface to darken the game, built once so it can
+        # be reused every frame
+        self.__overlay = pygame.Surface((Constants.WIDTH, Constants.HEIGHT))
+        self.__overlay.fill(pygame.Color('black'))
+        self.__overlay.set_alpha(128)  # 128 is 50% opacity
+
         # Font configuration for title and options
         self.__font_title = pygame.font.Font(None, 74)
         self.__font_options = pygame.font.Font(None, 48)
@@ -73,10 +79,7 @@ class SaveConfirmation(AbstractState):
         """
         self.__play_state.draw(screen)
 
-        overlay = pygame.Surface((Constants.WIDTH, Constants.HEIGHT))
-        overlay.fill(pygame.Color('black'))
-        overlay.set_alpha(128)
-        screen.blit(overlay, (0, 0))
+        screen.blit(self.__overlay, (0, 0))
 
         screen.blit(self.__title, self.__title_rect)
         for surface, rect in zip(self.__options_surfaces,
@@ -103,7 +106,7 @@ class SaveConfirmation(AbstractState):
             if event.type == pygame.QUIT:
                 self._is_running = False
 
-    def __save_and_leave_session(self, file_name="saves/save_game.json"):
+    def __save_and_leave_session(self, file_name=Constants.SAVE_FILE):
         """
         Saves the current game progress to a file and leaves the session.
 
@@ -115,8 +118,7 @@ class SaveConfirmation(AbstractState):
 
             data = self.__play_state.to_dict()
 
-            with open(file_name, 'w') as file:
-                json.dump(data, file, indent=4)
+            SaveGame.save(data, file_name)
 
         except (IOError, OSError) as e:
             print("Erro ao salvar o progresso: {}".format(e))
@@ -129,7 +131,8 @@ class SaveConfirmation(AbstractState):
         """
         self.__audio_manager.play_sound(Sounds.CLICK)
         if self.__return_to_menu_after_saving:
-            self._next_state = Menu(self._game)
+            self._next_state = StateRegistry.create(States.MENU, self._game)
+            self.__audio_manager.unload_session_banks()
             self.__audio_manager.unpause_music()
         else:
             self._is_running = False
@@ -0,0 +1,39 @@
+import importlib
+
+
+class StateRegistry:
+    """
+    Creates the game states by name (see States), importing the module of
+    a state the first time it is needed. States only know each other by
+    name, so starting the game imports the menu alone, while Play, the
+    entities and the abilities load when a run first starts.
+    """
+
+    _classes = {}
+
+    @classmethod
+    def get(cls, name):
+        """
+        Returns the class of a state, importing its module if needed.
+
+        :param name: Name of the state (see States).
+        :return: The state class.
+        """
+        state_class = cls._classes.get(name)
+        if state_class is None:
+            module = importlib.import_module(f"src.states.{name}")
+            state_class = getattr(module, name)
+            cls._classes[name] = state_class
+        return state_class
+
+    @classmethod
+    def create(cls, name, *args, **kwargs):
+        """
+        Creates a state.
+
+        :param name: Name of the state (see States).
+        :param args: Positional arguments of the state constructor.
+        :param kwargs: Keyword arguments of the state constructor.
+        :return: The new state.
+        """
+        return cls.get(name)(*args, **kwargs)
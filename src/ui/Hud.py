@@ -2,6 +2,7 @@ import pygame
 
 from config.Constants import Colors
 from config.Constants import Constants
+from src.utils.QualityGovernor import QualityGovernor
 
 
 class Hud:
@@ -47,16 +48,29 @@ class Hud:
         self.__ability_bar_color = Colors.BLUE
         self.__ability_bar_full_color = Colors.LIGHT_BLUE
 
+        # Texts are re-rendered every few frames on lower quality tiers
+        self.__quality_governor = QualityGovernor()
+        self.__frames_until_refresh = 0
+        self.__health_text = None
+        self.__ability_text = None
+        self.__score_text = None
+
     def draw(self, screen):
         """
         Draws the HUD on the screen.
         
         :param screen: The screen surface to draw on.
         """
+        refresh_texts = self.__frames_until_refresh <= 0
+        if refresh_texts:
+            self.__frames_until_refresh = self.__quality_governor.get(
+                "hud_interval")
+        self.__frames_until_refresh -= 1
+
         # Draw health bar background
-        pygame.draw.rect(screen, self.__health_bar_bg_color,
-                         (self.__health_bar_x, self.__health_bar_y,
-                          self.__health_bar_width, self.__health_bar_height))
+        screen.fill(self.__health_bar_bg_color,
+                    (self.__health_bar_x, self.__health_bar_y,
+                     self.__health_bar_width, self.__health_bar_height))
 
         # Calculate health percentage
         health_percentage = self.__player.health_points / self.__player.get_initial_health()
@@ -69,15 +83,16 @@ class Hud:
 
         # Draw health bar
         if health_width > 0:
-            pygame.draw.rect(screen, health_color,
-                             (self.__health_bar_x, self.__health_bar_y,
-                              health_width, self.__health_bar_height))
+            screen.fill(health_color,
+                        (self.__health_bar_x, self.__health_bar_y,
+                         health_width, self.__health_bar_height))
 
         # Draw health text
-        health_text = self.__font.render(
-            f"Health: {self.__player.health_points}/{self.__player.get_initial_health()}",
-            True, self.__text_color)
-        screen.blit(health_text,
+        if refresh_texts:
+            self.__health_text = self.__font.render(
+                f"Health: {self.__player.health_points:g}/{self.__player.get_initial_health()}",
+                True, self.__text_color)
+        screen.blit(self.__health_text,
                     (self.__health_bar_x, self.__health_bar_y - 15))
 
         # Calculate time cooldown percentage
@@ -95,46 +110,48 @@ class Hud:
                                   ability_cooldown_percentage)
 
         # Draw time cooldown bar background
-        pygame.draw.rect(screen, self.__ability_bar_bg_color,
-                         (self.__ability_bar_x, self.__ability_bar_y,
-                          self.__ability_bar_width,
-                          self.__ability_bar_height))
+        screen.fill(self.__ability_bar_bg_color,
+                    (self.__ability_bar_x, self.__ability_bar_y,
+                     self.__ability_bar_width,
+                     self.__ability_bar_height))
         # Draw time cooldown bar
         if self.__player.get_ready_ability:
             if ability_duration_percentage >= 1:
-                pygame.draw.rect(screen, self.__ability_bar_full_color,
-                                 (self.__ability_bar_x,
-                                  self.__ability_bar_y,
-                                  self.__ability_bar_width,
-                                  self.__ability_bar_height))
+                screen.fill(self.__ability_bar_full_color,
+                            (self.__ability_bar_x,
+                             self.__ability_bar_y,
+                             self.__ability_bar_width,
+                             self.__ability_bar_height))
             elif self.__player.has_durable_ability:
-                pygame.draw.rect(screen, self.__ability_bar_color,
-                                 (self.__ability_bar_x,
-                                  self.__ability_bar_y,
-                                  ability_duration_width,
-                                  self.__ability_bar_height))
+                screen.fill(self.__ability_bar_color,
+                            (self.__ability_bar_x,
+                             self.__ability_bar_y,
+                             ability_duration_width,
+                             self.__ability_bar_height))
         else:
-            pygame.draw.rect(screen, self.__ability_bar_color,
-                             (self.__ability_bar_x,
-                              self.__ability_bar_y,
-                              ability_cooldown_width,
-                              self.__ability_bar_height))
+            screen.fill(self.__ability_bar_color,
+                        (self.__ability_bar_x,
+                         self.__ability_bar_y,
+                         ability_cooldown_width,
+                         self.__ability_bar_height))
 
         # Draw time cooldown text
         if self.__player.get_ready_ability:
             percentage = ability_duration_percentage
         else:
             percentage = ability_cooldown_percentage
-        time_cooldown_text = self.__font.render(
-            f"Ability: {int(percentage * 100)} %",
-            True, self.__text_color)
-        screen.blit(time_cooldown_text,
+        if refresh_texts:
+            self.__ability_text = self.__font.render(
+                f"Ability: {int(percentage * 100)} %",
+                True, self.__text_color)
+        screen.blit(self.__ability_text,
                     (self.__ability_bar_x, self.__ability_bar_y - 15))
 
         # Draw score
-        score_text = self.__font.render(f"Score: {self.__score}", True,
-                                        self.__text_color)
-        screen.blit(score_text, (self.__score_x, self.__score_y))
+        if refresh_texts:
+            self.__score_text = self.__font.render(f"Score: {self.__score}",
+                                                   True, self.__text_color)
+        screen.blit(self.__score_text, (self.__score_x, self.__score_y))
 
     def add_score(self, points):
         """
@@ -0,0 +1,150 @@
+import json
+import os
+import zlib
+
+import pygame
+
+from config.Constants import Constants
+
+
+class AssetLoader:
+    """
+    Loads the images and sounds of the game.
+    When the assets were baked (see tools.bake_assets), images are read
+    already scaled from a pack of compressed raw pixels and sounds from
+    WAVs in the mixer's native format. Assets missing from the bake are
+    loaded from their sources.
+
+    This class implements the Singleton design pattern so that the index
+    of the baked assets is read once.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(AssetLoader, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr(self, "_initialized") and self._initialized:
+            return
+        self._initialized = True
+        self.__pack_path = None
+        self.__images = {}
+        self.__sounds = {}
+        self.__mixer_format = None
+        self.__counters = {"baked": 0, "source": 0}
+        self.open(Constants.BAKED_ASSETS_DIRECTORY)
+
+    def open(self, directory):
+        """
+        Reads the index of the assets baked into a directory. Without a
+        directory, or without an index in it, every asset is loaded from
+        its source.
+
+        :param directory: Directory of the baked assets, or None.
+        """
+        index = {}
+        if directory is not None:
+            self.__pack_path = os.path.join(directory,
+                                            Constants.BAKED_IMAGES_FILE)
+            try:
+                with open(os.path.join(directory,
+                                       Constants.BAKED_INDEX_FILE)) as file:
+                    index = json.load(file)
+            except (IOError, OSError, ValueError):
+                pass
+        self.__images = index.get("images", {})
+        self.__sounds = {source: os.path.join(directory, baked)
+                         for source, baked in index.get("sounds",
+                                                        {}).items()}
+        mixer_format = index.get("mixer")
+        self.__mixer_format = tuple(mixer_format) if mixer_format else None
+
+    @staticmethod
+    def image_key(path, size=None):
+        """
+        Names an image at a size, as indexed in the baked pack.
+
+        :param path: Path of the source image.
+        :param size: Size the image is scaled to, or None for its own.
+        :return: The key of the image.
+        """
+        if size is None:
+            return path
+        return f"{path}@{int(size[0])}x{int(size[1])}"
+
+    @staticmethod
+    def decode_source(path, size=None):
+        """
+        Decodes a source image and scales it.
+
+        :param path: Path of the source image.
+        :param size: Size the image is scaled to, or None for its own.
+        :return: The unconverted surface.
+        """
+        image = pygame.image.load(path)
+        if size is not None:
+            image = pygame.transform.scale(image,
+                                           (int(size[0]), int(size[1])))
+        return image
+
+    @staticmethod
+    def read_pack(pack_path, entry):
+        """
+        Reads an image from a pack of compressed raw pixels.
+
+        :param pack_path: Path of the pack.
+        :param entry: Index entry of the image, with its offset and length
+            in the pack, its size and whether it has alpha.
+        :return: The unconverted surface.
+        """
+        with open(pack_path, "rb") as file:
+            file.seek(entry["offset"])
+            pixels = zlib.decompress(file.read(entry["length"]))
+        return pygame.image.frombytes(pixels, entry["size"],
+                                      "RGBA" if entry["alpha"] else "RGB")
+
+    def load_image(self, path, size=None, alpha=True):
+        """
+        Loads an image scaled to a size and converted to the display
+        format.
+
+        :param path: Path of the source image.
+        :param size: Size the image is scaled to, or None for its own.
+        :param alpha: Whether the image keeps its per-pixel alpha.
+        :return: The surface.
+        """
+        entry = self.__images.get(self.image_key(path, size))
+        if entry is not None and entry["alpha"] == alpha:
+            image = self.read_pack(self.__pack_path, entry)
+            self.__counters["baked"] += 1
+        else:
+            image = self.decode_source(path, size)
+            self.__counters["source"] += 1
+        return image.convert_alpha() if alpha else image.convert()
+
+    def sound_path(self, path):
+        """
+        Returns the file a sound must be loaded from: its baked version
+        when it was baked for the format the mixer runs at, its source
+        otherwise.
+
+        :param path: Path of the source sound.
+        :return: Path of the file to be loaded.
+        """
+        baked = self.__sounds.get(path)
+        if baked is None or pygame.mixer.get_init() != self.__mixer_format:
+            return path
+        return baked
+
+    @property
+    def counters(self):
+        """
+        Returns how many images were loaded from the bake and from their
+        sources.
+
+        :return: Dictionary mapping the origin to image counts.
+        """
+        return dict(self.__counters)
@@ -1,5 +1,11 @@
+from collections import deque
+
 import pygame
 
+from config.Constants import Constants, Voices
+from src.utils.AssetLoader import AssetLoader
+from src.utils.VoiceManager import VoiceManager
+
 
 class AudioManager:
     """
@@ -25,23 +31,26 @@ class AudioManager:
         self.volume_global_sounds = 1.0
         self.volume_global_music = 1.0
 
-        # Sound effects
-        self.sounds = {
-            "boom": pygame.mixer.Sound("assets/sounds/boom.wav"),
-            "click": pygame.mixer.Sound("assets/sounds/retro_click.wav"),
-            "critical shot": pygame.mixer.Sound(
-                "assets/sounds/critical_shot.wav"),
-            "death": pygame.mixer.Sound("assets/sounds/death.wav"),
-            "game over": pygame.mixer.Sound("assets/sounds/game_over.wav"),
-            "gun shot": pygame.mixer.Sound("assets/sounds/gun_shot.wav"),
-            "hit": pygame.mixer.Sound("assets/sounds/hit.wav"),
-            "launcher": pygame.mixer.Sound("assets/sounds/launcher.wav"),
-            "laser beam": pygame.mixer.Sound("assets/sounds/laser_beam.wav"),
-            "laser shot": pygame.mixer.Sound("assets/sounds/laser_shot.wav"),
-            "plasma": pygame.mixer.Sound("assets/sounds/plasma.wav"),
-            "recharged": pygame.mixer.Sound("assets/sounds/recharged.wav"),
-            "stomp": pygame.mixer.Sound("assets/sounds/stomp.wav")
+        # Sound effect files, decoded when their bank is loaded
+        self.sound_files = {
+            "boom": "assets/sounds/boom.wav",
+            "click": "assets/sounds/retro_click.wav",
+            "critical shot": "assets/sounds/critical_shot.wav",
+            "death": "assets/sounds/death.wav",
+            "game over": "assets/sounds/game_over.wav",
+            "gun shot": "assets/sounds/gun_shot.wav",
+            "hit": "assets/sounds/hit.wav",
+            "launcher": "assets/sounds/launcher.wav",
+            "laser beam": "assets/sounds/laser_beam.wav",
+            "laser shot": "assets/sounds/laser_shot.wav",
+            "plasma": "assets/sounds/plasma.wav",
+            "recharged": "assets/sounds/recharged.wav",
+            "stomp": "assets/sounds/stomp.wav"
         }
+        # Decoded sounds of the loaded banks
+        self.sounds = {}
+        self.sound_bytes = {}
+        self.loaded_banks = set()
 
         # Base volume for each sound
         self.base_volumes = {
@@ -60,6 +69,28 @@ class AudioManager:
             "stomp": 0.3
         }
 
+        # Voice category and priority of each sound
+        self.voices = {
+            "boom": (Voices.IMPACTS, 3),
+            "click": (Voices.INTERFACE, 4),
+            "critical shot": (Voices.WEAPONS, 3),
+            "death": (Voices.DEATHS, 1),
+            "game over": (Voices.INTERFACE, 5),
+            "gun shot": (Voices.WEAPONS, 2),
+            "hit": (Voices.IMPACTS, 2),
+            "launcher": (Voices.WEAPONS, 3),
+            "laser beam": (Voices.WEAPONS, 1),
+            "laser shot": (Voices.WEAPONS, 2),
+            "plasma": (Voices.WEAPONS, 2),
+            "recharged": (Voices.INTERFACE, 3),
+            "stomp": (Voices.IMPACTS, 1)
+        }
+        self.voice_manager = VoiceManager(Constants.VOICE_CHANNELS)
+
+        # Sounds requested during a frame wait here until update plays
+        # them, so gameplay code never calls into the mixer
+        self.sound_queue = deque(maxlen=Constants.AUDIO_QUEUE_SIZE)
+
         self.songs = {
             "play": "assets/sounds/soundtrack.mp3"
         }
@@ -69,12 +100,95 @@ class AudioManager:
         }
 
         self.current_music_name = None
-        self.update_sounds_volume()
+        self.load_bank(Constants.CORE_SOUND_BANK)
+
+    def load_bank(self, bank):
+        """
+        Decodes the sounds of a bank, unless it is already loaded.
+        Characters and enemies without sounds of their own have no bank.
+
+        :param bank: Name of the bank (see Constants.SOUND_BANKS).
+        """
+        if bank in self.loaded_banks or bank not in Constants.SOUND_BANKS:
+            return
+        frequency, size, channels = pygame.mixer.get_init()
+        bytes_per_second = frequency * abs(size) // 8 * channels
+        for name in Constants.SOUND_BANKS[bank]:
+            sound = pygame.mixer.Sound(
+                AssetLoader().sound_path(self.sound_files[name]))
+            sound.set_volume(self.base_volumes.get(name, 1.0)
+                             * self.volume_global_sounds)
+            self.sounds[name] = sound
+            self.sound_bytes[name] = round(sound.get_length()
+                                           * bytes_per_second)
+        self.loaded_banks.add(bank)
+
+    def unload_bank(self, bank):
+        """
+        Releases the decoded sounds of a bank. Its sounds requested from
+        now on are skipped until the bank is loaded again.
+
+        :param bank: Name of the bank (see Constants.SOUND_BANKS).
+        """
+        if bank not in self.loaded_banks:
+            return
+        for name in Constants.SOUND_BANKS[bank]:
+            self.sounds.pop(name).stop()
+            del self.sound_bytes[name]
+        self.loaded_banks.remove(bank)
+
+    def unload_session_banks(self):
+        """
+        Releases every bank but the core one. Called when a game session
+        ends.
+        """
+        for bank in list(self.loaded_banks):
+            if bank != Constants.CORE_SOUND_BANK:
+                self.unload_bank(bank)
+
+    @property
+    def bank_bytes(self):
+        """
+        Returns the decoded PCM bytes held by each loaded bank.
+
+        :return: Dictionary mapping bank names to bytes.
+        """
+        return {bank: sum(self.sound_bytes[name]
+                          for name in Constants.SOUND_BANKS[bank])
+                for bank in self.loaded_banks}
 
     def play_sound(self, sound_name: str):
-        sound = self.sounds.get(sound_name)
-        if sound:
-            sound.play()
+        """
+        Requests a sound, played at the next update.
+
+        :param sound_name: Name of the sound (see Sounds).
+        """
+        self.sound_queue.append(sound_name)
+
+    def update(self):
+        """
+        Plays the sounds requested since the last update. Called once per
+        frame; identical sounds requested within the frame are merged into
+        one voice.
+        """
+        self.voice_manager.new_frame()
+        while self.sound_queue:
+            sound_name = self.sound_queue.popleft()
+            sound = self.sounds.get(sound_name)
+            if sound:
+                category, priority = self.voices[sound_name]
+                self.voice_manager.play(sound_name, sound, category,
+                                        priority)
+
+    def play_event_sounds(self, events):
+        """
+        Plays the sounds of a batch of gameplay events.
+
+        :param events: List of events with a sound (see Events).
+        """
+        for event in events:
+            if event.sound:
+                self.play_sound(event.sound)
 
     def play_music(self, music_name: str, loop: int = -1):
         if self.current_music_name == music_name:
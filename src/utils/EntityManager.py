@@ -0,0 +1,73 @@
+import numpy as np
+
+from config.Constants import Constants
+from src.ecs.Components import Components
+from src.ecs.World import World
+
+
+class EntityManager:
+    """
+    Manages the lifecycle of the entities of a game session.
+    Removes entities that left the screen and reports how many entities
+    are alive in each group. Entities that outlive their lifetime are
+    removed by the LifetimeSystem.
+    """
+
+    def __init__(self, margin=0):
+        """
+        Initializes the entity manager.
+
+        :param margin: Distance outside the screen an entity may travel
+            before being culled.
+        """
+        self.__world = World()
+        self.__groups = {}
+        self.__cullable = []
+        self.__bounds = (-margin, -margin, Constants.WIDTH + margin,
+                         Constants.HEIGHT + margin)
+
+    def register(self, name, group, cull=True):
+        """
+        Registers a group of entities to be tracked.
+
+        :param name: Name used to report the group.
+        :param group: Tag component of the group (see Components).
+        :param cull: Whether offscreen entities of the group must be
+            removed.
+        """
+        if name in self.__groups and name in self.__cullable:
+            self.__cullable.remove(name)
+        self.__groups[name] = group
+        if cull:
+            self.__cullable.append(name)
+
+    def cull(self):
+        """
+        Removes the entities of the cullable groups that are outside the
+        screen.
+        """
+        left, top, right, bottom = self.__bounds
+        for name in self.__cullable:
+            for archetype in self.__world.query(self.__groups[name],
+                                                Components.POSITION,
+                                                Components.SIZE):
+                sizes = archetype.column(Components.SIZE)
+                corners = Components.top_left(
+                    archetype.column(Components.POSITION), sizes)
+                ends = corners + sizes
+                outside = np.flatnonzero(
+                    (corners[:, 0] >= right) | (ends[:, 0] <= left) |
+                    (corners[:, 1] >= bottom) | (ends[:, 1] <= top))
+                for entity in archetype.entities[outside].tolist():
+                    self.__world.destroy(entity)
+
+    @property
+    def live_counts(self):
+        """
+        Returns the number of live entities in each registered group.
+
+        :return: Dictionary mapping group names to entity counts.
+        """
+        return {name: self.__world.count(group)
+                for name, group in self.__groups.items()}
+
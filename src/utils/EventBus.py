@@ -0,0 +1,117 @@
+from src.utils.Events import Events
+
+
+class EventBus:
+    """
+    Queues the gameplay events published during an iteration and delivers
+    them at the end of it. Each subscriber receives, at once, the list of
+    the events of the type it subscribed to, in the order they were
+    published. Events of types nobody subscribed to are dropped.
+
+    This class implements the Singleton design pattern so that any entity
+    can publish events on the same bus.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(EventBus, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr(self, "_initialized") and self._initialized:
+            return
+        self._initialized = True
+        self.__subscribers = {}
+        self.__queues = {}
+
+    def reset(self):
+        """
+        Removes every subscriber and drops the queued events.
+        """
+        self.__subscribers.clear()
+        self.__queues.clear()
+
+    def subscribe(self, event_type, handler):
+        """
+        Subscribes to a type of event.
+
+        :param event_type: The event type (see Events).
+        :param handler: Function receiving the list of events of the type
+            published in an iteration.
+        """
+        self.__subscribers.setdefault(event_type, []).append(handler)
+        self.__queues.setdefault(event_type, [])
+
+    def unsubscribe(self, event_type, handler):
+        """
+        Cancels a subscription. Unknown subscriptions are ignored.
+
+        :param event_type: The event type.
+        :param handler: The subscribed function.
+        """
+        handlers = self.__subscribers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+        if not handlers:
+            self.__subscribers.pop(event_type, None)
+            self.__queues.pop(event_type, None)
+
+    def publish(self, event):
+        """
+        Queues an event until the end of the iteration.
+
+        :param event: The event.
+        """
+        queue = self.__queues.get(type(event))
+        if queue is not None:
+            queue.append(event)
+
+    def to_dict(self, encode):
+        """
+        Converts the queued events into a dictionary. Subscribers are not
+        included; they are registered again by whoever owns them.
+
+        :param encode: Function converting the fields of the events into
+            JSON values.
+        :return: A dictionary representing the queues.
+        """
+        return {"queues": [[event_type.__name__,
+                            [[encode(field) for field in event]
+                             for event in events]]
+                           for event_type, events in self.__queues.items()
+                           if events]}
+
+    @classmethod
+    def from_dict(cls, data, decode):
+        """
+        Replaces the queued events with the ones of a dictionary, keeping
+        the current subscribers. Events of types nobody subscribed to are
+        dropped.
+
+        :param data: Dictionary created by to_dict.
+        :param decode: Function converting the JSON values of the fields
+            back into objects.
+        :return: The restored bus.
+        """
+        instance = cls()
+        for events in instance.__queues.values():
+            events.clear()
+        for type_name, events in data["queues"]:
+            event_type = getattr(Events, type_name)
+            for fields in events:
+                instance.publish(event_type(*map(decode, fields)))
+        return instance
+
+    def dispatch(self):
+        """
+        Delivers the queued events to their subscribers. Events published
+        by the subscribers are delivered in the next iteration.
+        """
+        queues = self.__queues
+        self.__queues = {event_type: [] for event_type in queues}
+        for event_type, events in queues.items():
+            for handler in list(self.__subscribers.get(event_type, ())):
+                if events:
+                    handler(events)
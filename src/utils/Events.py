@@ -0,0 +1,24 @@
+from collections import namedtuple
+
+
+class Events:
+    """
+    Types of the gameplay events published on the EventBus. Events are
+    immutable and only describe what happened; subscribers decide what to
+    do about them.
+    """
+
+    # An enemy ran out of health
+    Killed = namedtuple("Killed", ["enemy", "score", "position", "sound"])
+
+    # The player (Hits.PLAYER) or an enemy entity took damage
+    Damaged = namedtuple("Damaged", ["target", "damage", "cause", "sound"])
+
+    # A weapon or ability fired
+    Fired = namedtuple("Fired", ["position", "sound"])
+
+    # A bomb or a falling enemy reached the ground or the player
+    Landed = namedtuple("Landed", ["position", "sound"])
+
+    # A missile exploded
+    Exploded = namedtuple("Exploded", ["position", "radius", "sound"])
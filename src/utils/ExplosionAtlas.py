@@ -0,0 +1,73 @@
+import pygame
+
+from config.Constants import Colors, Constants
+
+
+class ExplosionAtlas:
+    """
+    Stores pre-rendered explosion animations.
+    The fade-out frames of an explosion are rendered once for each radius
+    and color, and explosions play them back by index.
+
+    This class implements the Singleton design pattern so that every
+    explosion shares the same frames.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(ExplosionAtlas, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr(self, "_initialized") and self._initialized:
+            return
+        self._initialized = True
+        self.__animations = {}
+        self.__num_frames = Constants.EXPLOSION_ANIMATION_FRAMES
+
+    def get_frames(self, radius, color):
+        """
+        Returns the fade-out frames of an explosion, rendering them the
+        first time they are requested.
+
+        :param radius: Radius of the explosion.
+        :param color: Color of the explosion (RGBA).
+        :return: List of surfaces, from opaque to almost transparent.
+        """
+        key = (radius, tuple(color))
+        frames = self.__animations.get(key)
+        if frames is None:
+            frames = self.__render(radius, color)
+            self.__animations[key] = frames
+        return frames
+
+    def __render(self, radius, color):
+        """
+        Renders the fade-out frames of an explosion.
+
+        :param radius: Radius of the explosion.
+        :param color: Color of the explosion (RGBA).
+        :return: List of surfaces.
+        """
+        surface_size = radius * 2
+        base = pygame.Surface((surface_size, surface_size), pygame.SRCALPHA)
+        pygame.draw.circle(base, (color[0], color[1], color[2], 80),
+                           (radius, radius), radius)
+        pygame.draw.circle(base, color, (radius, radius), radius * 0.7)
+        pygame.draw.circle(base, Colors.GLOW_WHITE, (radius, radius),
+                           radius * 0.3)
+
+        frames = [base]
+        for i in range(1, self.__num_frames):
+            frame = base.copy()
+            frame.set_alpha(int(255 * (1 - i / self.__num_frames)))
+            frames.append(frame)
+        return frames
+
+    def clear(self):
+        """
+        Removes every pre-rendered animation.
+        """
+        self.__animations.clear()
@@ -0,0 +1,134 @@
+from collections import defaultdict
+
+import pygame
+
+
+class InputManager:
+    """
+    Holds the player input of the current frame. The input is either
+    captured from pygame or fed from a replay, so gameplay code reads it
+    from here instead of polling pygame directly.
+
+    This class implements the Singleton design pattern so that every
+    entity sees the same input.
+    """
+
+    # Keys used by the gameplay, in the order of their bits in the key mask
+    RECORDED_KEYS = (pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_SPACE)
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(InputManager, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr(self, "_initialized") and self._initialized:
+            return
+        self._initialized = True
+        self.__key_mask = 0
+        self.__button_mask = 0
+        self.__keys = defaultdict(bool)
+        self.__mouse_buttons = (False, False, False)
+        self.__mouse_position = (0, 0)
+        self.__playback = False
+
+    @property
+    def keys(self):
+        """
+        Returns the state of the gameplay keys, indexed by pygame key
+        constants.
+
+        :return: Mapping from key to pressed state.
+        """
+        return self.__keys
+
+    @property
+    def mouse_buttons(self):
+        """
+        Returns the state of the left, middle and right mouse buttons.
+
+        :return: Tuple of pressed states.
+        """
+        return self.__mouse_buttons
+
+    @property
+    def mouse_position(self):
+        """
+        Returns the mouse position.
+
+        :return: Tuple with the mouse x and y coordinates.
+        """
+        return self.__mouse_position
+
+    @property
+    def playback(self):
+        """
+        Indicates whether the input is being fed from a replay.
+
+        :return: True during replay playback.
+        """
+        return self.__playback
+
+    def capture(self):
+        """
+        Reads the input of the current frame from pygame. Does nothing
+        during replay playback.
+        """
+        if self.__playback:
+            return
+        pressed = pygame.key.get_pressed()
+        key_mask = 0
+        for bit, key in enumerate(self.RECORDED_KEYS):
+            if pressed[key]:
+                key_mask |= 1 << bit
+        button_mask = 0
+        for bit, pressed_button in enumerate(pygame.mouse.get_pressed()):
+            if pressed_button:
+                button_mask |= 1 << bit
+        self.__set(key_mask, button_mask, pygame.mouse.get_pos())
+
+    def feed(self, key_mask, button_mask, mouse_position):
+        """
+        Sets the input of the current frame from a replay and switches to
+        playback, ignoring pygame until stop_playback is called.
+
+        :param key_mask: Bit mask of the pressed RECORDED_KEYS.
+        :param button_mask: Bit mask of the pressed mouse buttons.
+        :param mouse_position: Mouse position.
+        """
+        self.__playback = True
+        self.__set(key_mask, button_mask, mouse_position)
+
+    def stop_playback(self):
+        """
+        Goes back to reading the input from pygame.
+        """
+        self.__playback = False
+
+    def to_frame(self):
+        """
+        Returns the compact representation of the current input.
+
+        :return: Tuple with the key mask, button mask and mouse position.
+        """
+        return self.__key_mask, self.__button_mask, self.__mouse_position
+
+    def __set(self, key_mask, button_mask, mouse_position):
+        """
+        Stores the input of the current frame.
+
+        :param key_mask: Bit mask of the pressed RECORDED_KEYS.
+        :param button_mask: Bit mask of the pressed mouse buttons.
+        :param mouse_position: Mouse position.
+        """
+        self.__key_mask = key_mask
+        self.__button_mask = button_mask
+        self.__keys = defaultdict(bool)
+        for bit, key in enumerate(self.RECORDED_KEYS):
+            if key_mask & (1 << bit):
+                self.__keys[key] = True
+        self.__mouse_buttons = tuple(bool(button_mask & (1 << bit))
+                                     for bit in range(3))
+        self.__mouse_position = (mouse_position[0], mouse_position[1])
@@ -0,0 +1,166 @@
+import numpy as np
+import pygame
+
+from config.Constants import Constants, RandomStreams
+from src.utils.QualityGovernor import QualityGovernor
+from src.utils.RandomService import RandomService
+
+
+class ParticleSystem:
+    """
+    Simulates and draws cosmetic particles (sparks, debris) stored in NumPy
+    arrays. Particles never take part in gameplay collision.
+
+    This class implements the Singleton design pattern so that any entity
+    can emit particles into the same system.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(ParticleSystem, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr(self, "_initialized") and self._initialized:
+            return
+        self._initialized = True
+        self.__capacity = Constants.PARTICLE_CAPACITY
+        self.__positions = np.zeros((self.__capacity, 2), dtype=np.float32)
+        self.__velocities = np.zeros((self.__capacity, 2), dtype=np.float32)
+        self.__life = np.zeros(self.__capacity, dtype=np.float32)
+        self.__max_life = np.ones(self.__capacity, dtype=np.float32)
+        self.__colors = np.zeros((self.__capacity, 3), dtype=np.float32)
+        self.__count = 0
+        self.__quality_governor = QualityGovernor()
+        self.__random = RandomService()
+
+    def emit_burst(self, position, count, color, speed, lifetime):
+        """
+        Emits particles in random directions from a point.
+
+        :param position: Point where the particles are emitted.
+        :param count: Number of particles.
+        :param color: Color of the particles (RGB or RGBA).
+        :param speed: Maximum initial speed of the particles.
+        :param lifetime: Maximum lifetime of the particles in seconds.
+        """
+        if count > 0:
+            count = max(1, int(count * self.__quality_governor.get(
+                "particle_ratio")))
+        count = min(count, self.__capacity - self.__count)
+        if count <= 0:
+            return
+        start = self.__count
+        end = start + count
+
+        effects_random = self.__random.numpy_stream(RandomStreams.EFFECTS)
+        angles = effects_random.uniform(0, 2 * np.pi, count)
+        speeds = effects_random.uniform(0.2 * speed, speed, count)
+        self.__positions[start:end] = (position[0], position[1])
+        self.__velocities[start:end, 0] = np.cos(angles) * speeds
+        self.__velocities[start:end, 1] = np.sin(angles) * speeds
+        self.__life[start:end] = effects_random.uniform(0.5 * lifetime,
+                                                        lifetime, count)
+        self.__max_life[start:end] = self.__life[start:end]
+        self.__colors[start:end] = color[:3]
+        self.__count = end
+
+    def update(self, dt):
+        """
+        Moves the particles and removes the ones that died.
+
+        :param dt: Time since last update.
+        """
+        n = self.__count
+        if n == 0:
+            return
+        self.__velocities[:n, 1] += Constants.PARTICLE_GRAVITY * dt
+        self.__positions[:n] += self.__velocities[:n] * dt
+        self.__life[:n] -= dt
+
+        alive = self.__life[:n] > 0
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count < n:
+            for array in (self.__positions, self.__velocities, self.__life,
+                          self.__max_life, self.__colors):
+                array[:alive_count] = array[:n][alive]
+            self.__count = alive_count
+
+    def draw(self, screen):
+        """
+        Draws the particles, blending their color with the screen
+        according to their remaining life.
+
+        :param screen: The screen surface to draw on.
+        """
+        n = self.__count
+        if n == 0:
+            return
+        # Screens rendered below the logical resolution expose their scale
+        scale = getattr(screen, "scale", 1.0)
+        width, height = screen.get_size()
+        size = max(1, round(Constants.PARTICLE_SIZE * scale))
+        xs = (self.__positions[:n, 0] * scale).astype(np.int32)
+        ys = (self.__positions[:n, 1] * scale).astype(np.int32)
+        visible = (xs >= 0) & (xs < width - size) & (ys >= 0) & (
+                ys < height - size)
+        if not visible.any():
+            return
+        xs = xs[visible]
+        ys = ys[visible]
+        alpha = (self.__life[:n] / self.__max_life[:n])[visible, None]
+        colors = self.__colors[:n][visible] * alpha
+
+        pixels = pygame.surfarray.pixels3d(screen)
+        for dx in range(size):
+            for dy in range(size):
+                background = pixels[xs + dx, ys + dy]
+                pixels[xs + dx, ys + dy] = (
+                        background * (1 - alpha) + colors).astype(np.uint8)
+        del pixels
+
+    def clear(self):
+        """
+        Removes every particle.
+        """
+        self.__count = 0
+
+    def to_dict(self):
+        """
+        Converts the live particles into a dictionary.
+
+        :return: A dictionary representing the particles.
+        """
+        n = self.__count
+        return {
+            "positions": self.__positions[:n].tolist(),
+            "velocities": self.__velocities[:n].tolist(),
+            "life": self.__life[:n].tolist(),
+            "max_life": self.__max_life[:n].tolist(),
+            "colors": self.__colors[:n].tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Replaces the particles with the ones of a dictionary.
+
+        :param data: Dictionary created by to_dict.
+        :return: The restored particle system.
+        """
+        instance = cls()
+        n = min(len(data["life"]), instance.__capacity)
+        for array, values in ((instance.__positions, data["positions"]),
+                              (instance.__velocities, data["velocities"]),
+                              (instance.__life, data["life"]),
+                              (instance.__max_life, data["max_life"]),
+                              (instance.__colors, data["colors"])):
+            array[:n] = np.array(values[:n], dtype=array.dtype).reshape(
+                array[:n].shape)
+        instance.__count = n
+        return instance
+
+    def __len__(self):
+        return self.__count
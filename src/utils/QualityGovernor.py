@@ -0,0 +1,157 @@
+import time
+from collections import deque
+
+from config.Constants import Constants
+
+
+class QualityGovernor:
+    """
+    Watches the rolling frame time and steps the visual quality down when
+    the frame budget is exceeded, and back up when there is headroom.
+    Entities read the settings of the current tier through this class.
+
+    This class implements the Singleton design pattern so that every
+    entity sees the same quality tier.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(QualityGovernor, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr(self, "_initialized") and self._initialized:
+            return
+        self._initialized = True
+        self.__tiers = Constants.QUALITY_TIERS
+        self.__tier_index = 0
+        self.__budget = 1000 / Constants.FPS
+        self.__frame_times = deque(maxlen=Constants.QUALITY_FRAME_WINDOW)
+        self.__frame_time_sum = 0
+        self.__frames_since_change = 0
+        self.__history = deque(maxlen=Constants.QUALITY_HISTORY_SIZE)
+        self.__start_time = time.perf_counter()
+        self.adaptive = True
+
+    @property
+    def tier(self):
+        """
+        Returns the settings of the current quality tier.
+
+        :return: Dictionary with the tier settings.
+        """
+        return self.__tiers[self.__tier_index]
+
+    @property
+    def tier_index(self):
+        """
+        Returns the index of the current tier, 0 being the best quality.
+
+        :return: Index of the current tier.
+        """
+        return self.__tier_index
+
+    @property
+    def tier_name(self):
+        """
+        Returns the name of the current tier.
+
+        :return: Name of the current tier.
+        """
+        return self.tier["name"]
+
+    @property
+    def history(self):
+        """
+        Returns the tier changes, oldest first. Each change records the
+        time it happened (in milliseconds since the governor was created,
+        at startup), the previous and new tier names and the average frame
+        time that triggered it.
+
+        :return: List of dictionaries describing the changes.
+        """
+        return list(self.__history)
+
+    @property
+    def average_frame_time(self):
+        """
+        Returns the average frame time over the rolling window.
+
+        :return: Average frame time in milliseconds.
+        """
+        if not self.__frame_times:
+            return 0
+        return self.__frame_time_sum / len(self.__frame_times)
+
+    def get(self, setting):
+        """
+        Returns a setting of the current tier.
+
+        :param setting: Name of the setting.
+        :return: Value of the setting.
+        """
+        return self.tier[setting]
+
+    def record_frame(self, frame_time):
+        """
+        Adds the time spent on a frame to the rolling window and changes
+        the tier if the average is out of budget.
+
+        :param frame_time: Time spent on the frame in milliseconds,
+            excluding the time waiting for the next tick.
+        :return: True if the tier changed.
+        """
+        if len(self.__frame_times) == self.__frame_times.maxlen:
+            self.__frame_time_sum -= self.__frame_times[0]
+        self.__frame_times.append(frame_time)
+        self.__frame_time_sum += frame_time
+        self.__frames_since_change += 1
+
+        if (not self.adaptive
+                or len(self.__frame_times) < self.__frame_times.maxlen):
+            return False
+
+        average = self.average_frame_time
+        if (average > self.__budget * Constants.QUALITY_DOWNGRADE_RATIO
+                and self.__tier_index < len(self.__tiers) - 1
+                and self.__frames_since_change
+                >= Constants.QUALITY_DOWNGRADE_COOLDOWN):
+            self.__change_tier(self.__tier_index + 1, average)
+            return True
+        if (average < self.__budget * Constants.QUALITY_UPGRADE_RATIO
+                and self.__tier_index > 0
+                and self.__frames_since_change
+                >= Constants.QUALITY_UPGRADE_COOLDOWN):
+            self.__change_tier(self.__tier_index - 1, average)
+            return True
+        return False
+
+    def set_tier(self, tier):
+        """
+        Forces a quality tier.
+
+        :param tier: Index or name of the tier.
+        """
+        if isinstance(tier, str):
+            names = [settings["name"] for settings in self.__tiers]
+            tier = names.index(tier)
+        if tier != self.__tier_index:
+            self.__change_tier(tier, self.average_frame_time)
+
+    def __change_tier(self, tier_index, average):
+        """
+        Switches to another tier and records the change.
+
+        :param tier_index: Index of the new tier.
+        :param average: Average frame time that caused the change.
+        """
+        self.__history.append({
+            "time": round((time.perf_counter() - self.__start_time) * 1000),
+            "from": self.tier_name,
+            "to": self.__tiers[tier_index]["name"],
+            "frame_time": average,
+        })
+        self.__tier_index = tier_index
+        self.__frames_since_change = 0
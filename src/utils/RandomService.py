@@ -0,0 +1,129 @@
+import random
+import zlib
+
+import numpy as np
+
+
+class RandomService:
+    """
+    Central source of randomness. Every subsystem draws from its own named
+    stream, derived from a single run seed, so that a run can be reproduced
+    from its seed and one subsystem drawing more numbers does not change
+    what the others get.
+
+    This class implements the Singleton design pattern so that every
+    subsystem shares the same seed.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(RandomService, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr(self, "_initialized") and self._initialized:
+            return
+        self._initialized = True
+        self.__fixed_seed = None
+        self.__seed = None
+        self.__streams = {}
+        self.__numpy_streams = {}
+        self.start_run()
+
+    @property
+    def seed(self):
+        """
+        Returns the seed of the current run.
+
+        :return: The run seed.
+        """
+        return self.__seed
+
+    def set_seed(self, seed):
+        """
+        Fixes the seed used by every run from now on and restarts the
+        streams with it.
+
+        :param seed: Integer seed, or None to draw a new seed for each run.
+        """
+        self.__fixed_seed = seed
+        self.start_run()
+
+    def start_run(self, seed=None):
+        """
+        Restarts every stream for a new run.
+
+        :param seed: Seed of the run. Defaults to the fixed seed, or to a
+            new random seed when none was fixed.
+        :return: The seed of the run.
+        """
+        if seed is None:
+            seed = self.__fixed_seed
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(32)
+        self.__seed = seed
+        self.__streams.clear()
+        self.__numpy_streams.clear()
+        return seed
+
+    def stream(self, name):
+        """
+        Returns the Python random stream of a subsystem.
+
+        :param name: Name of the stream (see RandomStreams).
+        :return: A random.Random instance.
+        """
+        stream = self.__streams.get(name)
+        if stream is None:
+            stream = random.Random(f"{self.__seed}/{name}")
+            self.__streams[name] = stream
+        return stream
+
+    def numpy_stream(self, name):
+        """
+        Returns the NumPy random stream of a subsystem.
+
+        :param name: Name of the stream (see RandomStreams).
+        :return: A numpy.random.Generator instance.
+        """
+        stream = self.__numpy_streams.get(name)
+        if stream is None:
+            stream = np.random.default_rng(
+                [self.__seed, zlib.crc32(name.encode())])
+            self.__numpy_streams[name] = stream
+        return stream
+
+    def to_dict(self):
+        """
+        Converts the seed and the state of the streams into a dictionary.
+        """
+        streams = {}
+        for name, stream in self.__streams.items():
+            version, internal_state, gauss_next = stream.getstate()
+            streams[name] = [version, list(internal_state), gauss_next]
+        return {
+            "seed": self.__seed,
+            "streams": streams,
+            "numpy_streams": {name: stream.bit_generator.state
+                              for name, stream in
+                              self.__numpy_streams.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Restores the seed and the state of the streams from a dictionary.
+
+        :param data: Dictionary created by to_dict.
+        :return: The restored service.
+        """
+        instance = cls()
+        instance.start_run(data["seed"])
+        for name, state in data.get("streams", {}).items():
+            instance.stream(name).setstate((state[0], tuple(state[1]),
+                                            state[2]))
+        for name, state in data.get("numpy_streams", {}).items():
+            instance.numpy_stream(name).bit_generator.state = state
+        return instance
@@ -0,0 +1,55 @@
+class RenderQueue:
+    """
+    Collects the (surface, rect) pairs to be drawn in a frame and submits
+    them with a single Surface.blits call per layer.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty render queue.
+        """
+        self.__layers = {}
+
+    def add(self, surface, rect, layer=0):
+        """
+        Queues a surface to be drawn.
+
+        :param surface: Surface to be drawn.
+        :param rect: Position where the surface is drawn.
+        :param layer: Layer of the surface; lower layers are drawn first.
+        """
+        self.__layers.setdefault(layer, []).append((surface, rect))
+
+    def add_items(self, items, layer=0):
+        """
+        Queues several (surface, rect) pairs.
+
+        :param items: Iterable of (surface, rect) pairs.
+        :param layer: Layer of the surfaces; lower layers are drawn first.
+        """
+        self.__layers.setdefault(layer, []).extend(items)
+
+    def add_group(self, group, layer=0):
+        """
+        Queues the image of every sprite of a group.
+
+        :param group: Sprite group.
+        :param layer: Layer of the sprites; lower layers are drawn first.
+        """
+        self.__layers.setdefault(layer, []).extend(
+            [(sprite.image, sprite.rect) for sprite in group])
+
+    def flush(self, screen):
+        """
+        Draws every queued surface, layer by layer, and empties the queue.
+
+        :param screen: The screen surface to draw on.
+        """
+        for layer in sorted(self.__layers):
+            items = self.__layers[layer]
+            if items:
+                screen.blits(items, doreturn=False)
+                items.clear()
+
+    def __len__(self):
+        return sum(len(items) for items in self.__layers.values())
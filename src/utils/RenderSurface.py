@@ -0,0 +1,145 @@
+import weakref
+
+import pygame
+
+
+class RenderSurface(pygame.Surface):
+    """
+    Surface smaller than the window that accepts drawing in logical
+    (window) coordinates. Positions and sources are scaled down when they
+    are drawn, and the whole frame is scaled up once when presented.
+    """
+
+    def __init__(self, logical_size, render_size, window):
+        """
+        Initializes the render surface.
+
+        :param logical_size: Size of the coordinate system used by the game.
+        :param render_size: Internal resolution the frame is rendered at.
+        :param window: The display surface, used to match its pixel format.
+        """
+        super().__init__(render_size, 0, window)
+        self.__logical_size = tuple(logical_size)
+        self.__scale_x = render_size[0] / logical_size[0]
+        self.__scale_y = render_size[1] / logical_size[1]
+        self.__scaled_sources = weakref.WeakKeyDictionary()
+
+    @property
+    def scale(self):
+        """
+        Returns the factor between the render and the logical resolution.
+
+        :return: Horizontal scale factor.
+        """
+        return self.__scale_x
+
+    @property
+    def logical_size(self):
+        """
+        Returns the size of the logical coordinate system.
+
+        :return: Tuple with the logical width and height.
+        """
+        return self.__logical_size
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """
+        Draws a surface given in logical coordinates.
+
+        :param source: Surface to be drawn.
+        :param dest: Logical position (point or rect) of the surface.
+        :param area: Logical area of the source to be drawn (optional).
+        :param special_flags: Blending flags.
+        :return: Affected rect, in render coordinates.
+        """
+        if area is not None:
+            area = self.__scale_rect(pygame.Rect(area))
+        return super().blit(self.__scaled_source(source),
+                            self.__scale_point(dest), area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=1):
+        """
+        Draws a sequence of surfaces given in logical coordinates.
+
+        :param blit_sequence: Iterable of (source, dest) pairs, optionally
+            followed by area and special flags.
+        :param doreturn: Whether the affected rects must be returned.
+        :return: List of affected rects or None.
+        """
+        scaled_sequence = []
+        for item in blit_sequence:
+            scaled = [self.__scaled_source(item[0]),
+                      self.__scale_point(item[1])]
+            if len(item) > 2:
+                area = item[2]
+                scaled.append(None if area is None else self.__scale_rect(
+                    pygame.Rect(area)))
+                scaled.extend(item[3:])
+            scaled_sequence.append(tuple(scaled))
+        return super().blits(scaled_sequence, doreturn)
+
+    def fill(self, color, rect=None, special_flags=0):
+        """
+        Fills the surface, or a logical area of it, with a solid color.
+
+        :param color: Fill color.
+        :param rect: Logical area to be filled (optional).
+        :param special_flags: Blending flags.
+        :return: Affected rect, in render coordinates.
+        """
+        if rect is not None:
+            rect = self.__scale_rect(pygame.Rect(rect))
+        return super().fill(color, rect, special_flags)
+
+    def present(self, window):
+        """
+        Scales the rendered frame up to the window.
+
+        :param window: The display surface.
+        """
+        pygame.transform.scale(self, window.get_size(), window)
+
+    def __scale_point(self, point):
+        """
+        Converts a logical position to render coordinates.
+
+        :param point: Logical point or rect.
+        :return: Point in render coordinates.
+        """
+        if isinstance(point, pygame.Rect):
+            x, y = point.topleft
+        else:
+            x, y = point[0], point[1]
+        return int(x * self.__scale_x), int(y * self.__scale_y)
+
+    def __scale_rect(self, rect):
+        """
+        Converts a logical rect to render coordinates.
+
+        :param rect: Logical rect.
+        :return: Rect in render coordinates.
+        """
+        left, top = int(rect.left * self.__scale_x), int(
+            rect.top * self.__scale_y)
+        right, bottom = int(rect.right * self.__scale_x), int(
+            rect.bottom * self.__scale_y)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def __scaled_source(self, source):
+        """
+        Returns a source surface scaled to the render resolution. Scaled
+        surfaces are cached for as long as their source is alive.
+
+        :param source: Surface in logical size.
+        :return: Scaled surface.
+        """
+        scaled = self.__scaled_sources.get(source)
+        if scaled is None:
+            width, height = source.get_size()
+            size = (max(1, round(width * self.__scale_x)),
+                    max(1, round(height * self.__scale_y)))
+            scaled = pygame.transform.scale(source, size)
+            self.__scaled_sources[source] = scaled
+        elif scaled.get_alpha() != source.get_alpha():
+            scaled.set_alpha(source.get_alpha())
+        return scaled
@@ -0,0 +1,190 @@
+import json
+import struct
+import zlib
+
+
+class Replay:
+    """
+    Recording of a Play session: the run seed, the input of every frame and
+    periodic keyframe snapshots of the game state. Playback recreates the
+    run from its input; keyframes are checkpoints the replayed game is
+    compared against to detect it diverging from the recording, and
+    seeking resumes the game from the last keyframe before the target
+    frame. Keyframes of older replays cannot be resumed from, so seeking
+    in them replays the run from its start.
+
+    Files start with a magic number and a version, followed by a zlib
+    stream holding a JSON header (seed, player, terrain, keyframes) and
+    the packed frames.
+    """
+
+    MAGIC = b"AFRP"
+    VERSION = 1
+    # Key mask, mouse button mask, quality tier and mouse position
+    FRAME = struct.Struct("<BBBhh")
+    HEADER_SIZE = struct.Struct("<I")
+
+    def __init__(self, seed, player_name, terrain, start_state=None):
+        """
+        Initializes an empty replay.
+
+        :param seed: Seed of the recorded run.
+        :param player_name: Character played in the run.
+        :param terrain: Dictionary of the terrain of the run.
+        :param start_state: Game state the run started from, without the
+            terrain, when it was restored from a save (optional).
+        """
+        self.__seed = seed
+        self.__player_name = player_name
+        self.__terrain = terrain
+        self.__start_state = start_state
+        self.__frames = bytearray()
+        self.__keyframes = {}
+
+    @property
+    def seed(self):
+        """
+        Returns the seed of the recorded run.
+
+        :return: The run seed.
+        """
+        return self.__seed
+
+    @property
+    def player_name(self):
+        """
+        Returns the character played in the recorded run.
+
+        :return: Name of the character.
+        """
+        return self.__player_name
+
+    @property
+    def terrain(self):
+        """
+        Returns the terrain of the recorded run.
+
+        :return: Dictionary of the terrain.
+        """
+        return self.__terrain
+
+    @property
+    def start_state(self):
+        """
+        Returns the game state the run started from, if it was restored
+        from a save.
+
+        :return: Dictionary of the state with the terrain, or None for a
+            new run.
+        """
+        if self.__start_state is None:
+            return None
+        return dict(self.__start_state, terrain=self.__terrain)
+
+    def __len__(self):
+        """
+        Returns the number of recorded frames.
+        """
+        return len(self.__frames) // self.FRAME.size
+
+    def add_frame(self, key_mask, button_mask, tier, mouse_position):
+        """
+        Appends the input of a frame.
+
+        :param key_mask: Bit mask of the pressed gameplay keys.
+        :param button_mask: Bit mask of the pressed mouse buttons.
+        :param tier: Index of the quality tier used in the frame.
+        :param mouse_position: Mouse position.
+        """
+        self.__frames += self.FRAME.pack(key_mask, button_mask, tier,
+                                         int(mouse_position[0]),
+                                         int(mouse_position[1]))
+
+    def frame(self, index):
+        """
+        Returns the input of a frame.
+
+        :param index: Index of the frame.
+        :return: Tuple with the key mask, button mask, quality tier and
+            mouse position.
+        """
+        key_mask, button_mask, tier, x, y = self.FRAME.unpack_from(
+            self.__frames, index * self.FRAME.size)
+        return key_mask, button_mask, tier, (x, y)
+
+    def add_keyframe(self, index, state):
+        """
+        Stores a snapshot of the game state taken before a frame.
+
+        :param index: Index of the frame the snapshot precedes.
+        :param state: Dictionary of the game state, without the terrain.
+        """
+        self.__keyframes[index] = state
+
+    def keyframe(self, index):
+        """
+        Returns the snapshot taken before a frame.
+
+        :param index: Index of the frame.
+        :return: Dictionary of the game state, without the terrain, or None
+            if there is no snapshot before the frame.
+        """
+        return self.__keyframes.get(index)
+
+    def last_keyframe(self, index):
+        """
+        Finds the last snapshot taken at or before a frame.
+
+        :param index: Index of the frame.
+        :return: Index of the frame the snapshot precedes, or None if there
+            is no snapshot up to the frame.
+        """
+        return max((keyframe for keyframe in self.__keyframes
+                    if keyframe <= index), default=None)
+
+    def save(self, file_name):
+        """
+        Writes the replay to a file.
+
+        :param file_name: Path of the replay file.
+        """
+        header = json.dumps({
+            "seed": self.__seed,
+            "player_name": self.__player_name,
+            "terrain": self.__terrain,
+            "start_state": self.__start_state,
+            "keyframes": {str(index): state for index, state in
+                          self.__keyframes.items()},
+        }).encode()
+        payload = self.HEADER_SIZE.pack(len(header)) + header + self.__frames
+        with open(file_name, "wb") as file:
+            file.write(self.MAGIC + bytes([self.VERSION]))
+            file.write(zlib.compress(payload))
+
+    @classmethod
+    def load(cls, file_name):
+        """
+        Reads a replay from a file.
+
+        :param file_name: Path of the replay file.
+        :return: The loaded replay.
+        """
+        with open(file_name, "rb") as file:
+            data = file.read()
+        if data[:len(cls.MAGIC)] != cls.MAGIC:
+            raise ValueError(f"{file_name} is not a replay file")
+        version = data[len(cls.MAGIC)]
+        if version != cls.VERSION:
+            raise ValueError(f"unsupported replay version {version}")
+
+        payload = zlib.decompress(data[len(cls.MAGIC) + 1:])
+        header_size = cls.HEADER_SIZE.unpack_from(payload)[0]
+        header_end = cls.HEADER_SIZE.size + header_size
+        header = json.loads(payload[cls.HEADER_SIZE.size:header_end])
+
+        instance = cls(header["seed"], header["player_name"],
+                       header["terrain"], header.get("start_state"))
+        instance.__frames = bytearray(payload[header_end:])
+        instance.__keyframes = {int(index): state for index, state in
+                                header["keyframes"].items()}
+        return instance
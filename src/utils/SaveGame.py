@@ -0,0 +1,340 @@
+import struct
+
+from config.AvailableTerrains import AvailableTerrains
+
+
+class SaveGame:
+    """
+    Compact binary format of the saved Play states.
+
+    Files start with a magic number and a version, followed by a header
+    (spawn timer, speed multiplier, score and run seed), the terrain, the
+    packed entity table and the state of the random streams. The terrain
+    is stored as the index of one of the available terrains, as its
+    matrix packed one bit per cell, or, for terrains restored from older
+    saves, as its blocks. Each entity is a row holding its type id and the
+    fields of its type, packed in a fixed order.
+
+    States are read and written as the dictionaries of Play.to_dict, so
+    loading a save restores the game through Play.from_dict.
+    """
+
+    MAGIC = b"AFSV"
+    VERSION = 1
+    # Spawn timer, speed multiplier, score and run seed
+    HEADER = struct.Struct("<ddqq")
+    COUNT = struct.Struct("<H")
+
+    TERRAIN_INDEX = 0
+    TERRAIN_GRID = 1
+    TERRAIN_BLOCKS = 2
+    GRID_SIZE = struct.Struct("<HH")
+    # Left, top, width and height
+    BLOCK = struct.Struct("<hhHH")
+
+    # Ids are positions in this tuple, so new types must be appended
+    ENTITY_TYPES = ("Cyborg", "Jones", "Rain", "LinearEnemy", "WavyEnemy",
+                    "TankEnemy", "BouncingEnemy")
+    NO_ENTITY = 255
+    PLAYER_FIELDS = (("centerx", "i"), ("bottom", "i"), ("health", "d"),
+                     ("is_jumping", "?"), ("y_speed", "d"),
+                     ("ready_ability", "?"),
+                     ("time_cooldown_ability", "d"))
+    ENEMY_FIELDS = (("centerx", "i"), ("bottom", "i"), ("health", "d"),
+                    ("speed", "d"))
+    # Text fields are stored as the index of their value among the choices
+    BOUNCING_STATES = ("moving", "falling", "waiting", "rising")
+    ENTITY_FIELDS = {
+        "Cyborg": PLAYER_FIELDS,
+        "Jones": PLAYER_FIELDS,
+        "Rain": PLAYER_FIELDS + (("charging_critical", "i"),
+                                 ("time_projectile_geration", "d")),
+        "LinearEnemy": ENEMY_FIELDS,
+        "WavyEnemy": ENEMY_FIELDS + (("timer", "d"), ("amplitude", "d"),
+                                     ("angular_frequency", "d")),
+        "TankEnemy": ENEMY_FIELDS,
+        "BouncingEnemy": ENEMY_FIELDS + (("velocity_x", "d"),
+                                         ("state", BOUNCING_STATES),
+                                         ("timer", "d"),
+                                         ("wait_timer", "d"),
+                                         ("fall_time", "d"),
+                                         ("original_y", "d")),
+    }
+    ENTITY_ROWS = {
+        name: struct.Struct("<" + "".join(
+            "B" if isinstance(kind, tuple) else kind for _, kind in fields))
+        for name, fields in ENTITY_FIELDS.items()}
+
+    # Version, Mersenne Twister state and cached Gaussian of a Python
+    # stream, then the 128-bit state and increment, the cached flag and
+    # the cached value of a NumPy PCG64 stream
+    PYTHON_STREAM = struct.Struct("<B625I?d")
+    NUMPY_STREAM = struct.Struct("<16s16s?I")
+
+    @classmethod
+    def save(cls, state, file_name):
+        """
+        Writes a Play state to a file.
+
+        :param state: Dictionary of the state, from Play.to_dict.
+        :param file_name: Path of the save file.
+        """
+        with open(file_name, "wb") as file:
+            file.write(cls.encode(state))
+
+    @classmethod
+    def load(cls, file_name):
+        """
+        Reads a Play state from a file.
+
+        :param file_name: Path of the save file.
+        :return: Dictionary of the state, for Play.from_dict.
+        """
+        with open(file_name, "rb") as file:
+            return cls.decode(file.read(), file_name)
+
+    @classmethod
+    def encode(cls, state):
+        """
+        Packs a Play state.
+
+        :param state: Dictionary of the state, from Play.to_dict.
+        :return: The bytes of the save.
+        """
+        random_state = state["random"]
+        data = bytearray(cls.MAGIC + bytes([cls.VERSION]))
+        data += cls.HEADER.pack(state["spawn_timer"],
+                                state["speed_multiplier"], state["score"],
+                                random_state["seed"])
+        data += cls.__encode_terrain(state["terrain"])
+
+        data += cls.__encode_entity(state["player"])
+        data += cls.COUNT.pack(len(state["enemies"]))
+        for enemy in state["enemies"]:
+            data += cls.__encode_entity(enemy)
+
+        data += cls.COUNT.pack(len(random_state["streams"]))
+        for name, (version, internal_state, gauss_next) in \
+                random_state["streams"].items():
+            data += cls.__encode_name(name)
+            data += cls.PYTHON_STREAM.pack(version, *internal_state,
+                                           gauss_next is not None,
+                                           gauss_next or 0.0)
+        data += cls.COUNT.pack(len(random_state["numpy_streams"]))
+        for name, stream in random_state["numpy_streams"].items():
+            if stream["bit_generator"] != "PCG64":
+                raise ValueError(f"unsupported random generator "
+                                 f"{stream['bit_generator']}")
+            data += cls.__encode_name(name)
+            data += cls.NUMPY_STREAM.pack(
+                stream["state"]["state"].to_bytes(16, "little"),
+                stream["state"]["inc"].to_bytes(16, "little"),
+                bool(stream["has_uint32"]), stream["uinteger"])
+        return bytes(data)
+
+    @classmethod
+    def decode(cls, data, file_name="save"):
+        """
+        Unpacks a Play state.
+
+        :param data: The bytes of the save.
+        :param file_name: Name of the save, for the error messages.
+        :return: Dictionary of the state, for Play.from_dict. Bytes that
+            are not a valid save raise a ValueError.
+        """
+        try:
+            return cls.__decode_state(data, file_name)
+        except (struct.error, IndexError, UnicodeDecodeError) as error:
+            raise ValueError(f"{file_name} is damaged: {error}") from error
+
+    @classmethod
+    def __decode_state(cls, data, file_name):
+        """
+        Unpacks a Play state, failing on the first field that does not fit
+        the bytes.
+
+        :param data: The bytes of the save.
+        :param file_name: Name of the save, for the error messages.
+        :return: Dictionary of the state.
+        """
+        if data[:len(cls.MAGIC)] != cls.MAGIC:
+            raise ValueError(f"{file_name} is not a save file")
+        version = data[len(cls.MAGIC)]
+        if version != cls.VERSION:
+            raise ValueError(f"unsupported save version {version}")
+
+        offset = len(cls.MAGIC) + 1
+        spawn_timer, speed_multiplier, score, seed = \
+            cls.HEADER.unpack_from(data, offset)
+        offset += cls.HEADER.size
+        terrain, offset = cls.__decode_terrain(data, offset)
+
+        player, offset = cls.__decode_entity(data, offset)
+        count, = cls.COUNT.unpack_from(data, offset)
+        offset += cls.COUNT.size
+        enemies = []
+        for _ in range(count):
+            enemy, offset = cls.__decode_entity(data, offset)
+            enemies.append(enemy)
+
+        streams = {}
+        count, = cls.COUNT.unpack_from(data, offset)
+        offset += cls.COUNT.size
+        for _ in range(count):
+            name, offset = cls.__decode_name(data, offset)
+            version, *internal_state, has_gauss, gauss_next = \
+                cls.PYTHON_STREAM.unpack_from(data, offset)
+            offset += cls.PYTHON_STREAM.size
+            streams[name] = [version, internal_state,
+                             gauss_next if has_gauss else None]
+        numpy_streams = {}
+        count, = cls.COUNT.unpack_from(data, offset)
+        offset += cls.COUNT.size
+        for _ in range(count):
+            name, offset = cls.__decode_name(data, offset)
+            state, increment, has_uint32, uinteger = \
+                cls.NUMPY_STREAM.unpack_from(data, offset)
+            offset += cls.NUMPY_STREAM.size
+            numpy_streams[name] = {
+                "bit_generator": "PCG64",
+                "state": {"state": int.from_bytes(state, "little"),
+                          "inc": int.from_bytes(increment, "little")},
+                "has_uint32": int(has_uint32),
+                "uinteger": uinteger,
+            }
+
+        return {
+            "spawn_timer": spawn_timer,
+            "speed_multiplier": speed_multiplier,
+            "terrain": terrain,
+            "player": player,
+            "enemies": enemies,
+            "random": {"seed": seed, "streams": streams,
+                       "numpy_streams": numpy_streams},
+            "score": score,
+        }
+
+    @classmethod
+    def __encode_terrain(cls, terrain):
+        """
+        Packs a terrain as its index, its matrix or its blocks.
+
+        :param terrain: Dictionary of the terrain, from Terrain.to_dict.
+        :return: The packed terrain.
+        """
+        grid = terrain.get("grid")
+        if grid is None:
+            blocks = terrain["blocks"]
+            return bytes([cls.TERRAIN_BLOCKS]) + cls.COUNT.pack(
+                len(blocks)) + b"".join(
+                cls.BLOCK.pack(*block["topleft"], block["width"],
+                               block["height"]) for block in blocks)
+        grid = list(grid)
+        for index, available in enumerate(AvailableTerrains().terrains):
+            if list(available) == grid:
+                return bytes([cls.TERRAIN_INDEX]) + cls.COUNT.pack(index)
+        cells = 0
+        for line in reversed(grid):
+            for cell in reversed(line):
+                cells = cells << 1 | (cell == "X")
+        rows, columns = len(grid), len(grid[0])
+        return (bytes([cls.TERRAIN_GRID]) +
+                cls.GRID_SIZE.pack(rows, columns) +
+                cells.to_bytes((rows * columns + 7) // 8, "little"))
+
+    @classmethod
+    def __decode_terrain(cls, data, offset):
+        """
+        Unpacks a terrain.
+
+        :param data: The bytes of the save.
+        :param offset: Position of the terrain in the bytes.
+        :return: The dictionary of the terrain and the position after it.
+        """
+        kind = data[offset]
+        offset += 1
+        if kind == cls.TERRAIN_INDEX:
+            index, = cls.COUNT.unpack_from(data, offset)
+            grid = AvailableTerrains().terrains[index]
+            return {"grid": list(grid)}, offset + cls.COUNT.size
+        if kind == cls.TERRAIN_GRID:
+            rows, columns = cls.GRID_SIZE.unpack_from(data, offset)
+            offset += cls.GRID_SIZE.size
+            size = (rows * columns + 7) // 8
+            cells = int.from_bytes(data[offset:offset + size], "little")
+            grid = ["".join("X" if cells >> (row * columns + column) & 1
+                            else " " for column in range(columns))
+                    for row in range(rows)]
+            return {"grid": grid}, offset + size
+        count, = cls.COUNT.unpack_from(data, offset)
+        offset += cls.COUNT.size
+        blocks = []
+        for _ in range(count):
+            left, top, width, height = cls.BLOCK.unpack_from(data, offset)
+            offset += cls.BLOCK.size
+            blocks.append({"topleft": [left, top], "width": width,
+                           "height": height})
+        return {"blocks": blocks}, offset
+
+    @classmethod
+    def __encode_entity(cls, entity):
+        """
+        Packs an entity as a row of the entity table.
+
+        :param entity: Dictionary of the entity, or None.
+        :return: The packed row.
+        """
+        if entity is None:
+            return bytes([cls.NO_ENTITY])
+        name = entity["type"]
+        values = [kind.index(entity[field]) if isinstance(kind, tuple)
+                  else entity[field]
+                  for field, kind in cls.ENTITY_FIELDS[name]]
+        return bytes([cls.ENTITY_TYPES.index(name)]) + \
+            cls.ENTITY_ROWS[name].pack(*values)
+
+    @classmethod
+    def __decode_entity(cls, data, offset):
+        """
+        Unpacks a row of the entity table.
+
+        :param data: The bytes of the save.
+        :param offset: Position of the row in the bytes.
+        :return: The dictionary of the entity, or None, and the position
+            after the row.
+        """
+        type_id = data[offset]
+        offset += 1
+        if type_id == cls.NO_ENTITY:
+            return None, offset
+        name = cls.ENTITY_TYPES[type_id]
+        row = cls.ENTITY_ROWS[name]
+        entity = {"type": name}
+        for (field, kind), value in zip(cls.ENTITY_FIELDS[name],
+                                        row.unpack_from(data, offset)):
+            entity[field] = kind[value] if isinstance(kind, tuple) else value
+        return entity, offset + row.size
+
+    @staticmethod
+    def __encode_name(name):
+        """
+        Packs a stream name.
+
+        :param name: The name.
+        :return: Its length followed by its UTF-8 bytes.
+        """
+        encoded = name.encode()
+        return bytes([len(encoded)]) + encoded
+
+    @staticmethod
+    def __decode_name(data, offset):
+        """
+        Unpacks a stream name.
+
+        :param data: The bytes of the save.
+        :param offset: Position of the name in the bytes.
+        :return: The name and the position after it.
+        """
+        size = data[offset]
+        offset += 1
+        return data[offset:offset + size].decode(), offset + size
@@ -0,0 +1,117 @@
+import base64
+import zlib
+
+import numpy as np
+import pygame
+
+
+class SnapshotCodec:
+    """
+    Converts the objects referenced by a snapshot of the game into JSON
+    values and back. Surfaces are stored once in a table of pixels, and
+    other objects, such as the enemies driving their entities, are stored
+    as their position in a list the snapshot keeps on its own.
+    """
+
+    def __init__(self, objects=(), surfaces=None):
+        """
+        Initializes a codec.
+
+        :param objects: Objects referred to by their index.
+        :param surfaces: Table of surfaces created by to_dict (optional).
+            By default the table starts empty.
+        """
+        self.__objects = list(objects)
+        self.__object_index = {id(value): index
+                               for index, value in enumerate(self.__objects)}
+        surfaces = surfaces or {"pixels": [], "surfaces": []}
+        self.__pixels = surfaces["pixels"]
+        self.__surfaces = surfaces["surfaces"]
+        self.__pixel_index = {}
+        # Keeps the encoded surfaces alive so that their ids stay unique
+        self.__surface_index = {}
+        self.__decoded = {}
+
+    def encode(self, value):
+        """
+        Converts a value into a JSON value.
+
+        :param value: The value.
+        :return: The JSON value.
+        """
+        if isinstance(value, pygame.Surface):
+            return {"surface": self.__encode_surface(value)}
+        if id(value) in self.__object_index:
+            return {"object": self.__object_index[id(value)]}
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, (list, tuple, np.ndarray, pygame.Vector2)):
+            return [self.encode(item) for item in value]
+        return value
+
+    def decode(self, value):
+        """
+        Converts a JSON value created by encode back into a value.
+
+        :param value: The JSON value.
+        :return: The value.
+        """
+        if isinstance(value, dict):
+            if "surface" in value:
+                return self.__decode_surface(value["surface"])
+            return self.__objects[value["object"]]
+        if isinstance(value, list):
+            return [self.decode(item) for item in value]
+        return value
+
+    def to_dict(self):
+        """
+        Converts the table of the encoded surfaces into a dictionary.
+
+        :return: A dictionary with the pixels and the surfaces using them.
+        """
+        return {"pixels": self.__pixels, "surfaces": self.__surfaces}
+
+    def __encode_surface(self, surface):
+        """
+        Adds a surface to the table, storing its pixels only once.
+
+        :param surface: The surface.
+        :return: Index of the surface in the table.
+        """
+        entry = self.__surface_index.get(id(surface))
+        if entry is not None:
+            return entry[0]
+        size = surface.get_size()
+        data = pygame.image.tobytes(surface, "RGBA")
+        pixels = self.__pixel_index.get((size, data))
+        if pixels is None:
+            pixels = len(self.__pixels)
+            self.__pixel_index[(size, data)] = pixels
+            self.__pixels.append([size[0], size[1], base64.b64encode(
+                zlib.compress(data)).decode("ascii")])
+        index = len(self.__surfaces)
+        self.__surfaces.append([pixels, surface.get_alpha()])
+        self.__surface_index[id(surface)] = (index, surface)
+        return index
+
+    def __decode_surface(self, index):
+        """
+        Creates the surface stored in the table, once for every index.
+
+        :param index: Index of the surface in the table.
+        :return: The surface.
+        """
+        surface = self.__decoded.get(index)
+        if surface is not None:
+            return surface
+        pixels, alpha = self.__surfaces[index]
+        width, height, data = self.__pixels[pixels]
+        surface = pygame.image.frombytes(
+            zlib.decompress(base64.b64decode(data)), (width, height), "RGBA")
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        if alpha is not None:
+            surface.set_alpha(alpha)
+        self.__decoded[index] = surface
+        return surface
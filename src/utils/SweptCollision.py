@@ -0,0 +1,88 @@
+import numpy as np
+
+from config.Constants import Constants
+
+
+class SweptCollision:
+    """
+    Continuous collision helpers for objects that may move farther than
+    the size of what they can hit in a single iteration.
+    """
+
+    @staticmethod
+    def segment_rect(start, end, rect):
+        """
+        Finds where a segment first enters a rect (slab method).
+
+        :param start: Segment start point.
+        :param end: Segment end point.
+        :param rect: Rect to be tested.
+        :return: Fraction of the segment (0 to 1) at the entry point, or
+            None if the segment misses the rect.
+        """
+        t_enter = 0.0
+        t_exit = 1.0
+        for origin, delta, low, high in (
+                (start[0], end[0] - start[0], rect.left, rect.right),
+                (start[1], end[1] - start[1], rect.top, rect.bottom)):
+            if abs(delta) < Constants.EPSILON:
+                if origin < low or origin >= high:
+                    return None
+                continue
+            t_low = (low - origin) / delta
+            t_high = (high - origin) / delta
+            if t_low > t_high:
+                t_low, t_high = t_high, t_low
+            t_enter = max(t_enter, t_low)
+            t_exit = min(t_exit, t_high)
+            if t_enter > t_exit:
+                return None
+        return t_enter
+
+    @staticmethod
+    def swept_rect(start, end, moving_rect, rect):
+        """
+        Checks whether a rect moving from start to end touches another rect
+        at any point of its path.
+
+        :param start: Center of the moving rect at the start of the path.
+        :param end: Center of the moving rect at the end of the path.
+        :param moving_rect: Rect being moved (only its size is used).
+        :param rect: Static rect to be tested.
+        :return: Fraction of the path at the first contact, or None.
+        """
+        expanded = rect.inflate(moving_rect.width, moving_rect.height)
+        return SweptCollision.segment_rect(start, end, expanded)
+
+    @staticmethod
+    def swept_rects(starts, ends, sizes, rects):
+        """
+        Tests many moving rects against many static rects at once, with the
+        same rules as swept_rect.
+
+        :param starts: Array (N, 2) of centers at the start of the paths.
+        :param ends: Array (N, 2) of centers at the end of the paths.
+        :param sizes: Array (N, 2) of sizes of the moving rects.
+        :param rects: Array (M, 4) of left, top, width and height of the
+            static rects.
+        :return: Array (N, M) of the fractions of the paths at the first
+            contact with each rect, inf where a path misses a rect.
+        """
+        starts = starts[:, None, :]
+        deltas = ends[:, None, :] - starts
+        sizes = sizes[:, None, :]
+        lows = rects[None, :, :2] - sizes // 2
+        highs = lows + rects[None, :, 2:] + sizes
+
+        flat = np.abs(deltas) < Constants.EPSILON
+        safe_deltas = np.where(flat, 1.0, deltas)
+        t_first = (lows - starts) / safe_deltas
+        t_second = (highs - starts) / safe_deltas
+        t_low = np.where(flat, -np.inf, np.minimum(t_first, t_second))
+        t_high = np.where(flat, np.inf, np.maximum(t_first, t_second))
+        outside = flat & ((starts < lows) | (starts >= highs))
+
+        t_enter = np.maximum(t_low.max(axis=2), 0.0)
+        t_exit = np.minimum(t_high.min(axis=2), 1.0)
+        hit = (t_enter <= t_exit) & ~outside.any(axis=2)
+        return np.where(hit, t_enter, np.inf)
@@ -0,0 +1,138 @@
+import json
+import os
+import zlib
+
+import pygame
+
+from config.Constants import Constants
+from src.utils.AssetLoader import AssetLoader
+
+
+class TextureAtlas:
+    """
+    Provides the frames of the sprites, facing right or mirrored.
+    When the atlas was built (see tools.build_atlas), its few pages are
+    decoded once and every frame is a subsurface of a page, so sprites
+    share the page pixels and drawing one blits an area of the page.
+    Sprites missing from the atlas are loaded, split and mirrored on
+    their first request.
+
+    This class implements the Singleton design pattern so that every
+    entity shares the same pages and frames.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(TextureAtlas, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr(self, "_initialized") and self._initialized:
+            return
+        self._initialized = True
+        self.__directory = None
+        self.__index = {}
+        self.__pages = None
+        self.__frames = {}
+        self.open(Constants.BAKED_ASSETS_DIRECTORY)
+
+    def open(self, directory):
+        """
+        Reads the index of the atlas built into a directory, dropping the
+        frames handed out so far. Without a directory, or without an atlas
+        in it, every sprite is loaded on its own.
+
+        :param directory: Directory of the atlas, or None.
+        """
+        self.__directory = directory
+        self.__index = {}
+        self.__pages = None
+        self.__frames = {}
+        if directory is None:
+            return
+        try:
+            with open(os.path.join(directory,
+                                   Constants.ATLAS_INDEX_FILE)) as file:
+                self.__index = json.load(file)
+        except (IOError, OSError, ValueError):
+            pass
+
+    def frames(self, path, size, count=1, flipped=False):
+        """
+        Returns the frames of a sprite laid side by side in its image.
+
+        :param path: Path of the source image.
+        :param size: Size the whole image is scaled to.
+        :param count: Number of frames in the image.
+        :param flipped: Whether the frames are mirrored horizontally.
+        :return: List of surfaces, one per frame.
+        """
+        key = (AssetLoader.image_key(path, size), flipped)
+        frames = self.__frames.get(key)
+        if frames is None:
+            sprite = self.__index.get("sprites", {}).get(key[0])
+            if sprite is not None and (sprite["flipped"] or not flipped):
+                frames = self.__regions(
+                    sprite["flipped" if flipped else "frames"])
+            if frames is None:
+                frames = self.__split(path, size, count, flipped)
+            self.__frames[key] = frames
+        return frames
+
+    def image(self, path, size, flipped=False):
+        """
+        Returns a single-frame sprite.
+
+        :param path: Path of the source image.
+        :param size: Size the image is scaled to.
+        :param flipped: Whether the image is mirrored horizontally.
+        :return: The surface.
+        """
+        return self.frames(path, size, 1, flipped)[0]
+
+    def __regions(self, regions):
+        """
+        Cuts frames out of the atlas pages, decoding the pages the first
+        time.
+
+        :param regions: List of [page, x, y, width, height] regions.
+        :return: List of subsurfaces, or None if the pages cannot be read.
+        """
+        try:
+            if self.__pages is None:
+                pack_path = os.path.join(self.__directory,
+                                         Constants.ATLAS_PAGES_FILE)
+                self.__pages = [
+                    AssetLoader.read_pack(pack_path, page).convert_alpha()
+                    for page in self.__index["pages"]]
+            return [self.__pages[page].subsurface(rect)
+                    for page, *rect in regions]
+        except (IOError, OSError, ValueError, zlib.error):
+            # The pages are missing or do not match the index, so every
+            # sprite is loaded on its own from now on
+            self.__index = {}
+            self.__pages = None
+            return None
+
+    @staticmethod
+    def __split(path, size, count, flipped):
+        """
+        Loads a sprite on its own and splits it into frames.
+
+        :param path: Path of the source image.
+        :param size: Size the whole image is scaled to.
+        :param count: Number of frames in the image.
+        :param flipped: Whether the frames are mirrored horizontally.
+        :return: List of surfaces.
+        """
+        image = AssetLoader().load_image(path, size)
+        width = image.get_width() // count
+        frames = [image.subsurface((index * width, 0, width,
+                                    image.get_height())).copy()
+                  for index in range(count)]
+        if flipped:
+            frames = [pygame.transform.flip(frame, True, False)
+                      for frame in frames]
+        return frames
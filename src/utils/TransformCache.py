@@ -0,0 +1,98 @@
+from collections import OrderedDict
+
+import pygame
+
+from config.Constants import Constants
+
+
+class TransformCache:
+    """
+    Caches rotated and faded variants of sprite images, so that entities
+    sharing an image can each have their own angle and transparency
+    without copying a surface every frame.
+
+    This class implements the Singleton design pattern so that every
+    entity shares the same cache.
+    """
+
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super(TransformCache, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr(self, "_initialized") and self._initialized:
+            return
+        self._initialized = True
+        self.__variants = OrderedDict()
+        self.__max_size = Constants.TRANSFORM_CACHE_SIZE
+        self.__angle_step = Constants.TRANSFORM_ANGLE_STEP
+        self.__alpha_step = 256 / Constants.TRANSFORM_ALPHA_LEVELS
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, image, angle=0, alpha=255):
+        """
+        Returns the variant of an image for the given angle and alpha,
+        rendering it only the first time it is requested.
+
+        :param image: The source image.
+        :param angle: Rotation angle in degrees.
+        :param alpha: Transparency from 0 (invisible) to 255 (opaque).
+        :return: The transformed surface.
+        """
+        key = (image, self.__angle_bucket(angle), self.__alpha_bucket(alpha))
+        variant = self.__variants.get(key)
+        if variant is not None:
+            self.__variants.move_to_end(key)
+            self.hits += 1
+            return variant
+
+        self.misses += 1
+        angle_bucket, alpha_bucket = key[1], key[2]
+        opaque = alpha_bucket == Constants.TRANSFORM_ALPHA_LEVELS - 1
+        if angle_bucket:
+            variant = pygame.transform.rotate(image,
+                                              angle_bucket * self.__angle_step)
+        elif opaque:
+            variant = image
+        else:
+            variant = image.copy()
+        if not opaque:
+            variant.set_alpha(int(alpha_bucket * self.__alpha_step))
+
+        self.__variants[key] = variant
+        if len(self.__variants) > self.__max_size:
+            self.__variants.popitem(last=False)
+        return variant
+
+    def __angle_bucket(self, angle):
+        """
+        Quantizes an angle to the cache resolution.
+
+        :param angle: Angle in degrees.
+        :return: Index of the angle bucket.
+        """
+        steps = round(float(angle) / self.__angle_step)
+        return steps % round(360 / self.__angle_step)
+
+    def __alpha_bucket(self, alpha):
+        """
+        Quantizes an alpha value to the cache resolution.
+
+        :param alpha: Alpha value from 0 to 255.
+        :return: Index of the alpha bucket.
+        """
+        alpha = min(max(int(alpha), 0), 255)
+        return int(alpha // self.__alpha_step)
+
+    def clear(self):
+        """
+        Removes every cached variant.
+        """
+        self.__variants.clear()
+
+    def __len__(self):
+        return len(self.__variants)
@@ -0,0 +1,83 @@
+import itertools
+
+import pygame
+
+
+class VoiceManager:
+    """
+    Plays sounds on pools of mixer channels reserved for each voice
+    category, so frequent sounds cannot take the channels of rarer, more
+    important ones. When every channel of a pool is busy, the new sound
+    steals the channel of the lowest priority voice playing there (the
+    oldest one among equals), or is dropped if all of them matter more.
+    Identical sounds requested in the same frame are merged into one
+    voice.
+    """
+
+    def __init__(self, pools):
+        """
+        Reserves the mixer channels of the voice pools.
+
+        :param pools: Dictionary mapping voice categories to their number
+            of channels.
+        """
+        total = sum(pools.values())
+        pygame.mixer.set_num_channels(total)
+        # Channels are only picked here, never by Sound.play
+        pygame.mixer.set_reserved(total)
+        self.__channels = [pygame.mixer.Channel(index)
+                           for index in range(total)]
+        self.__pools = {}
+        start = 0
+        for category, size in pools.items():
+            self.__pools[category] = range(start, start + size)
+            start += size
+        self.__voices = [(0, 0)] * total
+        self.__order = itertools.count(1)
+        self.__frame_sounds = set()
+        self.__counters = dict.fromkeys(
+            ("played", "merged", "stolen", "dropped"), 0)
+
+    @property
+    def counters(self):
+        """
+        Returns how many voices were played, merged into an identical
+        voice of the same frame, stolen by a more important voice and
+        dropped for lack of a channel.
+
+        :return: Dictionary mapping counter names to counts.
+        """
+        return dict(self.__counters)
+
+    def new_frame(self):
+        """
+        Starts a new frame; sounds played from now on are no longer merged
+        with the ones of the previous frame.
+        """
+        self.__frame_sounds.clear()
+
+    def play(self, name, sound, category, priority):
+        """
+        Plays a sound on a channel of its category.
+
+        :param name: Name of the sound.
+        :param sound: The pygame Sound.
+        :param category: Voice category of the sound (see Voices).
+        :param priority: Priority of the sound; higher values win.
+        """
+        if name in self.__frame_sounds:
+            self.__counters["merged"] += 1
+            return
+        pool = self.__pools[category]
+        index = next((index for index in pool
+                      if not self.__channels[index].get_busy()), None)
+        if index is None:
+            index = min(pool, key=self.__voices.__getitem__)
+            if self.__voices[index][0] > priority:
+                self.__counters["dropped"] += 1
+                return
+            self.__counters["stolen"] += 1
+        self.__channels[index].play(sound)
+        self.__voices[index] = (priority, next(self.__order))
+        self.__frame_sounds.add(name)
+        self.__counters["played"] += 1
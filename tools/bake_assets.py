@@ -0,0 +1,138 @@
+"""
+Bakes the assets of the game into display-ready files.
+
+Every image of the AssetManifest is decoded, scaled to the size the game
+uses and stored as zlib-compressed raw pixels in a single pack, so that
+loading it skips both the PNG decode and the scale. The sprites are
+packed into the texture atlas (see tools.build_atlas). Every sound effect is
+converted to the sample format the mixer runs at and written as a WAV,
+so that loading it skips the conversion. The game loads the baked assets
+when present (see AssetLoader) and falls back to the sources otherwise.
+
+Usage:
+    python -m tools.bake_assets [--output DIRECTORY] [--level LEVEL]
+"""
+import argparse
+import json
+import os
+import wave
+import zlib
+
+import pygame
+
+from config.AssetManifest import AssetManifest
+from config.Constants import Constants
+
+
+def write_pack(file_name, images, level):
+    """
+    Writes images to a pack of zlib-compressed raw pixels.
+
+    :param file_name: Path of the pack.
+    :param images: List of (surface, alpha) pairs.
+    :param level: zlib compression level.
+    :return: List of index entries, one per image.
+    """
+    entries = []
+    offset = 0
+    with open(file_name, "wb") as pack:
+        for image, alpha in images:
+            pixels = zlib.compress(
+                pygame.image.tobytes(image, "RGBA" if alpha else "RGB"),
+                level)
+            pack.write(pixels)
+            entries.append({
+                "offset": offset,
+                "length": len(pixels),
+                "size": list(image.get_size()),
+                "alpha": alpha,
+            })
+            offset += len(pixels)
+    return entries
+
+
+def bake_images(directory, level):
+    """
+    Writes the images of the manifest to the pack.
+
+    :param directory: Output directory.
+    :param level: zlib compression level.
+    :return: Index of the pack, mapping image keys to their entries.
+    """
+    from src.utils.AssetLoader import AssetLoader
+    entries = write_pack(
+        os.path.join(directory, Constants.BAKED_IMAGES_FILE),
+        [(AssetLoader.decode_source(path, size), alpha)
+         for path, size, alpha in AssetManifest.IMAGES], level)
+    return {AssetLoader.image_key(path, size): entry
+            for (path, size, _), entry in zip(AssetManifest.IMAGES, entries)}
+
+
+def bake_sounds(directory):
+    """
+    Converts the sound effects to the mixer's sample format.
+
+    :param directory: Output directory.
+    :return: Dictionary mapping source paths to baked files, relative to
+        the output directory.
+    """
+    from src.utils.AudioManager import AudioManager
+    frequency, size, channels = pygame.mixer.get_init()
+    if size not in (8, -16):
+        raise SystemExit(f"Unsupported mixer sample format: {size}")
+    os.makedirs(os.path.join(directory, "sounds"), exist_ok=True)
+    sounds = {}
+    for path in AudioManager().sound_files.values():
+        baked = os.path.join("sounds", os.path.basename(path))
+        with wave.open(os.path.join(directory, baked), "wb") as file:
+            file.setnchannels(channels)
+            file.setsampwidth(abs(size) // 8)
+            file.setframerate(frequency)
+            file.writeframes(pygame.mixer.Sound(path).get_raw())
+        sounds[path] = baked
+    return sounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.
+                                     RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default=Constants.BAKED_ASSETS_DIRECTORY,
+                        help="directory the baked assets are written to")
+    parser.add_argument("--level", type=int, default=6,
+                        help="zlib compression level of the images")
+    args = parser.parse_args()
+
+    from tools.build_atlas import build_atlas
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    pygame.mixer.init()
+    os.makedirs(args.output, exist_ok=True)
+
+    index = {
+        "images": bake_images(args.output, args.level),
+        "sounds": bake_sounds(args.output),
+        "mixer": list(pygame.mixer.get_init()),
+    }
+    with open(os.path.join(args.output, Constants.BAKED_INDEX_FILE),
+              "w") as file:
+        json.dump(index, file, indent=4)
+    atlas = build_atlas(args.output, args.level)
+
+    sources = sum(os.path.getsize(path)
+                  for path in {path for path, _, _ in AssetManifest.IMAGES})
+    baked = os.path.getsize(os.path.join(args.output,
+                                         Constants.BAKED_IMAGES_FILE))
+    print(f"{len(index['images'])} images: {sources / 2 ** 20:.2f} MiB of "
+          f"sources baked into {baked / 2 ** 20:.2f} MiB")
+    print(f"{len(atlas['sprites'])} sprites packed into "
+          f"{len(atlas['pages'])} atlas pages")
+    print(f"{len(index['sounds'])} sounds converted to "
+          f"{index['mixer'][0]} Hz, {abs(index['mixer'][1])} bit, "
+          f"{index['mixer'][2]} channels")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
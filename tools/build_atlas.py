@@ -0,0 +1,148 @@
+"""
+Builds the texture atlas of the sprites.
+
+Every sprite of the AssetManifest is decoded, scaled to the size the game
+uses and split into its frames; sprites that face both ways also get
+mirrored frames. The frames are packed into a few large pages, written
+as zlib-compressed raw pixels, with a JSON index of the region of each
+frame. The game cuts its sprites out of the pages when the atlas is
+present (see TextureAtlas). tools.bake_assets builds the atlas as well.
+
+Usage:
+    python -m tools.build_atlas [--output DIRECTORY] [--level LEVEL]
+"""
+import argparse
+import json
+import os
+
+import pygame
+
+from config.AssetManifest import AssetManifest
+from config.Constants import Constants
+from tools.bake_assets import write_pack
+
+
+def sprite_frames(path, size, count, flipped):
+    """
+    Decodes a sprite and splits it into frames.
+
+    :param path: Path of the source image.
+    :param size: Size the whole image is scaled to.
+    :param count: Number of frames laid side by side in the image.
+    :param flipped: Whether the frames are mirrored horizontally.
+    :return: List of surfaces.
+    """
+    from src.utils.AssetLoader import AssetLoader
+    image = AssetLoader.decode_source(path, size)
+    width = image.get_width() // count
+    frames = [image.subsurface((index * width, 0, width,
+                                image.get_height()))
+              for index in range(count)]
+    if flipped:
+        frames = [pygame.transform.flip(frame, True, False)
+                  for frame in frames]
+    return frames
+
+
+def pack_shelves(sizes, page_size, padding):
+    """
+    Places rectangles on pages, filling each page in rows (shelves) of
+    the tallest rectangles first.
+
+    :param sizes: List of (width, height) of the rectangles.
+    :param page_size: Width and height of a page.
+    :param padding: Space left around each rectangle.
+    :return: List of (page, x, y), in the order of the sizes, and the
+        number of pages.
+    """
+    placements = [None] * len(sizes)
+    page, x, y, shelf_height = 0, padding, padding, 0
+    for index in sorted(range(len(sizes)), key=lambda i: -sizes[i][1]):
+        width, height = sizes[index]
+        if (width + 2 * padding > page_size or
+                height + 2 * padding > page_size):
+            raise ValueError(f"A {width}x{height} frame does not fit in a "
+                             f"{page_size}x{page_size} atlas page")
+        if x + width + padding > page_size:
+            x, y = padding, y + shelf_height + padding
+            shelf_height = 0
+        if y + height + padding > page_size:
+            page, x, y, shelf_height = page + 1, padding, padding, 0
+        placements[index] = (page, x, y)
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+    return placements, page + 1
+
+
+def build_atlas(directory, level, page_size=Constants.ATLAS_PAGE_SIZE,
+                padding=Constants.ATLAS_PADDING):
+    """
+    Packs the sprites of the manifest into atlas pages.
+
+    :param directory: Output directory.
+    :param level: zlib compression level.
+    :param page_size: Width and height of a page.
+    :param padding: Space left around each frame.
+    :return: The index of the atlas.
+    """
+    from src.utils.AssetLoader import AssetLoader
+    frames = []
+    owners = []
+    for path, size, count, flipped in AssetManifest.SPRITES:
+        key = AssetLoader.image_key(path, size)
+        for variant in (False, True) if flipped else (False,):
+            for frame in sprite_frames(path, size, count, variant):
+                frames.append(frame)
+                owners.append((key, "flipped" if variant else "frames"))
+
+    placements, page_count = pack_shelves(
+        [frame.get_size() for frame in frames], page_size, padding)
+    pages = [pygame.Surface((page_size, page_size), pygame.SRCALPHA)
+             for _ in range(page_count)]
+    sprites = {}
+    for frame, (key, variant), (page, x, y) in zip(frames, owners,
+                                                   placements):
+        # Adding onto the transparent page copies the pixels unblended
+        pages[page].blit(frame, (x, y), special_flags=pygame.BLEND_RGBA_ADD)
+        sprite = sprites.setdefault(key, {"frames": [], "flipped": []})
+        sprite[variant].append([page, x, y, *frame.get_size()])
+
+    index = {
+        "pages": write_pack(
+            os.path.join(directory, Constants.ATLAS_PAGES_FILE),
+            [(page, True) for page in pages], level),
+        "sprites": sprites,
+    }
+    with open(os.path.join(directory, Constants.ATLAS_INDEX_FILE),
+              "w") as file:
+        json.dump(index, file, indent=4)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.
+                                     RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default=Constants.BAKED_ASSETS_DIRECTORY,
+                        help="directory the atlas is written to")
+    parser.add_argument("--level", type=int, default=6,
+                        help="zlib compression level of the pages")
+    parser.add_argument("--page-size", type=int,
+                        default=Constants.ATLAS_PAGE_SIZE,
+                        help="width and height of a page")
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    os.makedirs(args.output, exist_ok=True)
+    index = build_atlas(args.output, args.level, args.page_size)
+    frames = sum(len(sprite["frames"]) + len(sprite["flipped"])
+                 for sprite in index["sprites"].values())
+    print(f"{len(index['sprites'])} sprites, {frames} frames packed into "
+          f"{len(index['pages'])} pages of {args.page_size}x"
+          f"{args.page_size}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()